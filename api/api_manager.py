@@ -1,6 +1,7 @@
 from api.auth_api import AuthAPI
 from api.movies_api import MoviesAPI
 from api.user_api import UserAPI
+from custom_requester.connection_pool import shared_connection_pool
 
 
 class ApiManager:
@@ -8,16 +9,36 @@ class ApiManager:
     Класс для управления API-классами с единой HTTP-сессией.
     """
 
-    def __init__(self, session, base_url):
+    def __init__(
+        self, session, base_url, cache=None, retry_policy=None,
+        token_cache=None
+    ):
         """
         Инициализация ApiManager.
         :param session: HTTP-сессия, используемая всеми API-классами.
+            Если None, сессия создается поверх общего пула соединений.
         :param base_url: URL, используемый всеми API-классами.
+        :param cache: Кэш ответов GET-запросов MoviesAPI (опционально).
+        :param retry_policy: Политика повторов запросов (опционально).
+        :param token_cache: Кэш токенов для AuthAPI.authenticate (опционально).
         """
+        if session is None:
+            session = shared_connection_pool.new_session()
         self.session = session
-        self.auth_api = AuthAPI(session)
-        self.user_api = UserAPI(session, base_url)
-        self.movie_api = MoviesAPI(session, base_url)
+        # Токен пользователя хранится здесь, а не в заголовках сессии
+        self.auth_headers = {}
+        self.auth_api = AuthAPI(
+            session, auth_headers=self.auth_headers, retry_policy=retry_policy,
+            token_cache=token_cache
+        )
+        self.user_api = UserAPI(
+            session, base_url, auth_headers=self.auth_headers,
+            retry_policy=retry_policy
+        )
+        self.movie_api = MoviesAPI(
+            session, base_url, auth_headers=self.auth_headers, cache=cache,
+            retry_policy=retry_policy
+        )
 
     def close_session(self):
         self.session.close()
@@ -0,0 +1,39 @@
+from api.async_auth_api import AsyncAuthAPI
+from api.async_movies_api import AsyncMoviesAPI
+from api.async_user_api import AsyncUserAPI
+from constants import DEFAULT_CONCURRENCY
+from custom_requester.async_custom_requester import gather_with_concurrency
+
+
+class AsyncApiManager:
+    """
+    Класс для управления асинхронными API-классами с единым httpx.AsyncClient.
+    """
+
+    def __init__(self, session, base_url):
+        """
+        Инициализация AsyncApiManager.
+        :param session: httpx.AsyncClient, используемый всеми API-классами.
+        :param base_url: URL, используемый всеми API-классами.
+        """
+        self.session = session
+        # Токен пользователя хранится здесь, а не в заголовках клиента
+        self.auth_headers = {}
+        self.auth_api = AsyncAuthAPI(session, auth_headers=self.auth_headers)
+        self.user_api = AsyncUserAPI(
+            session, base_url, auth_headers=self.auth_headers
+        )
+        self.movie_api = AsyncMoviesAPI(
+            session, base_url, auth_headers=self.auth_headers
+        )
+
+    async def gather(self, aws, concurrency=DEFAULT_CONCURRENCY):
+        """
+        Конкурентное выполнение запросов с ограничением параллелизма.
+        :param aws: Итерируемый объект корутин (например, вызовов API-методов).
+        :param concurrency: Максимальное число одновременных запросов.
+        """
+        return await gather_with_concurrency(aws, concurrency=concurrency)
+
+    async def close_session(self):
+        await self.session.aclose()
@@ -0,0 +1,53 @@
+from constants import BASE_URL_AUTH, LOGIN_ENDPOINT, REGISTER_ENDPOINT
+from custom_requester.async_custom_requester import AsyncCustomRequester
+
+
+class AsyncAuthAPI(AsyncCustomRequester):
+    """
+    Асинхронный класс для работы с API авторизации.
+    """
+
+    def __init__(self, session, auth_headers=None):
+        super().__init__(
+            session=session, base_url=BASE_URL_AUTH, auth_headers=auth_headers
+        )
+
+    async def register_user(self, user_data, expected_status=201):
+        """
+        Регистрация нового пользователя.
+        :param user_data: Данные пользователя.
+        :param expected_status: Ожидаемый статус-код.
+        """
+        return await self.send_request(
+            method="POST",
+            endpoint=REGISTER_ENDPOINT,
+            data=user_data,
+            expected_status=expected_status
+        )
+
+    async def login_user(self, login_data, expected_status=201):
+        """
+        Авторизация пользователя.
+        :param login_data: Данные для логина.
+        :param expected_status: Ожидаемый статус-код.
+        """
+        return await self.send_request(
+            method="POST",
+            endpoint=LOGIN_ENDPOINT,
+            data=login_data,
+            expected_status=expected_status
+        )
+
+    async def authenticate(self, user_creds):
+        login_data = {
+            "email": user_creds[0],
+            "password": user_creds[1]
+        }
+
+        response = (await self.login_user(login_data)).json()
+        if "accessToken" not in response:
+            raise KeyError("token is missing")
+
+        token = response["accessToken"]
+        self._set_auth_token(token)
+        return response
@@ -0,0 +1,50 @@
+from constants import USER_BASE_URL
+from custom_requester.async_custom_requester import AsyncCustomRequester
+
+
+class AsyncUserAPI(AsyncCustomRequester):
+    """
+    Асинхронный класс для работы с API пользователей.
+    """
+
+    def __init__(self, session, base_url, auth_headers=None):
+        super().__init__(
+            session=session, base_url=USER_BASE_URL, auth_headers=auth_headers
+        )
+
+    async def get_user(self, user_locator, expected_status=200):
+        """
+        Получение информации о пользователе.
+        :param user_locator: может быть id, может быть email пользователя.
+        :param expected_status: Ожидаемый статус-код.
+        """
+        return await self.send_request(
+            method="GET",
+            endpoint=f"user/{user_locator}",
+            expected_status=expected_status
+        )
+
+    async def create_user(self, user_data, expected_status=201):
+        """
+        Создание пользователя.
+        :param user_data: Данные о пользователе.
+        :param expected_status: Ожидаемый статус-код.
+        """
+        return await self.send_request(
+            method="POST",
+            endpoint="user",
+            data=user_data,
+            expected_status=expected_status
+        )
+
+    async def delete_user(self, user_id, expected_status=204):
+        """
+        Удаление пользователя.
+        :param user_id: ID пользователя.
+        :param expected_status: Ожидаемый статус-код.
+        """
+        return await self.send_request(
+            method="DELETE",
+            endpoint=f"/user/{user_id}",
+            expected_status=expected_status
+        )
@@ -3,8 +3,14 @@ from custom_requester.custom_requester import CustomRequester
 
 
 class AuthAPI(CustomRequester):
-    def __init__(self, session):
-        super().__init__(session=session, base_url=BASE_URL_AUTH)
+    def __init__(
+        self, session, auth_headers=None, retry_policy=None, token_cache=None
+    ):
+        super().__init__(
+            session=session, base_url=BASE_URL_AUTH, auth_headers=auth_headers,
+            retry_policy=retry_policy
+        )
+        self.token_cache = token_cache
 
     def register_user(self, user_data, expected_status=201):
         """
@@ -46,17 +52,28 @@ class AuthAPI(CustomRequester):
     #     self._update_session_headers(Authorization=f"Bearer {token}")
     #     return response
 
-    def authenticate(self, user_creds):
+    def authenticate(self, user_creds, persist_token=True):
         # для использования ролевой модели и параметризации
+        # persist_token=False - токен временного пользователя не попадает
+        # в общий файл кэша токенов
         login_data = {
             "email": user_creds[0],
             "password": user_creds[1]
         }
 
-        response = self.login_user(login_data).json()
-        if "accessToken" not in response:
-            raise KeyError("token is missing")
+        def login():
+            response = self.login_user(login_data).json()
+            if "accessToken" not in response:
+                raise KeyError("token is missing")
+            return response
+
+        if self.token_cache is not None:
+            response = self.token_cache.get_or_login(
+                user_creds, login, persist=persist_token
+            )
+        else:
+            response = login()
 
         token = response["accessToken"]
-        self._update_session_headers(Authorization=f"Bearer {token}")
+        self._set_auth_token(token)
         return response
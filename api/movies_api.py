@@ -1,10 +1,22 @@
-from constants import BASE_URL_MOVIES_API, MOVIES_ENDPOINT
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from constants import (BASE_URL_MOVIES_API, DEFAULT_CONCURRENCY,
+                       DEFAULT_PREFETCH_PAGES, MOVIES_ENDPOINT)
+from custom_requester.bulk import BulkOperation
 from custom_requester.custom_requester import CustomRequester
+from models.model import validate_movies_page
 
 
 class MoviesAPI(CustomRequester):
-    def __init__(self, session, base_url):
-        super().__init__(session, base_url=BASE_URL_MOVIES_API)
+    def __init__(
+        self, session, base_url, auth_headers=None, cache=None,
+        retry_policy=None
+    ):
+        super().__init__(
+            session, base_url=BASE_URL_MOVIES_API, auth_headers=auth_headers,
+            cache=cache, retry_policy=retry_policy
+        )
 
     def get_movie_posters_info(self, expected_status=200, params=None):
         """
@@ -19,19 +31,72 @@ class MoviesAPI(CustomRequester):
             params=params
         )
 
+    def iter_movies(self, filters=None, prefetch=DEFAULT_PREFETCH_PAGES):
+        """
+        Ленивый обход афиши фильмов по страницам.
+        Пока вызывающий код обрабатывает текущую страницу, следующие
+        prefetch страниц загружаются конкурентно. В памяти держится
+        не больше prefetch + 1 страниц.
+        :param filters: Фильтры запроса (pageSize, locations, genreId,
+            minPrice, maxPrice, published, createdAt, page - начальная страница).
+        :param prefetch: Число страниц, загружаемых заранее
+            (0 - страницы загружаются последовательно, без потоков).
+        :return: Генератор объектов Movie.
+        """
+        if prefetch < 0:
+            raise ValueError(f"prefetch не может быть отрицательным: {prefetch}")
+        params = {
+            key: value for key, value in (filters or {}).items()
+            if value is not None
+        }
+        page = self._get_movies_page(params, params.get("page", 1))
+        next_page = page.page + 1
+        page_count = page.pageCount
+        if prefetch == 0 or next_page > page_count:
+            yield from page.movies
+            for next_page in range(next_page, page_count + 1):
+                yield from self._get_movies_page(params, next_page).movies
+            return
+
+        executor = ThreadPoolExecutor(max_workers=prefetch)
+        pending = deque()
+        try:
+            while True:
+                # Следующие prefetch страниц запрашиваются до того,
+                # как текущая отдается вызывающему коду
+                while len(pending) < prefetch and next_page <= page_count:
+                    pending.append(executor.submit(
+                        self._get_movies_page, params, next_page
+                    ))
+                    next_page += 1
+                yield from page.movies
+                if not pending:
+                    return
+                page = pending.popleft().result()
+        finally:
+            # Если обход прерван, незапущенные загрузки отменяются
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _get_movies_page(self, params, page):
+        response = self.get_movie_posters_info(params={**params, "page": page})
+        return validate_movies_page(response.content)
+
     def add_movie(self, movie_data, expected_status=201, headers=None):
         """
         Создание фильма.
         :param movie_data: Данные фильма.
         :param expected_status: Ожидаемый статус-код.
         """
-        return self.send_request(
+        response = self.send_request(
             method="POST",
             endpoint=MOVIES_ENDPOINT,
             data=movie_data,
             expected_status=expected_status,
             headers=headers
         )
+        if response.ok:
+            self._invalidate_cache(MOVIES_ENDPOINT)
+        return response
 
     def get_movies_info(self, movie_id, expected_status=201):
         """
@@ -51,12 +116,17 @@ class MoviesAPI(CustomRequester):
         :param movie_id: ID фильма.
         :param expected_status: Ожидаемый статус-код.
         """
-        return self.send_request(
+        response = self.send_request(
             method="DELETE",
             endpoint=f'{MOVIES_ENDPOINT}/{movie_id}',
             expected_status=expected_status,
             token=token
         )
+        if response.ok:
+            self._invalidate_cache(
+                MOVIES_ENDPOINT, f'{MOVIES_ENDPOINT}/{movie_id}'
+            )
+        return response
 
     def partial_update_movies_info(
         self, movie_id, movie_update_data, expected_status=200
@@ -67,9 +137,54 @@ class MoviesAPI(CustomRequester):
         :param movie_update_data: Данные фильма для изменения информации.
         :param expected_status: Ожидаемый статус-код.
         """
-        return self.send_request(
+        response = self.send_request(
             method="PATCH",
             endpoint=f'{MOVIES_ENDPOINT}/{movie_id}',
             data=movie_update_data,
             expected_status=expected_status
         )
+        if response.ok:
+            self._invalidate_cache(
+                MOVIES_ENDPOINT, f'{MOVIES_ENDPOINT}/{movie_id}'
+            )
+        return response
+
+    def add_movies_bulk(
+        self, movies, concurrency=DEFAULT_CONCURRENCY, rate_limit=None,
+        expected_status=201
+    ):
+        """
+        Пакетное создание фильмов.
+        Результаты (BulkItemResult с ответом add_movie) отдаются по мере
+        готовности при итерации, итог доступен в report после обхода.
+        :param movies: Итерируемый набор MovieCreation или словарей.
+        :param concurrency: Число одновременных запросов.
+        :param rate_limit: Максимум запросов в секунду.
+        :param expected_status: Ожидаемый статус-код для каждого фильма.
+        :return: BulkOperation.
+        """
+        return BulkOperation(
+            lambda movie: self.add_movie(
+                movie, expected_status=expected_status
+            ),
+            movies, concurrency=concurrency, rate_limit=rate_limit
+        )
+
+    def delete_movies_bulk(
+        self, movie_ids, concurrency=DEFAULT_CONCURRENCY, rate_limit=None,
+        expected_status=200, token=None
+    ):
+        """
+        Пакетное удаление фильмов.
+        :param movie_ids: Итерируемый набор ID фильмов.
+        :param concurrency: Число одновременных запросов.
+        :param rate_limit: Максимум запросов в секунду.
+        :param expected_status: Ожидаемый статус-код для каждого фильма.
+        :return: BulkOperation.
+        """
+        return BulkOperation(
+            lambda movie_id: self.delete_movies_info(
+                movie_id, expected_status=expected_status, token=token
+            ),
+            movie_ids, concurrency=concurrency, rate_limit=rate_limit
+        )
@@ -7,8 +7,13 @@ class UserAPI(CustomRequester):
     Класс для работы с API пользователей.
     """
 
-    def __init__(self, session, base_url):
-        super().__init__(session=session, base_url=USER_BASE_URL)
+    def __init__(
+        self, session, base_url, auth_headers=None, retry_policy=None
+    ):
+        super().__init__(
+            session=session, base_url=USER_BASE_URL, auth_headers=auth_headers,
+            retry_policy=retry_policy
+        )
 
     def get_user(self, user_locator, expected_status=200):
         """
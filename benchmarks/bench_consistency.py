@@ -0,0 +1,49 @@
+"""
+Бенчмарк сверки данных API и БД (db_requester.consistency) на синтетическом
+каталоге: время приведения записей и сравнения для разного числа записей.
+
+Запуск: python -m benchmarks.bench_consistency [максимальное число записей]
+"""
+import sys
+import time
+
+from db_requester.consistency import MOVIE_FIELDS, api_rows, compare, db_rows
+
+
+def make_records(size, broken_every=1000):
+    api = [
+        {"id": movie_id, "name": f"movie {movie_id}",
+         "price": 100 + movie_id % 50, "published": True, "location": "MSK",
+         "genreId": 1}
+        for movie_id in range(size)
+    ]
+    db = [
+        (str(movie_id), f"movie {movie_id}",
+         100 + movie_id % 50 + (movie_id % broken_every == 0), True, "MSK",
+         "1")
+        for movie_id in range(broken_every // 2, size)
+    ]
+    return api, db
+
+
+def main(max_size=1000000):
+    size = 10000
+    while size <= max_size:
+        api, db = make_records(size)
+        started_at = time.perf_counter()
+        report = compare(
+            "movies", api_rows(api, MOVIE_FIELDS), db_rows(db, MOVIE_FIELDS),
+            MOVIE_FIELDS
+        )
+        elapsed = time.perf_counter() - started_at
+        print(
+            f"{size:>9} записей {elapsed:8.2f} s "
+            f"{size / elapsed:>12.0f} записей/s  "
+            f"нет в БД {len(report.missing_in_db)}, "
+            f"расхождения {dict(report.field_mismatches)}"
+        )
+        size *= 10
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
@@ -0,0 +1,73 @@
+"""
+Микро-бенчмарк генерации тестовых данных.
+Сравнивает поштучную генерацию через методы DataGenerator с пакетной
+generate_users/generate_movies (колонки и материализация моделей).
+
+Запуск: python -m benchmarks.bench_data_generator [число элементов]
+"""
+import sys
+import time
+
+from models.model import MovieCreation, MovieLocation, Roles, TestUser
+from utils.data_generator import DataGenerator, get_vocabularies
+
+
+def users_per_call(n):
+    users = []
+    for _ in range(n):
+        password = DataGenerator.generate_random_password()
+        users.append(TestUser(
+            email=DataGenerator.generate_random_email(),
+            fullName=DataGenerator.generate_random_name(),
+            password=password,
+            passwordRepeat=password,
+            roles=[Roles.USER],
+            verified=True,
+            banned=False
+        ))
+    return users
+
+
+def movies_per_call(n):
+    return [
+        MovieCreation(
+            name=DataGenerator.generate_random_film_name(),
+            price=DataGenerator.generate_random_price(),
+            location=MovieLocation.SPB
+        )
+        for _ in range(n)
+    ]
+
+
+def measure(func, *args):
+    started_at = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - started_at
+
+
+def main(n=10000):
+    started_at = time.perf_counter()
+    get_vocabularies()
+    print(f"Построение словарей (один раз): "
+          f"{(time.perf_counter() - started_at) * 1000:.1f} ms")
+
+    cases = [
+        ("users", users_per_call, DataGenerator.generate_users),
+        ("movies", movies_per_call, DataGenerator.generate_movies),
+    ]
+    print(f"{n} элементов")
+    for name, per_call, batch in cases:
+        per_call_time = measure(per_call, n)
+        columns_time = measure(batch, n, 1)
+        models_time = measure(lambda: list(batch(n, 1)))
+        print(
+            f"{name:<7} поштучно {per_call_time * 1000:8.1f} ms | "
+            f"колонки {columns_time * 1000:7.1f} ms "
+            f"(x{per_call_time / columns_time:.0f}) | "
+            f"колонки + модели {models_time * 1000:7.1f} ms "
+            f"(x{per_call_time / models_time:.1f})"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
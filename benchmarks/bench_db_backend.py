@@ -0,0 +1,78 @@
+"""
+Бенчмарк задержки одного запроса для бэкендов БД: SQLite в памяти,
+SQLite в файле и удаленный Postgres из DBCreds (если он настроен).
+Для каждого бэкенда измеряются SELECT 1 и выборка пользователя по ID.
+
+Запуск: python -m benchmarks.bench_db_backend [число запросов]
+"""
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine, select, text
+
+from db_requester.db_session import get_database_url
+from db_requester.models import UserDBModel
+from db_requester.sqlite_backend import create_sqlite_engine
+from resources.db_creds import DBCreds
+
+
+def latencies(engine, statement, number):
+    timings = []
+    with engine.connect() as connection:
+        for _ in range(number):
+            started_at = time.perf_counter()
+            connection.execute(statement).fetchall()
+            timings.append(time.perf_counter() - started_at)
+    return timings
+
+
+def report(name, engine, number):
+    queries = {
+        "SELECT 1": text("SELECT 1"),
+        "users по ID": select(UserDBModel).where(UserDBModel.id == "1"),
+    }
+    for query_name, statement in queries.items():
+        timings = latencies(engine, statement, number)
+        p95 = statistics.quantiles(timings, n=20)[-1]
+        print(
+            f"{name:<16} {query_name:<12} "
+            f"median {statistics.median(timings) * 1e6:10.1f} us  "
+            f"p95 {p95 * 1e6:10.1f} us"
+        )
+
+
+def main(number=1000):
+    with tempfile.TemporaryDirectory() as directory:
+        backends = {
+            "sqlite :memory:": create_sqlite_engine(),
+            "sqlite file": create_sqlite_engine(
+                str(Path(directory) / "cinescope.db")
+            ),
+        }
+        for engine in backends.values():
+            with engine.begin() as connection:
+                connection.execute(UserDBModel.__table__.insert(), [
+                    {"id": str(i), "email": f"user{i}@gmail.com",
+                     "roles": "{USER}"}
+                    for i in range(1000)
+                ])
+        if DBCreds.DB_HOST:
+            backends["postgres"] = create_engine(get_database_url())
+        else:
+            print("postgres: DB_HOST не задан, замер пропущен")
+
+        for name, engine in backends.items():
+            try:
+                report(name, engine, number)
+            except Exception as error:
+                reason = str(error).splitlines()[0]
+                print(f"{name}: недоступен ({type(error).__name__}: {reason})")
+            finally:
+                engine.dispose()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
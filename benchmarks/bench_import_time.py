@@ -0,0 +1,97 @@
+"""
+Бенчмарк времени старта: импорт conftest по данным python -X importtime
+и время сбора тестов pytest --collect-only.
+Используется как регрессионная метрика: при превышении порога или
+импорте тяжелых модулей из FORBIDDEN_MODULES скрипт завершается с кодом 1.
+
+Запуск: python -m benchmarks.bench_import_time [--max-ms 400] [--collect tests]
+"""
+import argparse
+import re
+import subprocess
+import sys
+import time
+
+# Модули, которые не должны загружаться при импорте conftest
+FORBIDDEN_MODULES = ("playwright", "sqlalchemy", "faker", "psycopg2")
+
+IMPORT_TIME_LINE = re.compile(
+    r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)"
+)
+
+
+def import_times(module="conftest"):
+    """
+    Импорт модуля в отдельном процессе с -X importtime.
+    :return: Список кортежей (имя модуля, глубина, self мкс, cumulative мкс).
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True
+    )
+    entries = []
+    for line in result.stderr.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            entries.append(
+                (name, len(indent) // 2, int(self_us), int(cumulative_us))
+            )
+    return entries
+
+
+def collection_time(path):
+    """
+    Время сбора тестов pytest --collect-only в секундах.
+    """
+    started_at = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-m", "pytest", "--collect-only", "-q",
+         "-p", "no:cacheprovider", path],
+        capture_output=True, check=True
+    )
+    return time.perf_counter() - started_at
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--module", default="conftest")
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--max-ms", type=float, default=None,
+                        help="Порог времени импорта модуля в мс")
+    parser.add_argument("--collect", default=None,
+                        help="Путь для замера pytest --collect-only")
+    args = parser.parse_args(argv)
+
+    entries = import_times(args.module)
+    total_ms = next(
+        cumulative for name, depth, _, cumulative in entries
+        if name == args.module and depth == 0
+    ) / 1000
+    print(f"import {args.module}: {total_ms:.1f} ms")
+    print(f"Самые тяжелые прямые зависимости {args.module}:")
+    direct = sorted(
+        (entry for entry in entries if entry[1] == 1),
+        key=lambda entry: entry[3], reverse=True
+    )
+    for name, _, _, cumulative in direct[:args.top]:
+        print(f"  {name:<40} {cumulative / 1000:8.1f} ms")
+
+    failed = False
+    loaded = {name.split(".")[0] for name, *_ in entries}
+    forbidden = sorted(loaded.intersection(FORBIDDEN_MODULES))
+    if forbidden:
+        print(f"Загружены тяжелые модули: {', '.join(forbidden)}")
+        failed = True
+    if args.max_ms is not None and total_ms > args.max_ms:
+        print(f"Превышен порог {args.max_ms:.0f} ms")
+        failed = True
+
+    if args.collect:
+        print(f"pytest --collect-only {args.collect}: "
+              f"{collection_time(args.collect):.2f} s")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
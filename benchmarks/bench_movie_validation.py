@@ -0,0 +1,57 @@
+"""
+Микро-бенчмарк валидации страницы афиши фильмов.
+Сравнивает response.json() + Movie(**movie) в цикле с валидацией сырых
+байтов ответа через закэшированный TypeAdapter.
+
+Запуск: python -m benchmarks.bench_movie_validation [число фильмов]
+"""
+import json
+import sys
+import timeit
+
+from models.model import Movie, validate_movies_page
+
+
+def make_page(size):
+    movies = [
+        {
+            "id": movie_id, "name": f"Movie {movie_id}", "price": 100 + movie_id,
+            "description": "Описание фильма", "imageUrl": "https://image.url",
+            "location": "MSK" if movie_id % 2 else "SPB", "published": True,
+            "genreId": 1, "genre": {"name": "Драма"},
+            "createdAt": "2024-03-02T05:37:47.298Z", "rating": 4.5
+        }
+        for movie_id in range(size)
+    ]
+    return json.dumps({
+        "movies": movies, "count": size, "page": 1, "pageSize": size,
+        "pageCount": 1
+    }).encode()
+
+
+def loop_validation(content):
+    response = json.loads(content)
+    return [Movie(**movie) for movie in response["movies"]]
+
+
+def main(size=10000, repeat=5):
+    content = make_page(size)
+    validate_movies_page(content)  # прогрев: создание TypeAdapter
+
+    cases = {
+        "json.loads + Movie(**movie)": lambda: loop_validation(content),
+        "TypeAdapter.validate_json": lambda: validate_movies_page(content),
+        "TypeAdapter, sample_every=10": lambda: validate_movies_page(
+            content, sample_every=10
+        ),
+    }
+    baseline = None
+    print(f"Страница из {size} фильмов, лучший из {repeat} прогонов")
+    for name, case in cases.items():
+        best = min(timeit.repeat(case, number=1, repeat=repeat))
+        baseline = baseline or best
+        print(f"{name:<32} {best * 1000:8.2f} ms  x{baseline / best:.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
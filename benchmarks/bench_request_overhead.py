@@ -0,0 +1,90 @@
+"""
+Микро-бенчмарк накладных расходов клиента на один запрос.
+Сетевой вызов заменен заглушкой адаптера, поэтому измеряется только
+подготовка тела, заголовков и запроса в requests/CustomRequester,
+а также отдельно подготовка тела.
+
+Запуск: python -m benchmarks.bench_request_overhead [число запросов]
+"""
+import json
+import sys
+import timeit
+
+import requests
+from requests import Response
+from requests.adapters import BaseAdapter
+
+from custom_requester.body_encoder import encode_body
+from custom_requester.custom_requester import CustomRequester
+from models.model import MovieCreation, MovieLocation
+
+
+class NullAdapter(BaseAdapter):
+
+    def send(self, request, **kwargs):
+        response = Response()
+        response.status_code = 201
+        response.request = request
+        response._content = b"{}"
+        return response
+
+    def close(self):
+        pass
+
+
+def make_requester():
+    session = requests.Session()
+    session.mount("https://", NullAdapter())
+    return CustomRequester(session, "https://bench.api")
+
+
+def main(number=5000, repeat=5):
+    requester = make_requester()
+    movie = MovieCreation(
+        name="Фильм", description="Описание " * 20, location=MovieLocation.SPB
+    )
+    encoded_movie = encode_body(movie)
+
+    def send(data):
+        requester.send_request("POST", "/movies", data=data, need_logging=False)
+
+    def round_trip():
+        # Прежний путь: модель -> JSON -> dict -> JSON в requests
+        send(json.loads(movie.model_dump_json(exclude_unset=True)))
+
+    def prepare_round_trip():
+        requests.Request(
+            "POST", "https://bench.api/movies",
+            json=json.loads(movie.model_dump_json(exclude_unset=True))
+        ).prepare()
+
+    def prepare_bytes(data):
+        data, headers = requester._prepare_request(data, None, None)
+        requests.Request(
+            "POST", "https://bench.api/movies", data=data, headers=headers
+        ).prepare()
+
+    print(f"{number} запросов, лучший из {repeat} прогонов, мкс на запрос")
+    run_cases("send_request целиком", {
+        "model -> dict -> json=": round_trip,
+        "model -> bytes": lambda: send(movie),
+        "pre-encoded bytes": lambda: send(encoded_movie),
+    }, number, repeat)
+    run_cases("подготовка тела запроса", {
+        "model -> dict -> json=": prepare_round_trip,
+        "model -> bytes": lambda: prepare_bytes(movie),
+        "pre-encoded bytes": lambda: prepare_bytes(encoded_movie),
+    }, number, repeat)
+
+
+def run_cases(title, cases, number, repeat):
+    baseline = None
+    print(title)
+    for name, case in cases.items():
+        best = min(timeit.repeat(case, number=number, repeat=repeat)) / number
+        baseline = baseline or best
+        print(f"  {name:<28} {best * 1e6:8.1f} us  x{baseline / best:.2f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
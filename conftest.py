@@ -1,21 +1,38 @@
 import datetime
+import json
+import logging
+import threading
 import time
 import uuid
 
 import pytest
 import requests
-from playwright.sync_api import sync_playwright
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from requests import Response
+from requests.adapters import BaseAdapter
 
 from api.api_manager import ApiManager
-from constants import BASE_URL_AUTH, REGISTER_ENDPOINT, USER_BASE_URL
+from constants import (BASE_URL_AUTH, REGISTER_ENDPOINT, USER_BASE_URL,
+                       USER_POOL_SIZE)
+from custom_requester.cassette import Cassette
+from custom_requester.connection_pool import shared_connection_pool
 from custom_requester.custom_requester import CustomRequester
-from db_requester.models import UserDBModel
+from custom_requester.request_logger import request_log_pipeline
+from custom_requester.response_cache import ResponseCache
+from custom_requester.retry_policy import RetryPolicy
+from custom_requester.token_cache import TokenCache
+from db_requester.db_session import (dispose_engine, get_engine,
+                                     get_session_factory,
+                                     transactional_session)
+from db_requester.sql_profiler import sql_profiler
 from entities.user import User
+from entities.user_pool import UserPool, pool_size_per_worker
 from enums.roles import Roles
 from models.model import TestUser
-from resources.db_creds import DBCreds
+from resources.cache_settings import CacheSettings
+from resources.db_verify_settings import DBVerifySettings
+from resources.log_settings import LogSettings
+from resources.retry_settings import RetrySettings
+from resources.sql_profile_settings import SQLProfileSettings
 from resources.user_creds import AdminCreds, SuperAdminCreds
 from utils.data_generator import DataGenerator
 
@@ -66,31 +83,158 @@ def registered_user(requester, test_user):
     return registered_user
 
 
+@pytest.fixture(scope="session", autouse=True)
+def request_logging():
+    """
+    Фикстура конвейера логирования запросов.
+    При REQUEST_LOG_BACKGROUND=1 логи выводятся через фоновый поток.
+    """
+    if LogSettings.BACKGROUND:
+        request_log_pipeline.start_background()
+    yield request_log_pipeline
+    request_log_pipeline.stop_background()
+
+
+@pytest.fixture(autouse=True)
+def sql_profile(request):
+    """
+    Профилирование SQL-запросов теста (включается через SQL_PROFILE=1).
+    Итог теста добавляется в user_properties отчета (junitxml), тесты
+    с повторяющимися запросами выводятся в конце прогона.
+    """
+    if not SQLProfileSettings.ENABLED:
+        yield
+        return
+    sql_profiler.start_test(request.node.nodeid)
+    yield
+    summary = sql_profiler.finish_test()
+    if summary is not None:
+        request.node.user_properties.append(("sql", summary.as_dict()))
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not sql_profiler.summaries:
+        return
+    summaries = sql_profiler.summaries
+    terminalreporter.section("SQL profile")
+    terminalreporter.write_line(
+        f"{sum(summary.queries for summary in summaries)} SQL-запросов, "
+        f"{sum(summary.total_time for summary in summaries):.2f} s "
+        f"в {len(summaries)} тестах"
+    )
+    for summary in summaries:
+        if summary.has_warnings:
+            terminalreporter.write_line(str(summary))
+
+
+@pytest.fixture(scope="session", autouse=True)
+def connection_pool():
+    """
+    Фикстура общего пула соединений.
+    В конце прогона в лог выводятся счетчики открытых
+    и переиспользованных соединений по хостам, после чего
+    keep-alive соединения закрываются.
+    """
+    yield shared_connection_pool
+    shared_connection_pool.log_stats()
+    shared_connection_pool.close()
+
+
+@pytest.fixture(scope="session")
+def response_cache():
+    """
+    Фикстура общего кэша ответов GET-запросов MoviesAPI.
+    Включается через RESPONSE_CACHE=1, иначе возвращает None.
+    """
+    if not CacheSettings.ENABLED:
+        yield None
+        return
+    cache = ResponseCache(maxsize=CacheSettings.MAXSIZE, ttl=CacheSettings.TTL)
+    yield cache
+    logging.getLogger(__name__).info(f"Response cache stats: {cache.stats()}")
+
+
+@pytest.fixture(scope="session")
+def retry_policy():
+    """
+    Фикстура политики повторов запросов с общим бюджетом на весь прогон.
+    При REQUEST_RETRIES=0 повторы выключены и фикстура возвращает None.
+    """
+    if RetrySettings.MAX_RETRIES <= 0:
+        yield None
+        return
+    policy = RetryPolicy(
+        max_retries=RetrySettings.MAX_RETRIES,
+        backoff_factor=RetrySettings.BACKOFF_FACTOR,
+        max_backoff=RetrySettings.MAX_BACKOFF,
+        total_budget=RetrySettings.TOTAL_BUDGET
+    )
+    yield policy
+    logging.getLogger(__name__).info(f"Retry stats: {policy.stats()}")
+
+
 @pytest.fixture(scope="session")
-def requester():
+def token_cache(tmp_path_factory, worker_id):
+    """
+    Фикстура кэша токенов, общего для всех воркеров pytest-xdist.
+    Хранилище лежит в общем для воркеров временном каталоге,
+    поэтому каждая роль логинится один раз за прогон.
+    """
+    root_tmp_dir = tmp_path_factory.getbasetemp()
+    if worker_id != "master":
+        root_tmp_dir = root_tmp_dir.parent
+    cache = TokenCache(path=str(root_tmp_dir / "tokens.json"))
+    yield cache
+    logging.getLogger(__name__).info(f"Token cache stats: {cache.stats()}")
+
+
+@pytest.fixture(scope="session")
+def cassette():
+    """
+    Фикстура кассеты record/replay для HTTP-запросов.
+    Режим задается переменными окружения CASSETTE_MODE и CASSETTE_PATH,
+    по умолчанию кассета выключена и фикстура возвращает None.
+    """
+    cassette = Cassette.from_env()
+    yield cassette
+    if cassette is not None:
+        cassette.close()
+
+
+@pytest.fixture(scope="session")
+def requester(cassette, retry_policy):
     """
     Фикстура для создания экземпляра CustomRequester.
     """
-    session = requests.Session()
-    return CustomRequester(session=session, base_url=BASE_URL_AUTH)
+    session = shared_connection_pool.new_session()
+    if cassette is not None:
+        cassette.mount(session)
+    return CustomRequester(
+        session=session, base_url=BASE_URL_AUTH, retry_policy=retry_policy
+    )
 
 
 @pytest.fixture(scope="session")
-def session():
+def session(cassette):
     """
     Фикстура для создания HTTP-сессии.
     """
-    http_session = requests.Session()
+    http_session = shared_connection_pool.new_session()
+    if cassette is not None:
+        cassette.mount(http_session)
     yield http_session
     http_session.close()
 
 
 @pytest.fixture(scope="session")
-def api_manager(session):
+def api_manager(session, response_cache, retry_policy):
     """
     Фикстура для создания экземпляра ApiManager.
     """
-    return ApiManager(session, BASE_URL_AUTH)
+    return ApiManager(
+        session, BASE_URL_AUTH, cache=response_cache,
+        retry_policy=retry_policy
+    )
 
 
 @pytest.fixture(scope='function')
@@ -142,13 +286,31 @@ def admin_user():
     }
 
 
+@pytest.fixture(scope="session")
+def api_manager_factory(cassette, response_cache, retry_policy, token_cache):
+    """
+    Фабрика ApiManager с общими настройками прогона:
+    пул соединений, кассета, кэш ответов, повторы и кэш токенов.
+    """
+    def _create_api_manager():
+        # Сессии пользователей разделяют общий пул keep-alive соединений
+        session = shared_connection_pool.new_session()
+        if cassette is not None:
+            cassette.mount(session)
+        return ApiManager(
+            session, base_url=USER_BASE_URL, cache=response_cache,
+            retry_policy=retry_policy, token_cache=token_cache
+        )
+
+    return _create_api_manager
+
+
 @pytest.fixture
-def user_session():
+def user_session(api_manager_factory):
     user_pool = []  # Список для хранения всех созданных в тесте сессий
 
     def _create_user_session():
-        session = requests.Session()
-        user_session = ApiManager(session, base_url=USER_BASE_URL)
+        user_session = api_manager_factory()
         user_pool.append(user_session)
         return user_session
 
@@ -201,6 +363,7 @@ def super_admin(user_session):
 
 @pytest.fixture
 def super_admin_token(super_admin):
+    # Повторный authenticate отдает токен из кэша без запроса /login
     response = super_admin.api.auth_api.authenticate(super_admin.creds)
     token = response["accessToken"]
     return token
@@ -220,26 +383,183 @@ def admin(user_session):
     return admin
 
 
+@pytest.fixture(scope="session")
+def pool_super_admin(api_manager_factory):
+    """
+    Супер-администратор для фикстур уровня сессии (пул пользователей).
+    """
+    pool_super_admin = User(
+        SuperAdminCreds.USERNAME,
+        SuperAdminCreds.PASSWORD,
+        [Roles.SUPER_ADMIN.value],
+        api_manager_factory())
+
+    pool_super_admin.api.auth_api.authenticate(pool_super_admin.creds)
+    yield pool_super_admin
+    pool_super_admin.api.close_session()
+
+
+@pytest.fixture(scope="session")
+def user_pool(api_manager_factory, pool_super_admin):
+    """
+    Пул заранее созданных и авторизованных пользователей.
+    Размер пула делится между воркерами pytest-xdist,
+    в конце прогона пользователи удаляются через UserAPI.delete_user.
+    """
+    def create_user(role):
+        random_password = DataGenerator.generate_random_password()
+        user_data = TestUser(
+            email=DataGenerator.generate_random_email(),
+            fullName=DataGenerator.generate_random_name(),
+            password=random_password,
+            passwordRepeat=random_password,
+            roles=[role],
+            verified=True,
+            banned=False
+        )
+        response = pool_super_admin.api.user_api.create_user(user_data).json()
+        user = User(
+            user_data.email,
+            user_data.password,
+            [role],
+            api_manager_factory(),
+            user_id=response["id"])
+        # Пользователь пула живет один прогон: токен только в памяти
+        user.api.auth_api.authenticate(user.creds, persist_token=False)
+        return user
+
+    def delete_user(user):
+        pool_super_admin.api.user_api.delete_user(user.id)
+        user.api.close_session()
+
+    pool = UserPool(create_user, delete_user)
+    pool.provision({Roles.USER.value: pool_size_per_worker(USER_POOL_SIZE)})
+    yield pool
+    pool.close()
+
+
 @pytest.fixture
-def common_user(user_session, super_admin, creation_user_data_with_pydantic):
-    new_session = user_session()
+def common_user(user_pool):
+    """
+    Пользователь с ролью USER, арендованный из пула на время теста.
+    """
+    with user_pool.lease(Roles.USER.value) as common_user:
+        yield common_user
 
-    common_user = User(
-        creation_user_data_with_pydantic.email,
-        creation_user_data_with_pydantic.password,
-        [Roles.USER.value],
-        new_session)
 
-    super_admin.api.user_api.create_user(creation_user_data_with_pydantic)
-    common_user.api.auth_api.authenticate(common_user.creds)
-    return common_user
+@pytest.fixture(scope="session")
+def db_engine():
+    """
+    Общий движок БД с пулом, размер которого рассчитан на воркер xdist.
+    Создается при первом использовании, в конце прогона в лог выводятся
+    метрики пула (время получения соединения, пик занятых соединений).
+    """
+    yield get_engine()
+    dispose_engine()
+
 
+@pytest.fixture
+def sqlite_engine(request, tmp_path):
+    """
+    Отдельный SQLite-движок теста со схемой моделей db_requester
+    во временном файле. Параметры задаются indirect-параметризацией:
+    @pytest.mark.parametrize("sqlite_engine", [{...}], indirect=True).
+    memory - in-memory БД вместо файла, create_schema=False - без таблиц
+    и жанров, остальные ключи передаются в create_engine.
+    """
+    from db_requester.sqlite_backend import create_sqlite_engine
+
+    options = dict(getattr(request, "param", None) or {})
+    memory = options.pop("memory", False)
+    create_schema = options.pop("create_schema", True)
+    engine = create_sqlite_engine(
+        ":memory:" if memory else str(tmp_path / "db.sqlite3"),
+        seed=create_schema, create_schema=create_schema, **options
+    )
+    yield engine
+    engine.dispose()
+
+
+class StubTransport(BaseAdapter):
+    """
+    Транспорт-заглушка для requests: отвечает без обращения к сети
+    и запоминает отправленные запросы.
+    Ответ - статус-код, кортеж (статус, тело[, заголовки]) или исключение,
+    которое выбрасывается вместо ответа. Тело-bytes отдается как есть,
+    остальное сериализуется в JSON, без тела ответ - {}.
+    """
+
+    def __init__(self, handler=None, script=(200,), delay=0):
+        """
+        :param handler: Функция PreparedRequest -> ответ (потокобезопасная).
+        :param script: Ответы по порядку запросов, если handler не задан.
+            Последний ответ повторяется.
+        :param delay: Задержка ответа в секундах.
+        """
+        super().__init__()
+        self.handler = handler
+        self.script = list(script)
+        self.delay = delay
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def session(self):
+        """
+        Сессия requests, все запросы которой обслуживает заглушка.
+        """
+        session = requests.Session()
+        session.mount("https://", self)
+        session.mount("http://", self)
+        return session
+
+    def send(self, request, **kwargs):
+        with self._lock:
+            attempt = len(self.requests)
+            self.requests.append(request)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.delay:
+                time.sleep(self.delay)
+            if self.handler is not None:
+                reply = self.handler(request)
+            else:
+                reply = self.script[min(attempt, len(self.script) - 1)]
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+        if isinstance(reply, Exception):
+            raise reply
+        status, body, headers = (
+            *(reply if isinstance(reply, tuple) else (reply,)), None, None
+        )[:3]
+        response = Response()
+        response.status_code = status
+        response.headers.update(headers or {})
+        response._content = (
+            body if isinstance(body, bytes)
+            else b"{}" if body is None
+            else json.dumps(body).encode()
+        )
+        response.request = request
+        response.url = request.url
+        return response
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def stub_transport():
+    """
+    Фабрика транспорта-заглушки для unit-тестов клиентов API:
+    stub_transport(handler=..., script=..., delay=...).session() -
+    сессия requests без обращения к сети (см. StubTransport).
+    """
+    return StubTransport
 
-# Создаем движок (engine) для подключения к базе данных
-engine = create_engine(
-    f"postgresql+psycopg2://{DBCreds.DB_USER}:{DBCreds.DB_PASSWORD}@{DBCreds.DB_HOST}:{DBCreds.DB_PORT}/{DBCreds.DB_NAME}")
-SessionLocal = sessionmaker(
-    autocommit=False, autoflush=False, bind=engine)  # Создаем фабрику сессий
 
 # @pytest.fixture(scope="module")
 # def db_session():
@@ -256,12 +576,15 @@ SessionLocal = sessionmaker(
 
 
 @pytest.fixture(scope="module")
-def db_session():
+def db_session(db_engine):
     """
     Фикстура с областью видимости module.
     Тестовые данные создаются один раз для всех тестов в модуле.
     """
-    session = SessionLocal()
+    # Модели импортируются здесь, чтобы не загружать SQLAlchemy без БД-тестов
+    from db_requester.models import UserDBModel
+
+    session = get_session_factory()()
 
     # Создаем тестовые данные
     test_user = UserDBModel(
@@ -287,6 +610,82 @@ def db_session():
     session.close()  # завершем сессию (отключаемся от базы данных)
 
 
+@pytest.fixture
+def db_transaction(db_engine):
+    """
+    Сессия БД, изолированная транзакцией теста.
+    Тест может вызывать commit(), все изменения откатываются после теста
+    одним ROLLBACK без удаления данных и без "осиротевших" строк.
+    Для данных, которые должен видеть тестируемый сервис, используйте db_session.
+    """
+    with transactional_session(db_engine) as session:
+        yield session
+
+
+@pytest.fixture
+def bulk_loader(db_engine):
+    """
+    Пакетная загрузка тестовых данных в БД (Core insert/COPY).
+    Все строки помечаются тегом прогона и удаляются после теста
+    одним DELETE на таблицу.
+    """
+    from db_requester.bulk_loader import BulkLoader
+
+    loader = BulkLoader(db_engine)
+    yield loader
+    loader.cleanup()
+
+
+def _flush_db_verifier(verifier):
+    failures = verifier.flush()
+    if failures:
+        pytest.fail(
+            "Не выполнены ожидания в БД:\n"
+            + "\n".join(str(failure) for failure in failures)
+        )
+
+
+@pytest.fixture(scope="session")
+def db_verifier_session(db_engine):
+    """
+    Общий для прогона DBVerifier. При DB_VERIFY_FLUSH=session
+    ожидания проверяются в конце прогона.
+    """
+    from db_requester.db_verifier import DBVerifier
+
+    verifier = DBVerifier(
+        timeout=DBVerifySettings.TIMEOUT,
+        poll_interval=DBVerifySettings.POLL_INTERVAL,
+        max_poll_interval=DBVerifySettings.MAX_POLL_INTERVAL
+    )
+    yield verifier
+    if DBVerifySettings.FLUSH == "session":
+        _flush_db_verifier(verifier)
+
+
+@pytest.fixture(scope="module")
+def db_verifier_module(db_verifier_session):
+    yield db_verifier_session
+    if DBVerifySettings.FLUSH == "module":
+        _flush_db_verifier(db_verifier_session)
+
+
+@pytest.fixture
+def db_verifier(request, db_verifier_module):
+    """
+    Отложенная проверка побочных эффектов API в БД:
+    db_verifier.expect(UserDBModel, user_id, email=email).
+    Ожидания проверяются пакетно (один WHERE id IN (...) на таблицу)
+    в конце теста, модуля или прогона - по DB_VERIFY_FLUSH.
+    Ошибки содержат тест, зарегистрировавший ожидание.
+    """
+    db_verifier_module.current_test = request.node.nodeid
+    yield db_verifier_module
+    db_verifier_module.current_test = None
+    if DBVerifySettings.FLUSH == "test":
+        _flush_db_verifier(db_verifier_module)
+
+
 @pytest.fixture
 def delay_between_retries():
     time.sleep(2)  # Задержка в 2 секунды\ это не обязательно но
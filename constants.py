@@ -12,3 +12,15 @@ VALID_MOVIE_ID = 20
 GREEN = '\033[32m'
 RED = '\033[31m'
 RESET = '\033[0m'
+DEFAULT_CONCURRENCY = 10
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 10
+POOL_MAXSIZE_PER_HOST = {
+    BASE_URL_AUTH: 20,
+    BASE_URL_MOVIES_API: 20,
+}
+USER_POOL_SIZE = 4
+DEFAULT_PREFETCH_PAGES = 3
+ID_EPOCH_MS = 1704067200000  # 2024-01-01T00:00:00Z
+DB_BULK_BATCH_SIZE = 1000
+DATA_GC_MIN_AGE_MINUTES = 60  # Не трогать данные, созданные позже (идущие прогоны)
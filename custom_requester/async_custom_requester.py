@@ -0,0 +1,90 @@
+import asyncio
+
+from constants import DEFAULT_CONCURRENCY
+from custom_requester.custom_requester import CustomRequester
+
+
+class AsyncCustomRequester(CustomRequester):
+    """
+    Асинхронный аналог CustomRequester на базе httpx.AsyncClient.
+    Контракт send_request тот же: expected_status, token, тело в виде
+    pydantic BaseModel и curl-логирование, но запрос нужно ожидать через await.
+    """
+
+    def __init__(self, session, base_url, auth_headers=None):
+        """
+        Инициализация асинхронного реквестера.
+        :param session: Объект httpx.AsyncClient.
+        :param base_url: Базовый URL API.
+        :param auth_headers: Заголовки авторизации пользователя.
+        """
+        super().__init__(
+            session=session, base_url=base_url, auth_headers=auth_headers
+        )
+
+    async def send_request(
+        self, method, endpoint,
+        data=None, expected_status=[200, 201], need_logging=True, params=None,
+        headers=None, token=None
+    ):
+        """
+        Универсальный асинхронный метод для отправки запросов.
+        :param method: HTTP метод (GET, POST, PUT, DELETE и т.д.).
+        :param endpoint: Эндпоинт (например, "/login").
+        :param data: Тело запроса (dict, pydantic BaseModel или готовые bytes).
+        :param expected_status: Ожидаемый статус-код (по умолчанию 200).
+        :param need_logging: Флаг для логирования (по умолчанию True).
+        :param params: Фильтр запросов (по умолчанию None).
+        :return: Объект ответа httpx.Response.
+        """
+        url = f"{self.base_url}{endpoint}"
+        data, headers = self._prepare_request(data, headers, token)
+        if params is not None:
+            # requests отбрасывает параметры со значением None, httpx - нет
+            params = {
+                key: value for key, value in params.items()
+                if value is not None
+            }
+
+        response = await self.session.request(
+            method, url, params=params, headers=headers,
+            **self._async_body_kwargs(data)
+        )
+        if need_logging:
+            self.log_request_and_response(
+                response, endpoint=endpoint, expected_status=expected_status
+            )
+        self._check_status(response, expected_status)
+
+        return response
+
+    @staticmethod
+    def _async_body_kwargs(data):
+        """
+        Аргумент тела для httpx: bytes передаются через content.
+        """
+        if isinstance(data, bytes):
+            return {"content": data}
+        return {"json": data}
+
+
+async def gather_with_concurrency(
+    aws, concurrency=DEFAULT_CONCURRENCY, return_exceptions=False
+):
+    """
+    Конкурентное выполнение корутин с ограничением одновременно
+    выполняющихся запросов.
+    :param aws: Итерируемый объект корутин.
+    :param concurrency: Максимальное число одновременно выполняемых корутин.
+    :param return_exceptions: Возвращать исключения вместо их проброса.
+    :return: Список результатов в порядке переданных корутин.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _run(aw):
+        async with semaphore:
+            return await aw
+
+    return await asyncio.gather(
+        *(_run(aw) for aw in aws), return_exceptions=return_exceptions
+    )
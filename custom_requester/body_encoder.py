@@ -0,0 +1,22 @@
+from pydantic import BaseModel
+
+
+def encode_body(model):
+    """
+    Сериализация pydantic-модели сразу в байты тела запроса,
+    без промежуточного dict и повторного json.dumps в requests.
+    :param model: Объект pydantic BaseModel.
+    :return: JSON в виде bytes (только явно заданные поля).
+    """
+    return model.model_dump_json(exclude_unset=True).encode()
+
+
+def prepare_body(data):
+    """
+    Приведение тела запроса к виду для отправки.
+    :param data: dict, pydantic BaseModel или уже закодированные bytes.
+    :return: bytes для моделей, остальное без изменений.
+    """
+    if isinstance(data, BaseModel):
+        return encode_body(data)
+    return data
@@ -0,0 +1,157 @@
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from constants import DEFAULT_CONCURRENCY
+
+
+class RateLimiter:
+    """
+    Ограничение частоты операций: не больше rate операций в секунду.
+    Потокобезопасен, каждая операция получает свой временной слот.
+    """
+
+    def __init__(self, rate):
+        """
+        :param rate: Число операций в секунду (None - без ограничения).
+        """
+        self.interval = 1 / rate if rate else 0
+        self._next_slot = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(self._next_slot, now)
+            self._next_slot = slot + self.interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+
+class BulkItemResult:
+    """
+    Результат обработки одного элемента пакетной операции.
+    """
+
+    __slots__ = ("index", "item", "result", "error")
+
+    def __init__(self, index, item, result=None, error=None):
+        self.index = index
+        self.item = item
+        self.result = result
+        self.error = error
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+class BulkReport:
+    """
+    Итог пакетной операции: число успешных и неуспешных элементов,
+    ошибки по элементам и пропускная способность.
+    """
+
+    def __init__(self):
+        self.succeeded = 0
+        self.failed = 0
+        self.errors = []
+        self.started_at = time.monotonic()
+        self.finished_at = None
+
+    @property
+    def total(self):
+        return self.succeeded + self.failed
+
+    @property
+    def elapsed(self):
+        finished_at = self.finished_at or time.monotonic()
+        return finished_at - self.started_at
+
+    @property
+    def throughput(self):
+        """
+        Число обработанных элементов в секунду.
+        """
+        return self.total / self.elapsed if self.elapsed else 0.0
+
+    def add(self, item_result):
+        if item_result.ok:
+            self.succeeded += 1
+        else:
+            self.failed += 1
+            self.errors.append((item_result.index, item_result.error))
+
+    def __repr__(self):
+        return (
+            f"BulkReport(succeeded={self.succeeded}, failed={self.failed}, "
+            f"elapsed={self.elapsed:.2f}s, throughput={self.throughput:.1f}/s)"
+        )
+
+
+class BulkOperation:
+    """
+    Пакетная операция над итерируемым набором элементов.
+    Элементы обрабатываются пулом потоков с ограничением параллелизма
+    и частоты, результаты отдаются по мере готовности. Ошибки отдельных
+    элементов не прерывают пакет, а собираются в report.
+    В обработке одновременно находится не больше concurrency * 2 элементов,
+    поэтому входной итератор не материализуется целиком.
+    """
+
+    def __init__(
+        self, func, items, concurrency=DEFAULT_CONCURRENCY, rate_limit=None
+    ):
+        """
+        :param func: Функция обработки одного элемента.
+        :param items: Итерируемый набор элементов (может быть генератором).
+        :param concurrency: Число потоков.
+        :param rate_limit: Максимум операций в секунду (None - без ограничения).
+        """
+        self.func = func
+        self.items = items
+        self.concurrency = concurrency
+        self.rate_limiter = RateLimiter(rate_limit)
+        self.report = BulkReport()
+
+    def __iter__(self):
+        items = enumerate(self.items)
+        window = self.concurrency * 2
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            in_flight = {}
+            for index, item in items:
+                in_flight[executor.submit(self._run, item)] = (index, item)
+                if len(in_flight) >= window:
+                    yield from self._drain(in_flight, FIRST_COMPLETED)
+            while in_flight:
+                yield from self._drain(in_flight, FIRST_COMPLETED)
+        self.report.finished_at = time.monotonic()
+
+    def run(self):
+        """
+        Выполнение всей операции без потоковой обработки результатов.
+        :return: BulkReport.
+        """
+        for _ in self:
+            pass
+        return self.report
+
+    def _run(self, item):
+        self.rate_limiter.acquire()
+        return self.func(item)
+
+    def _drain(self, in_flight, return_when):
+        done, _ = wait(in_flight, return_when=return_when)
+        for future in done:
+            index, item = in_flight.pop(future)
+            error = future.exception()
+            item_result = BulkItemResult(
+                index, item,
+                result=None if error else future.result(),
+                error=error
+            )
+            self.report.add(item_result)
+            yield item_result
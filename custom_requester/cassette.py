@@ -0,0 +1,236 @@
+import hashlib
+import json
+import os
+import re
+from collections import defaultdict
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from requests import Response
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+from resources.cassette_settings import CassetteSettings
+
+# Поля тела запроса, которые генерируются случайно и не участвуют в сопоставлении
+DEFAULT_IGNORE_FIELDS = (
+    "password", "passwordRepeat", "fullName", "name", "price", "description"
+)
+# Поля, которые сопоставляются по хэшу значения после замены шаблонов:
+# логины разных учетных записей получают разные ключи, а сгенерированные
+# email (kek...@gmail.com) - один общий
+DEFAULT_HASHED_FIELDS = ("email",)
+# Шаблоны изменчивых значений в URL и теле: email из DataGenerator
+# (название фильма с уникальным суффиксом входит в DEFAULT_IGNORE_FIELDS)
+DEFAULT_PATTERNS = (
+    (r"kek[a-z0-9]+@gmail\.com", "<email>"),
+)
+IGNORED_VALUE = "<ignored>"
+# Заголовки ответа, которые не сохраняются в кассету
+SKIPPED_RESPONSE_HEADERS = {"set-cookie", "content-encoding", "transfer-encoding"}
+
+
+class Cassette:
+    """
+    Кассета для записи и воспроизведения HTTP-взаимодействий.
+    В режиме record пары запрос/ответ дописываются в JSONL-файл,
+    в режиме replay ответы отдаются из индекса в памяти без сетевых запросов.
+    """
+
+    MODES = ("off", "record", "replay")
+
+    def __init__(
+        self, path, mode="replay", ignore_fields=DEFAULT_IGNORE_FIELDS,
+        patterns=DEFAULT_PATTERNS, hashed_fields=DEFAULT_HASHED_FIELDS
+    ):
+        """
+        Инициализация кассеты.
+        :param path: Путь к JSONL-файлу кассеты.
+        :param mode: Режим работы: record или replay.
+        :param ignore_fields: Поля JSON-тела, не участвующие в сопоставлении.
+        :param patterns: Пары (регулярное выражение, замена) для изменчивых значений.
+        :param hashed_fields: Поля JSON-тела, сопоставляемые по хэшу значения.
+        """
+        if mode not in self.MODES:
+            raise ValueError(
+                f'Unknown cassette mode: {mode}. Expected one of: {self.MODES}'
+            )
+        self.path = path
+        self.mode = mode
+        self.ignore_fields = set(ignore_fields)
+        self.hashed_fields = set(hashed_fields)
+        self.patterns = [
+            (re.compile(pattern), replacement)
+            for pattern, replacement in patterns
+        ]
+        self._file = None
+        self._index = defaultdict(list)
+        self._positions = defaultdict(int)
+        if self.mode == "replay":
+            self._load()
+
+    @classmethod
+    def from_env(cls):
+        """
+        Создание кассеты по настройкам CASSETTE_MODE и CASSETTE_PATH.
+        :return: Объект Cassette или None, если кассета выключена.
+        """
+        if CassetteSettings.MODE == "off":
+            return None
+        return cls(CassetteSettings.PATH, mode=CassetteSettings.MODE)
+
+    def mount(self, session):
+        """
+        Подключение кассеты к HTTP-сессии.
+        Кассета оборачивает каждый уже подключенный адаптер сессии,
+        в режиме record запросы уходят через него (и его пул соединений).
+        :param session: Объект requests.Session.
+        """
+        for prefix, adapter in list(session.adapters.items()):
+            if not isinstance(adapter, CassetteAdapter):
+                session.mount(prefix, CassetteAdapter(self, adapter))
+        return session
+
+    def match_key(self, method, url, body):
+        """
+        Ключ сопоставления запроса: метод + URL + каноническое тело.
+        :param method: HTTP метод.
+        :param url: Полный URL запроса.
+        :param body: Тело запроса (bytes, str или None).
+        """
+        key = f"{method.upper()} {self._canonical_url(url)} {self._canonical_body(body)}"
+        for pattern, replacement in self.patterns:
+            key = pattern.sub(replacement, key)
+        return key
+
+    def record(self, request, response):
+        """
+        Запись пары запрос/ответ в конец кассеты.
+        :param request: Объект requests.PreparedRequest.
+        :param response: Объект requests.Response.
+        """
+        if self._file is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._file = open(self.path, "a", encoding="utf-8")
+        entry = {
+            "key": self.match_key(request.method, request.url, request.body),
+            "method": request.method,
+            "url": request.url,
+            "status": response.status_code,
+            "headers": {
+                header: value for header, value in response.headers.items()
+                if header.lower() not in SKIPPED_RESPONSE_HEADERS
+            },
+            "content": response.content.decode("utf-8", errors="replace"),
+        }
+        self._file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._file.flush()
+        self._add_to_index(entry)
+
+    def replay(self, request):
+        """
+        Поиск записанного ответа для запроса.
+        Одинаковые запросы получают записанные ответы по порядку,
+        после исчерпания повторяется последний ответ.
+        :param request: Объект requests.PreparedRequest.
+        :return: Объект requests.Response.
+        """
+        key = self.match_key(request.method, request.url, request.body)
+        entries = self._index.get(key)
+        if not entries:
+            raise KeyError(f"Cassette has no recorded response for: {key}")
+        position = self._positions[key]
+        entry = entries[min(position, len(entries) - 1)]
+        self._positions[key] = position + 1
+
+        response = Response()
+        response.status_code = entry["status"]
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        response._content = entry["content"].encode("utf-8")
+        response.encoding = "utf-8"
+        response.url = request.url
+        response.request = request
+        response.reason = "REPLAYED"
+        return response
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, encoding="utf-8") as file:
+            for line in file:
+                if line.strip():
+                    self._add_to_index(json.loads(line))
+
+    def _add_to_index(self, entry):
+        self._index[entry["key"]].append(entry)
+
+    @staticmethod
+    def _canonical_url(url):
+        parts = urlsplit(url)
+        query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+        return urlunsplit(
+            (parts.scheme, parts.netloc, parts.path, query, "")
+        )
+
+    def _canonical_body(self, body):
+        if not body:
+            return ""
+        if isinstance(body, bytes):
+            body = body.decode("utf-8", errors="replace")
+        try:
+            data = json.loads(body)
+        except ValueError:
+            return body
+        return json.dumps(
+            self._mask(data), sort_keys=True, ensure_ascii=False,
+            separators=(",", ":")
+        )
+
+    def _mask(self, data):
+        if isinstance(data, dict):
+            return {
+                key: IGNORED_VALUE if key in self.ignore_fields
+                else self._hash(value) if key in self.hashed_fields
+                else self._mask(value)
+                for key, value in data.items()
+            }
+        if isinstance(data, list):
+            return [self._mask(item) for item in data]
+        return data
+
+    def _hash(self, value):
+        text = json.dumps(value, sort_keys=True, ensure_ascii=False)
+        for pattern, replacement in self.patterns:
+            text = pattern.sub(replacement, text)
+        return f"<sha256:{hashlib.sha256(text.encode()).hexdigest()[:16]}>"
+
+
+class CassetteAdapter(BaseAdapter):
+    """
+    Транспортный адаптер requests, через который кассета записывает
+    или воспроизводит ответы для всех запросов сессии.
+    """
+
+    def __init__(self, cassette, adapter):
+        """
+        :param cassette: Объект Cassette.
+        :param adapter: Адаптер, через который выполняются реальные запросы.
+        """
+        super().__init__()
+        self.cassette = cassette
+        self.adapter = adapter
+
+    def send(self, request, **kwargs):
+        if self.cassette.mode == "replay":
+            return self.cassette.replay(request)
+        response = self.adapter.send(request, **kwargs)
+        if self.cassette.mode == "record":
+            self.cassette.record(request, response)
+        return response
+
+    def close(self):
+        self.adapter.close()
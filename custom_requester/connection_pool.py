@@ -0,0 +1,107 @@
+import logging
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from constants import POOL_CONNECTIONS, POOL_MAXSIZE, POOL_MAXSIZE_PER_HOST
+
+
+class SharedHTTPAdapter(HTTPAdapter):
+    """
+    Транспортный адаптер с пулом keep-alive соединений, общим для всех сессий.
+    Закрытие отдельной сессии не закрывает пул - для этого есть shutdown().
+    """
+
+    def close(self):
+        pass
+
+    def shutdown(self):
+        super().close()
+
+    def stats(self):
+        """
+        Счетчики соединений по хостам.
+        :return: Словарь {host: {"opened": ..., "requests": ..., "reused": ...}}.
+        """
+        result = {}
+        pools = self.poolmanager.pools
+        for key in pools.keys():
+            pool = pools[key]
+            host_stats = result.setdefault(
+                pool.host, {"opened": 0, "requests": 0, "reused": 0}
+            )
+            host_stats["opened"] += pool.num_connections
+            host_stats["requests"] += pool.num_requests
+            host_stats["reused"] += max(
+                pool.num_requests - pool.num_connections, 0
+            )
+        return result
+
+
+class ConnectionPoolRegistry:
+    """
+    Реестр общих пулов соединений процесса.
+    Для каждого хоста из host_maxsize создается отдельный адаптер со своим
+    размером пула, остальные хосты обслуживает адаптер по умолчанию.
+    """
+
+    def __init__(
+        self, pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE,
+        host_maxsize=None
+    ):
+        """
+        :param pool_connections: Число хостов, для которых хранятся пулы.
+        :param pool_maxsize: Число keep-alive соединений на хост.
+        :param host_maxsize: Размер пула для отдельных хостов, {base_url: maxsize}.
+        """
+        self.default_adapter = SharedHTTPAdapter(
+            pool_connections=pool_connections, pool_maxsize=pool_maxsize
+        )
+        self.host_adapters = {
+            prefix: SharedHTTPAdapter(pool_connections=1, pool_maxsize=maxsize)
+            for prefix, maxsize in (host_maxsize or {}).items()
+        }
+        self.logger = logging.getLogger(__name__)
+
+    def new_session(self):
+        """
+        Создание HTTP-сессии поверх общих пулов соединений.
+        Заголовки и cookies у каждой сессии свои.
+        :return: Объект requests.Session.
+        """
+        session = requests.Session()
+        session.mount("https://", self.default_adapter)
+        session.mount("http://", self.default_adapter)
+        for prefix, adapter in self.host_adapters.items():
+            session.mount(prefix, adapter)
+        return session
+
+    def stats(self):
+        """
+        Суммарные счетчики открытых и переиспользованных соединений по хостам.
+        """
+        result = {}
+        for adapter in (self.default_adapter, *self.host_adapters.values()):
+            for host, host_stats in adapter.stats().items():
+                total = result.setdefault(
+                    host, {"opened": 0, "requests": 0, "reused": 0}
+                )
+                for name, value in host_stats.items():
+                    total[name] += value
+        return result
+
+    def log_stats(self):
+        for host, host_stats in self.stats().items():
+            self.logger.info(
+                f"Connection pool {host}: opened={host_stats['opened']} "
+                f"reused={host_stats['reused']} requests={host_stats['requests']}"
+            )
+
+    def close(self):
+        for adapter in (self.default_adapter, *self.host_adapters.values()):
+            adapter.shutdown()
+
+
+shared_connection_pool = ConnectionPoolRegistry(
+    host_maxsize=POOL_MAXSIZE_PER_HOST
+)
@@ -1,10 +1,7 @@
-import json
 import logging
-import os
 
-from pydantic import BaseModel
-
-from constants import GREEN, RED, RESET
+from custom_requester.body_encoder import prepare_body
+from custom_requester.request_logger import request_log_pipeline
 
 
 class CustomRequester:
@@ -17,18 +14,30 @@ class CustomRequester:
         "Accept": "application/json"
     }
 
-    def __init__(self, session, base_url):
+    def __init__(
+        self, session, base_url, auth_headers=None, cache=None,
+        retry_policy=None
+    ):
         """
         Инициализация кастомного реквестера.
         :param session: Объект requests.Session.
         :param base_url: Базовый URL API.
+        :param auth_headers: Заголовки авторизации пользователя, которые
+            добавляются к каждому запросу (общие для API-классов ApiManager).
+        :param cache: Объект ResponseCache для ответов GET-запросов (опционально).
+        :param retry_policy: Объект RetryPolicy для повтора запросов (опционально).
         """
         self.session = session
         self.base_url = base_url
+        self.auth_headers = auth_headers if auth_headers is not None else {}
+        self.cache = cache
+        self.retry_policy = retry_policy
         self.session.headers = self.base_headers.copy()
         # self.headers = self.base_headers.copy()
         self.logger = logging.getLogger(__name__)
-        self.logger.setLevel(logging.INFO)
+        # Уровень выставляется один раз, чтобы его можно было понизить снаружи
+        if self.logger.level == logging.NOTSET:
+            self.logger.setLevel(logging.INFO)
 
     def send_request(
         self, method, endpoint,
@@ -39,40 +48,157 @@ class CustomRequester:
         Универсальный метод для отправки запросов.
         :param method: HTTP метод (GET, POST, PUT, DELETE и т.д.).
         :param endpoint: Эндпоинт (например, "/login").
-        :param data: Тело запроса (JSON-данные).
+        :param data: Тело запроса (dict, pydantic BaseModel или готовые bytes).
         :param expected_status: Ожидаемый статус-код (по умолчанию 200).
         :param need_logging: Флаг для логирования (по умолчанию True).
         :param params: Фильтр запросов (по умолчанию None).
         :return: Объект ответа requests.Response.
         """
         url = f"{self.base_url}{endpoint}"
-        if isinstance(data, BaseModel):
-            data = json.loads(data.model_dump_json(exclude_unset=True))
+        data, headers = self._prepare_request(data, headers, token)
+
+        cache_key = None
+        if self.cache is not None and method.upper() == "GET":
+            cache_key = self.cache.make_key(
+                method, url, params, self._authorization(headers)
+            )
+            cached_response = self.cache.get(cache_key)
+            if cached_response is not None:
+                self._check_status(cached_response, expected_status)
+                return cached_response
+
+        response = self._request_with_retries(
+            method, url, data, params, headers, expected_status
+        )
+        if need_logging:
+            self.log_request_and_response(
+                response, endpoint=endpoint, expected_status=expected_status
+            )
+        self._check_status(response, expected_status)
+        if cache_key is not None and response.status_code == 200:
+            self.cache.set(cache_key, response)
+
+        return response
+
+    def _request_with_retries(
+        self, method, url, data, params, headers, expected_status
+    ):
+        """
+        Выполнение запроса с повторами по политике retry_policy.
+        Ответ с ожидаемым статус-кодом не повторяется.
+        """
+        policy = self.retry_policy
+        attempt = 0
+        while True:
+            try:
+                response = self.session.request(
+                    method, url, params=params, headers=headers,
+                    **self._body_kwargs(data)
+                )
+            except Exception as error:
+                if policy is None or not policy.should_retry(
+                    method, headers, attempt, error=error
+                ):
+                    raise
+                policy.wait(method, url, attempt, error=error)
+                attempt += 1
+                continue
+            if policy is None or self._is_expected_status(
+                response.status_code, expected_status
+            ) or not policy.should_retry(
+                method, headers, attempt, response=response
+            ):
+                return response
+            policy.wait(method, url, attempt, response=response)
+            response.close()
+            attempt += 1
+
+    def _authorization(self, headers):
+        """
+        Заголовок Authorization, с которым уйдет запрос.
+        """
+        if headers and "Authorization" in headers:
+            return headers["Authorization"]
+        return self.session.headers.get("Authorization")
+
+    def _invalidate_cache(self, *endpoints):
+        """
+        Удаление из кэша ответов для эндпоинтов после изменения данных.
+        :param endpoints: Эндпоинты (например, "/movies", "/movies/1").
+        """
+        if self.cache is None:
+            return
+        for endpoint in endpoints:
+            self.cache.invalidate(f"{self.base_url}{endpoint}")
+
+    def _prepare_request(self, data, headers, token):
+        """
+        Подготовка тела и заголовков запроса.
+        Модели сериализуются сразу в bytes и отправляются без повторного
+        кодирования, готовые bytes передаются как есть.
+        :param data: Тело запроса (dict, pydantic BaseModel или bytes).
+        :param headers: Дополнительные заголовки запроса.
+        :param token: Токен для заголовка Authorization.
+        :return: Кортеж (data, headers).
+        """
+        data = prepare_body(data)
+        if self.auth_headers:
+            headers = {**self.auth_headers, **(headers or {})}
         if token is not None:
             if headers is None:
                 headers = {}
             headers["Authorization"] = f"Bearer {token}"
+        if isinstance(data, bytes) and not (
+            headers and "Content-Type" in headers
+        ):
+            headers = {**(headers or {}), "Content-Type": "application/json"}
+        return data, headers
 
-        response = self.session.request(
-            method, url, json=data, params=params,
-            headers=headers
-        )
-        if need_logging:
-            self.log_request_and_response(response)
+    @staticmethod
+    def _body_kwargs(data):
+        """
+        Аргумент тела для session.request: готовые bytes уходят как есть,
+        dict сериализует HTTP-клиент.
+        """
+        if isinstance(data, bytes):
+            return {"data": data}
+        return {"json": data}
+
+    def _set_auth_token(self, token):
+        """
+        Сохранение токена пользователя для последующих запросов.
+        Заголовки сессии не изменяются, поэтому сессию и пул соединений
+        можно разделять между пользователями.
+        :param token: Токен доступа.
+        """
+        self.auth_headers["Authorization"] = f"Bearer {token}"
+
+    @staticmethod
+    def _check_status(response, expected_status):
+        """
+        Проверка статус-кода ответа.
+        :param response: Объект ответа.
+        :param expected_status: Ожидаемый статус-код или список статус-кодов.
+        """
+        if CustomRequester._is_expected_status(
+            response.status_code, expected_status
+        ):
+            return
         if isinstance(expected_status, (list, tuple)):
-            if response.status_code not in expected_status:
-                raise ValueError(
-                    f'Unexpected status code: {response.status_code}. '
-                    f'Expected one of: {expected_status}'
-                )
-        else:
-            if response.status_code != expected_status:
-                raise ValueError(
-                    f'Unexpected status code: {response.status_code}. '
-                    f'Expected: {expected_status}'
-                )
+            raise ValueError(
+                f'Unexpected status code: {response.status_code}. '
+                f'Expected one of: {expected_status}'
+            )
+        raise ValueError(
+            f'Unexpected status code: {response.status_code}. '
+            f'Expected: {expected_status}'
+        )
 
-        return response
+    @staticmethod
+    def _is_expected_status(status_code, expected_status):
+        if isinstance(expected_status, (list, tuple)):
+            return status_code in expected_status
+        return status_code == expected_status
 
     def _update_session_headers(self, **kwargs):
         """
@@ -141,40 +267,22 @@ class CustomRequester:
     #     except Exception as e:
     #         self.logger.error(f"\nLogging failed: {type(e)} - {e}")
 
-    def log_request_and_response(self, response):
+    def log_request_and_response(
+        self, response, endpoint=None, expected_status=None
+    ):
         """
         Логгирование запросов и ответов. Настройки логгирования описаны в pytest.ini
-        Преобразует вывод в curl-like (-H хэдэеры), (-d тело)
+        Преобразует вывод в curl-like (-H хэдэеры), (-d тело).
+        Запись формируется лениво - только если логгер пропускает уровень INFO
+        и запрос прошел семплирование (неуспешные запросы логируются всегда).
 
         :param response: Объект response получаемый из метода "send_request"
+        :param endpoint: Эндпоинт запроса, используется для семплирования.
+        :param expected_status: Ожидаемый статус-код, для определения ошибки.
         """
-        try:
-            request = response.request
-            headers = " \\\n".join(
-                [f"-H '{header}: {value}'" for header, value in request.headers.items()])
-            full_test_name = f"pytest {os.environ.get('PYTEST_CURRENT_TEST', '').replace(' (call)', '')}"
-
-            body = ""
-            if hasattr(request, 'body') and request.body is not None:
-                if isinstance(request.body, bytes):
-                    body = request.body.decode('utf-8')
-                elif isinstance(request.body, str):
-                    body = request.body
-                body = f"-d '{body}' \n" if body != '{}' else ''
-
-            self.logger.info(
-                f"{GREEN}{full_test_name}{RESET}\n"
-                f"curl -X {request.method} '{request.url}' \\\n"
-                f"{headers} \\\n"
-                f"{body}"
-            )
-
-            response_status = response.status_code
-            is_success = response.ok
-            response_data = response.text
-            if not is_success:
-                self.logger.info(f"\tRESPONSE:"
-                                 f"\nSTATUS_CODE: {RED}{response_status}{RESET}"
-                                 f"\nDATA: {RED}{response_data}{RESET}")
-        except Exception as e:
-            self.logger.info(f"\nLogging went wrong: {type(e)} - {e}")
+        failed = expected_status is not None and not self._is_expected_status(
+            response.status_code, expected_status
+        )
+        request_log_pipeline.submit(
+            response, response.request.method, endpoint, failed
+        )
@@ -0,0 +1,206 @@
+import itertools
+import json
+import logging
+import os
+import queue
+import re
+from logging.handlers import QueueHandler, QueueListener
+
+from constants import GREEN, RED, RESET
+from resources.log_settings import LogSettings
+
+# Числовые и uuid-сегменты эндпоинта не влияют на ключ семплирования
+ENDPOINT_ID_PATTERN = re.compile(r"[0-9a-fA-F]{8}-[0-9a-fA-F-]{27}|\d+")
+
+
+class RequestLogRecord:
+    """
+    Компактная запись о запросе и ответе.
+    На горячем пути сохраняются только ссылки на объекты, а curl-строка
+    и данные ответа формируются при выводе записи обработчиком.
+    """
+
+    __slots__ = ("response", "test_name", "failed")
+
+    def __init__(self, response, test_name, failed):
+        self.response = response
+        self.test_name = test_name
+        self.failed = failed
+
+    def render(self):
+        """
+        Преобразует запись в curl-like вывод (-H хэдэеры), (-d тело).
+        """
+        try:
+            request = self.response.request
+            headers = " \\\n".join(
+                [f"-H '{header}: {value}'" for header, value in request.headers.items()])
+            full_test_name = f"pytest {self.test_name.replace(' (call)', '')}"
+
+            # requests.PreparedRequest хранит тело в body, httpx.Request - в content
+            raw_body = getattr(request, 'body', None)
+            if raw_body is None:
+                raw_body = getattr(request, 'content', None)
+
+            body = ""
+            if raw_body:
+                if isinstance(raw_body, bytes):
+                    body = raw_body.decode('utf-8')
+                elif isinstance(raw_body, str):
+                    body = raw_body
+                body = f"-d '{body}' \n" if body != '{}' else ''
+
+            message = (
+                f"{GREEN}{full_test_name}{RESET}\n"
+                f"curl -X {request.method} '{request.url}' \\\n"
+                f"{headers} \\\n"
+                f"{body}"
+            )
+
+            response_status = self.response.status_code
+            if self.failed or response_status >= 400:
+                response_data = self._pretty_json(self.response.text)
+                message += (f"\n\tRESPONSE:"
+                            f"\nSTATUS_CODE: {RED}{response_status}{RESET}"
+                            f"\nDATA: {RED}{response_data}{RESET}")
+            return message
+        except Exception as e:
+            return f"\nLogging went wrong: {type(e)} - {e}"
+
+    @staticmethod
+    def _pretty_json(text):
+        """
+        Форматирование JSON с отступами, не-JSON текст возвращается как есть.
+        """
+        try:
+            return json.dumps(json.loads(text), indent=4, ensure_ascii=False)
+        except ValueError:
+            return text
+
+    def __str__(self):
+        # Через вызов метода, а не __str__ = render, чтобы подмена render
+        # (например, в тестах) действовала и при выводе записи
+        return self.render()
+
+
+class RequestLogSampler:
+    """
+    Семплирование логов: ошибки логируются всегда,
+    успешные запросы - каждый N-й на эндпоинт.
+    """
+
+    def __init__(self, default_rate=1, rates=None):
+        """
+        :param default_rate: Частота семплирования успешных запросов по умолчанию.
+        :param rates: Частоты для отдельных эндпоинтов, например {"/movies": 100}.
+        """
+        self.configure(default_rate, rates)
+
+    def configure(self, default_rate=1, rates=None):
+        self.default_rate = default_rate
+        # Ключи частот приводятся к тому же виду, что и ключи счетчиков:
+        # "/movies/{id}" и "/movies/1" задают частоту для всех ID
+        self.rates = {
+            self.normalize_endpoint(endpoint): rate
+            for endpoint, rate in (rates or {}).items()
+        }
+        self._counters = {}
+
+    @staticmethod
+    def normalize_endpoint(endpoint):
+        return ENDPOINT_ID_PATTERN.sub('{id}', str(endpoint))
+
+    def should_log(self, method, endpoint, failed):
+        if failed:
+            return True
+        endpoint = self.normalize_endpoint(endpoint)
+        rate = self.rates.get(endpoint, self.default_rate)
+        if rate <= 1:
+            return True
+        key = f"{method} {endpoint}"
+        counter = self._counters.get(key)
+        if counter is None:
+            counter = self._counters.setdefault(key, itertools.count())
+        return next(counter) % rate == 0
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """
+    QueueHandler, который не форматирует запись в вызывающем потоке:
+    сообщение формируется уже в фоновом потоке обработчиками листенера.
+    """
+
+    def prepare(self, record):
+        return record
+
+
+class RequestLogPipeline:
+    """
+    Конвейер логирования запросов: проверка уровня логгера, семплирование
+    и, опционально, вывод через очередь в фоновом потоке.
+    """
+
+    def __init__(self, logger, sampler):
+        self.logger = logger
+        self.sampler = sampler
+        self._listener = None
+        self._queue_handler = None
+
+    def submit(self, response, method, endpoint=None, failed=False):
+        """
+        Регистрация запроса для логирования.
+        :param response: Объект ответа.
+        :param method: HTTP метод запроса.
+        :param endpoint: Эндпоинт запроса (ключ семплирования).
+        :param failed: Признак неуспешного запроса (такие логируются всегда).
+        """
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        if not self.sampler.should_log(method, endpoint, failed):
+            return
+        self.logger.info(RequestLogRecord(
+            response, os.environ.get('PYTEST_CURRENT_TEST', ''), failed
+        ))
+
+    def start_background(self):
+        """
+        Перенос вывода логов в фоновый поток: записи попадают в очередь,
+        а форматируются и выводятся обработчиками корневого логгера.
+        """
+        if self._listener is not None:
+            return
+        log_queue = queue.SimpleQueue()
+        self._queue_handler = _DeferredQueueHandler(log_queue)
+        self._listener = QueueListener(
+            log_queue, _RootDispatchHandler(), respect_handler_level=False
+        )
+        self.logger.addHandler(self._queue_handler)
+        self.logger.propagate = False
+        self._listener.start()
+
+    def stop_background(self):
+        """
+        Остановка фонового потока с выводом всех накопленных записей.
+        """
+        if self._listener is None:
+            return
+        self._listener.stop()
+        self.logger.removeHandler(self._queue_handler)
+        self.logger.propagate = True
+        self._listener = None
+        self._queue_handler = None
+
+
+class _RootDispatchHandler(logging.Handler):
+    """
+    Передача записи из фонового потока обработчикам корневого логгера.
+    """
+
+    def emit(self, record):
+        logging.getLogger().callHandlers(record)
+
+
+request_log_pipeline = RequestLogPipeline(
+    logging.getLogger("custom_requester.custom_requester"),
+    RequestLogSampler(default_rate=LogSettings.SUCCESS_SAMPLE_RATE)
+)
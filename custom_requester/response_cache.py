@@ -0,0 +1,116 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+
+class ResponseCache:
+    """
+    LRU-кэш ответов идемпотентных GET-запросов с ограничением по времени жизни.
+    Ключ: метод + URL + параметры + идентичность авторизации.
+    """
+
+    def __init__(self, maxsize=256, ttl=60):
+        """
+        :param maxsize: Максимальное число ответов в кэше.
+        :param ttl: Время жизни ответа в секундах.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._keys_by_url = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def make_key(method, url, params=None, authorization=None):
+        """
+        Формирование ключа кэша.
+        :param method: HTTP метод.
+        :param url: URL запроса без query-параметров.
+        :param params: Параметры запроса (None-значения не учитываются).
+        :param authorization: Значение заголовка Authorization.
+        """
+        if params:
+            params = tuple(sorted(
+                (str(key), str(value)) for key, value in params.items()
+                if value is not None
+            ))
+        identity = None
+        if authorization:
+            identity = hashlib.sha1(authorization.encode()).hexdigest()
+        return method.upper(), url, params or (), identity
+
+    def get(self, key):
+        """
+        Получение ответа из кэша.
+        :return: Объект ответа или None при промахе.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, response = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                self.evictions += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return response
+
+    def set(self, key, response):
+        """
+        Сохранение ответа в кэш с вытеснением самых старых записей.
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+            self._entries[key] = (time.monotonic() + self.ttl, response)
+            self._keys_by_url.setdefault(key[1], set()).add(key)
+            while len(self._entries) > self.maxsize:
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                self.evictions += 1
+
+    def invalidate(self, url):
+        """
+        Удаление из кэша всех ответов для URL (с любыми параметрами
+        и для любых пользователей).
+        :param url: URL запроса без query-параметров.
+        """
+        with self._lock:
+            for key in self._keys_by_url.pop(url, ()):
+                if self._entries.pop(key, None) is not None:
+                    self.invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_url.clear()
+
+    def stats(self):
+        """
+        Статистика кэша: попадания, промахи, вытеснения и инвалидации.
+        """
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+    def _remove(self, key):
+        self._entries.pop(key, None)
+        keys = self._keys_by_url.get(key[1])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_url[key[1]]
@@ -0,0 +1,140 @@
+import email.utils
+import logging
+import random
+import threading
+import time
+
+import requests
+
+# Методы, повтор которых не меняет состояние на сервере
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+RETRY_EXCEPTIONS = (requests.ConnectionError, requests.Timeout)
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+
+
+class RetryPolicy:
+    """
+    Политика повторов запросов: экспоненциальная задержка с джиттером,
+    учет Retry-After и общий бюджет повторов на сессию.
+    Повторяются только идемпотентные методы и запросы с Idempotency-Key.
+    """
+
+    def __init__(
+        self, max_retries=3, backoff_factor=0.5, max_backoff=30,
+        retry_statuses=RETRY_STATUSES, retry_exceptions=RETRY_EXCEPTIONS,
+        methods=IDEMPOTENT_METHODS, total_budget=100, sleep=time.sleep
+    ):
+        """
+        :param max_retries: Максимальное число повторов одного запроса.
+        :param backoff_factor: Базовая задержка в секундах.
+        :param max_backoff: Максимальная задержка между попытками.
+        :param retry_statuses: Статус-коды, при которых запрос повторяется.
+        :param retry_exceptions: Исключения, при которых запрос повторяется.
+        :param methods: Методы, которые можно повторять.
+        :param total_budget: Общее число повторов на всю сессию.
+        :param sleep: Функция ожидания (подменяется в тестах).
+        """
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_exceptions = tuple(retry_exceptions)
+        self.methods = frozenset(method.upper() for method in methods)
+        self.total_budget = total_budget
+        self.sleep = sleep
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self.retries = 0
+        self.retried_requests = 0
+        self.exhausted = 0
+        self.budget_exhausted = 0
+
+    def is_retryable_method(self, method, headers=None):
+        """
+        Можно ли повторять запрос: идемпотентный метод или Idempotency-Key.
+        """
+        if method.upper() in self.methods:
+            return True
+        return bool(headers) and IDEMPOTENCY_HEADER in headers
+
+    def should_retry(self, method, headers, attempt, response=None, error=None):
+        """
+        Решение о повторе очередной попытки.
+        :param method: HTTP метод.
+        :param headers: Заголовки запроса.
+        :param attempt: Номер выполненной попытки, начиная с 0.
+        :param response: Полученный ответ (если есть).
+        :param error: Возникшее исключение (если есть).
+        """
+        if error is not None:
+            if not isinstance(error, self.retry_exceptions):
+                return False
+        elif response is None or response.status_code not in self.retry_statuses:
+            return False
+        if not self.is_retryable_method(method, headers):
+            return False
+        if attempt >= self.max_retries:
+            with self._lock:
+                self.exhausted += 1
+            return False
+        with self._lock:
+            if self.retries >= self.total_budget:
+                self.budget_exhausted += 1
+                return False
+            self.retries += 1
+            if attempt == 0:
+                self.retried_requests += 1
+        return True
+
+    def backoff(self, attempt, response=None):
+        """
+        Задержка перед следующей попыткой.
+        Если сервер прислал Retry-After, используется он,
+        иначе экспоненциальная задержка с полным джиттером.
+        """
+        retry_after = self._retry_after(response)
+        if retry_after is not None:
+            return min(retry_after, self.max_backoff)
+        return random.uniform(
+            0, min(self.max_backoff, self.backoff_factor * 2 ** attempt)
+        )
+
+    def wait(self, method, url, attempt, response=None, error=None):
+        """
+        Логирование повтора и ожидание перед следующей попыткой.
+        """
+        delay = self.backoff(attempt, response)
+        reason = response.status_code if response is not None else repr(error)
+        self.logger.warning(
+            f"Retry {attempt + 1}/{self.max_retries} {method} {url} "
+            f"after {reason}, sleep {delay:.2f}s"
+        )
+        self.sleep(delay)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "retries": self.retries,
+                "retried_requests": self.retried_requests,
+                "exhausted": self.exhausted,
+                "budget_exhausted": self.budget_exhausted,
+                "budget_left": max(self.total_budget - self.retries, 0),
+            }
+
+    @staticmethod
+    def _retry_after(response):
+        if response is None:
+            return None
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            return max(float(value), 0)
+        except ValueError:
+            pass
+        try:
+            retry_at = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return max(retry_at.timestamp() - time.time(), 0)
@@ -0,0 +1,186 @@
+import base64
+import hashlib
+import json
+import os
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class FileLock:
+    """
+    Межпроцессная блокировка на файле (fcntl в Linux/macOS, msvcrt в Windows).
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = None
+
+    def __enter__(self):
+        self._file = open(self.path, "a+")
+        if fcntl is not None:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+        else:
+            self._file.seek(0)
+            msvcrt.locking(self._file.fileno(), msvcrt.LK_LOCK, 1)
+        return self
+
+    def __exit__(self, *exc_info):
+        if fcntl is not None:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+        else:
+            self._file.seek(0)
+            msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+        self._file.close()
+        self._file = None
+
+
+def jwt_expires_at(token):
+    """
+    Время истечения JWT из поля exp (без проверки подписи).
+    :return: Unix-время или None, если токен не JWT или exp нет.
+    """
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        return float(json.loads(base64.urlsafe_b64decode(payload))["exp"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+class TokenCache:
+    """
+    Кэш ответов логина по учетным данным.
+    Токены хранятся в памяти процесса и, если задан path, в файле,
+    общем для воркеров pytest-xdist. Потоки и воркеры ждут друг друга
+    только при логине под одними учетными данными, блокировка общего
+    хранилища держится лишь на время его чтения и записи.
+    """
+
+    def __init__(self, path=None, refresh_margin=60, default_ttl=3600):
+        """
+        :param path: Путь к JSON-файлу общего хранилища (None - только память).
+        :param refresh_margin: За сколько секунд до exp токен обновляется.
+        :param default_ttl: Время жизни токена без поля exp, в секундах.
+        """
+        self.path = path
+        self.refresh_margin = refresh_margin
+        self.default_ttl = default_ttl
+        self._memory = {}
+        self._lock = threading.Lock()
+        self._key_locks = {}
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(user_creds):
+        """
+        Ключ кэша по учетным данным (email, password).
+        """
+        email, password = user_creds
+        return hashlib.sha256(f"{email}:{password}".encode()).hexdigest()
+
+    def get_or_login(self, user_creds, login, persist=True):
+        """
+        Получение ответа логина из кэша или выполнение логина.
+        :param user_creds: Кортеж (email, password).
+        :param login: Функция без аргументов, выполняющая логин
+            и возвращающая JSON-ответ с accessToken.
+        :param persist: Сохранять токен в общем файле. False - для
+            временных пользователей (например, из пула), чей токен
+            не нужен другим воркерам.
+        :return: JSON-ответ логина.
+        """
+        key = self.make_key(user_creds)
+        with self._key_lock(key):
+            entry = self._memory.get(key)
+            if self._is_fresh(entry):
+                self._count("hits")
+                return entry["response"]
+            if not persist or self.path is None:
+                return self._login(key, login)
+
+            # Блокировка на учетные данные держится на время повторной
+            # проверки, логина и записи: воркеры, стартующие одновременно,
+            # логинятся под одним аккаунтом один раз, под разными - параллельно
+            with FileLock(f"{self.path}.{key}.lock"):
+                with FileLock(f"{self.path}.lock"):
+                    entry = self._read_store().get(key)
+                if self._is_fresh(entry):
+                    self._memory[key] = entry
+                    self._count("disk_hits")
+                    return entry["response"]
+                return self._login(key, login, shared=True)
+
+    def invalidate(self, user_creds):
+        key = self.make_key(user_creds)
+        with self._key_lock(key):
+            self._memory.pop(key, None)
+            if self.path is not None:
+                with FileLock(f"{self.path}.lock"):
+                    store = self._read_store()
+                    if store.pop(key, None) is not None:
+                        self._write_store(store)
+
+    def hit_rate(self):
+        total = self.hits + self.disk_hits + self.misses
+        return (self.hits + self.disk_hits) / total if total else 0.0
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hit_rate(), 3),
+        }
+
+    def _login(self, key, login, shared=False):
+        response = login()
+        entry = self._make_entry(response)
+        if shared:
+            with FileLock(f"{self.path}.lock"):
+                store = self._read_store()
+                store[key] = entry
+                self._write_store(store)
+        self._memory[key] = entry
+        self._count("misses")
+        return response
+
+    def _key_lock(self, key):
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def _count(self, counter):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def _make_entry(self, response):
+        expires_at = jwt_expires_at(response["accessToken"])
+        if expires_at is None:
+            expires_at = time.time() + self.default_ttl
+        return {"expires_at": expires_at, "response": response}
+
+    def _is_fresh(self, entry):
+        return (
+            entry is not None
+            and entry["expires_at"] - self.refresh_margin > time.time()
+        )
+
+    def _read_store(self):
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                return json.load(file)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def _write_store(self, store):
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(store, file)
+        os.replace(temp_path, self.path)
@@ -0,0 +1,247 @@
+import csv
+import datetime
+import io
+import itertools
+import logging
+import random
+import time
+import uuid
+
+from sqlalchemy import delete, insert
+
+from constants import DB_BULK_BATCH_SIZE
+from db_requester.db_session import get_engine
+from db_requester.models import (AccountTransactionTemplate, MovieDBModel,
+                                 UserDBModel)
+from utils.data_generator import DataGenerator
+from utils.unique_id import unique_id_generator, unique_id_str
+
+# Колонка, в начало значения которой записывается тег прогона
+RUN_TAG_COLUMNS = {
+    UserDBModel.__table__: UserDBModel.__table__.c.email,
+    MovieDBModel.__table__: MovieDBModel.__table__.c.name,
+    AccountTransactionTemplate.__table__: AccountTransactionTemplate.__table__.c.user,
+}
+
+
+def new_run_id():
+    """
+    Уникальный ID прогона для тегирования сгенерированных строк.
+    """
+    return f"seed{unique_id_str()}"
+
+
+def _batches(rows, size):
+    rows = iter(rows)
+    while batch := list(itertools.islice(rows, size)):
+        yield batch
+
+
+def _utc_now():
+    # created_at в БД хранится в UTC без часового пояса, как у записей API
+    return datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+
+
+def _batch_seed(seed, offset):
+    # Свой seed для каждой пачки, seed может быть любым значением для Random
+    return None if seed is None else f"{seed}:{offset}"
+
+
+class _CopyReader(io.TextIOBase):
+    """
+    Файлоподобный объект для COPY FROM STDIN: строки генератора
+    превращаются в CSV по мере чтения драйвером, без накопления в памяти.
+    """
+
+    def __init__(self, rows, columns):
+        self._rows = iter(rows)
+        self._columns = columns
+        self._buffer = ""
+        self.count = 0
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        chunk = io.StringIO()
+        writer = csv.writer(chunk, lineterminator="\n")
+        while size < 0 or len(self._buffer) + chunk.tell() < size:
+            row = next(self._rows, None)
+            if row is None:
+                break
+            writer.writerow([row[column] for column in self._columns])
+            self.count += 1
+        data = self._buffer + chunk.getvalue()
+        if size < 0:
+            self._buffer = ""
+            return data
+        self._buffer = data[size:]
+        return data[:size]
+
+
+class BulkLoader:
+    """
+    Пакетная загрузка тестовых данных в БД через Core, минуя ORM.
+    Строки берутся из генераторов и вставляются батчами (insert с
+    executemany) или потоком через PostgreSQL COPY FROM STDIN.
+    Все строки помечаются тегом прогона run_id, по которому cleanup()
+    удаляет их одним DELETE на таблицу.
+    """
+
+    def __init__(
+        self, engine=None, run_id=None, batch_size=DB_BULK_BATCH_SIZE,
+        method="insert"
+    ):
+        """
+        :param engine: Движок БД (по умолчанию get_engine()).
+        :param run_id: Тег прогона (по умолчанию new_run_id()).
+        :param batch_size: Число строк в одном executemany.
+        :param method: "insert" или "copy" (только PostgreSQL).
+        """
+        if method not in ("insert", "copy"):
+            raise ValueError(f"Неизвестный метод загрузки: {method}")
+        self.engine = engine or get_engine()
+        self.run_id = run_id or new_run_id()
+        self.batch_size = batch_size
+        self.method = method
+        self.loaded = {}
+        self.logger = logging.getLogger(__name__)
+
+    @property
+    def tag(self):
+        return f"{self.run_id}_"
+
+    def load(self, table, rows):
+        """
+        Загрузка строк в таблицу.
+        :param table: Таблица SQLAlchemy (Model.__table__).
+        :param rows: Итерируемый набор словарей {колонка: значение}.
+        :return: Число загруженных строк.
+        """
+        started_at = time.perf_counter()
+        with self.engine.begin() as connection:
+            if self.method == "copy":
+                count = self._copy(connection, table, rows)
+            else:
+                count = 0
+                for batch in _batches(rows, self.batch_size):
+                    connection.execute(insert(table), batch)
+                    count += len(batch)
+        elapsed = time.perf_counter() - started_at
+        self.loaded[table.name] = self.loaded.get(table.name, 0) + count
+        self.logger.info(
+            f"Bulk {self.method} {table.name}: {count} rows, {elapsed:.2f}s, "
+            f"{count / elapsed if elapsed else 0:.0f} rows/s"
+        )
+        return count
+
+    def _copy(self, connection, table, rows):
+        rows = iter(rows)
+        first = next(rows, None)
+        if first is None:
+            return 0
+        columns = list(first)
+        reader = _CopyReader(itertools.chain([first], rows), columns)
+        column_list = ", ".join(f'"{column}"' for column in columns)
+        with connection.connection.cursor() as cursor:
+            cursor.copy_expert(
+                f'COPY "{table.name}" ({column_list}) FROM STDIN WITH (FORMAT csv)',
+                reader
+            )
+        return reader.count
+
+    def user_rows(self, n, seed=None):
+        """
+        Генератор строк таблицы users, email помечен тегом прогона.
+        Данные генерируются пачками по batch_size.
+        """
+        now = _utc_now()
+        for offset in range(0, n, self.batch_size):
+            size = min(self.batch_size, n - offset)
+            users = DataGenerator.generate_users(
+                size, seed=_batch_seed(seed, offset)
+            )
+            for user in users.rows():
+                yield {
+                    "id": str(uuid.uuid4()),
+                    "email": f"{self.tag}{user['email']}",
+                    "full_name": user["fullName"],
+                    "password": user["password"],
+                    "created_at": now,
+                    "updated_at": now,
+                    "verified": user["verified"],
+                    "banned": user["banned"],
+                    "roles": "{USER}",
+                }
+
+    def movie_rows(self, n, seed=None, genre_id="1"):
+        """
+        Генератор строк таблицы movies, название помечено тегом прогона.
+        ID фильмов берутся из общего генератора уникальных ID.
+        """
+        now = _utc_now()
+        for offset in range(0, n, self.batch_size):
+            size = min(self.batch_size, n - offset)
+            movies = DataGenerator.generate_movies(
+                size, seed=_batch_seed(seed, offset)
+            )
+            ids = unique_id_generator.next_ids(size)
+            for movie_id, movie in zip(ids, movies.rows()):
+                yield {
+                    "id": str(movie_id),
+                    "name": f"{self.tag}{movie['name']}",
+                    "description": "Описание фильма",
+                    "price": movie["price"],
+                    "genre_id": genre_id,
+                    "image_url": "https://image.url",
+                    "location": movie["location"].value,
+                    "rating": 0,
+                    "published": True,
+                    "created_at": now,
+                }
+
+    def account_rows(self, n, balance=1000, seed=None):
+        """
+        Генератор строк таблицы accounts_transaction_template.
+        :param balance: Баланс счетов (None - случайный от 0 до 10000).
+        """
+        rng = random.Random(seed)
+        for index in range(n):
+            yield {
+                "user": f"{self.tag}account_{index}",
+                "balance": rng.randint(0, 10000) if balance is None else balance,
+            }
+
+    def load_users(self, n, seed=None):
+        return self.load(UserDBModel.__table__, self.user_rows(n, seed))
+
+    def load_movies(self, n, seed=None, genre_id="1"):
+        return self.load(
+            MovieDBModel.__table__, self.movie_rows(n, seed, genre_id)
+        )
+
+    def load_accounts(self, n, balance=1000, seed=None):
+        return self.load(
+            AccountTransactionTemplate.__table__,
+            self.account_rows(n, balance, seed)
+        )
+
+    def cleanup(self, run_id=None):
+        """
+        Удаление всех строк прогона одним DELETE на таблицу.
+        :param run_id: Тег другого прогона (по умолчанию текущий - тогда
+            очищаются только таблицы, в которые загружались данные).
+        :return: Словарь {таблица: число удаленных строк}.
+        """
+        tag = f"{run_id}_" if run_id else self.tag
+        deleted = {}
+        with self.engine.begin() as connection:
+            for table, column in RUN_TAG_COLUMNS.items():
+                if run_id is None and table.name not in self.loaded:
+                    continue
+                result = connection.execute(
+                    delete(table).where(column.startswith(tag, autoescape=True))
+                )
+                deleted[table.name] = result.rowcount
+        self.logger.info(f"Bulk cleanup {tag}: {deleted}")
+        return deleted
@@ -0,0 +1,208 @@
+import time
+from collections import Counter
+from enum import Enum
+
+from custom_requester.bulk import BulkOperation
+from db_requester.table_export import stream_rows
+
+
+def _enum_value(value):
+    return value.value if isinstance(value, Enum) else value
+
+
+def _optional(convert):
+    return lambda value: None if value is None else convert(value)
+
+
+# Поле API, колонка БД и приведение значения к общему виду
+MOVIE_FIELDS = (
+    ("name", "name", str),
+    ("price", "price", _optional(int)),
+    ("published", "published", _optional(bool)),
+    ("location", "location", _optional(_enum_value)),
+    ("genreId", "genre_id", _optional(str)),
+)
+USER_FIELDS = (
+    ("email", "email", str),
+    ("fullName", "full_name", str),
+    ("verified", "verified", _optional(bool)),
+    ("banned", "banned", _optional(bool)),
+)
+
+
+_MISSING = object()
+
+
+class ConsistencyReport:
+    """
+    Итог сравнения данных API и БД: ID, которых нет с одной из сторон,
+    и число расхождений по каждому полю с примерами.
+    """
+
+    def __init__(self, entity, fields, api_count, db_count, missing_in_db,
+                 missing_in_api, field_mismatches, examples, elapsed,
+                 fetch_errors=()):
+        self.entity = entity
+        self.fields = fields
+        self.api_count = api_count
+        self.db_count = db_count
+        self.missing_in_db = missing_in_db
+        self.missing_in_api = missing_in_api
+        self.field_mismatches = field_mismatches
+        self.examples = examples
+        self.elapsed = elapsed
+        # (id, ошибка) записей, которые не удалось получить из API:
+        # они не сравниваются и не считаются отсутствующими
+        self.fetch_errors = list(fetch_errors)
+
+    @property
+    def consistent(self):
+        return not (
+            self.missing_in_db or self.missing_in_api or self.field_mismatches
+            or self.fetch_errors
+        )
+
+    def __str__(self):
+        lines = [
+            f"{self.entity}: API {self.api_count}, БД {self.db_count}, "
+            f"нет в БД {len(self.missing_in_db)}, "
+            f"нет в API {len(self.missing_in_api)}, "
+            f"расхождения {dict(self.field_mismatches) or 0}, "
+            f"ошибки API {len(self.fetch_errors)} "
+            f"({self.elapsed:.2f}s)"
+        ]
+        for record_id, field, api_value, db_value in self.examples:
+            lines.append(
+                f"  id={record_id} {field}: API {api_value!r} != БД {db_value!r}"
+            )
+        for record_id, error in self.fetch_errors[:3]:
+            lines.append(f"  id={record_id} ошибка API: {error!r}")
+        return "\n".join(lines)
+
+
+def _value(record, name):
+    return record[name] if isinstance(record, dict) else getattr(record, name)
+
+
+def api_rows(records, fields, id_field="id"):
+    """
+    Записи API (модели или dict) -> пары (id, кортеж значений полей).
+    """
+    for record in records:
+        yield str(_value(record, id_field)), tuple(
+            convert(_value(record, api_field))
+            for api_field, _, convert in fields
+        )
+
+
+def db_rows(rows, fields):
+    """
+    Кортежи БД (id, колонки...) -> пары (id, кортеж значений полей).
+    """
+    converters = [convert for _, _, convert in fields]
+    for record_id, *values in rows:
+        yield str(record_id), tuple(
+            convert(value) for convert, value in zip(converters, values)
+        )
+
+
+def compare(entity, api_pairs, db_pairs, fields, max_examples=10,
+            fetch_errors=()):
+    """
+    Сравнение данных API и БД, ключ - id.
+    Записи сравниваются кортежами целиком за один поиск по словарю,
+    поля разбираются только у расходящихся записей.
+    :param api_pairs: Пары (id, кортеж значений) из API.
+    :param db_pairs: Пары (id, кортеж значений) из БД.
+    :param fields: Описание полей (MOVIE_FIELDS, USER_FIELDS).
+    :param max_examples: Сколько примеров расхождений включить в отчет.
+    :param fetch_errors: Пары (id, ошибка) незагруженных из API записей.
+    :return: ConsistencyReport.
+    """
+    started_at = time.perf_counter()
+    api = dict(api_pairs)
+    db = dict(db_pairs)
+    # Один поиск по словарю на запись: отсутствующие в БД записи
+    # тоже попадают в differing и отделяются уже в маленьком списке
+    differing = [
+        record_id for record_id, values in api.items()
+        if db.get(record_id, _MISSING) != values
+    ]
+    missing_in_db = [
+        record_id for record_id in differing if record_id not in db
+    ]
+    mismatched = [record_id for record_id in differing if record_id in db]
+    missing_in_api = [record_id for record_id in db if record_id not in api]
+
+    field_mismatches = Counter()
+    examples = []
+    names = [api_field for api_field, _, _ in fields]
+    for record_id in sorted(mismatched):
+        for name, api_value, db_value in zip(names, api[record_id], db[record_id]):
+            if api_value != db_value:
+                field_mismatches[name] += 1
+                if len(examples) < max_examples:
+                    examples.append((record_id, name, api_value, db_value))
+
+    return ConsistencyReport(
+        entity, fields, len(api), len(db), sorted(missing_in_db),
+        sorted(missing_in_api), field_mismatches, examples,
+        time.perf_counter() - started_at, fetch_errors
+    )
+
+
+def check_movies(movies_api, filters=None, where=None, engine=None,
+                 fields=MOVIE_FIELDS, max_examples=10):
+    """
+    Сравнение афиши /movies с таблицей movies.
+    Каталог API загружается постранично с конкурентной предзагрузкой
+    (MoviesAPI.iter_movies), строки БД - одним потоковым запросом.
+    :param filters: Фильтры /movies, например {"published": None}.
+    :param where: Условие для таблицы movies, соответствующее filters.
+    """
+    return compare(
+        "movies",
+        api_rows(movies_api.iter_movies(filters), fields),
+        db_rows(_stream_db("movies", fields, where, engine), fields),
+        fields, max_examples
+    )
+
+
+def check_users(user_api, where=None, engine=None, fields=USER_FIELDS,
+                concurrency=10, max_examples=10):
+    """
+    Сравнение пользователей /user/{id} с таблицей users.
+    У API нет списка пользователей, поэтому для каждого ID из БД
+    выполняется конкурентный запрос /user/{id}. Ответ 404 означает
+    отсутствие пользователя в API, остальные ошибки попадают
+    в fetch_errors отчета.
+    :param where: Условие для таблицы users (например, тег прогона).
+    """
+    rows = list(db_rows(_stream_db("users", fields, where, engine), fields))
+
+    def get_user(record_id):
+        return user_api.get_user(record_id, expected_status=[200, 404]).json()
+
+    operation = BulkOperation(
+        get_user, (record_id for record_id, _ in rows), concurrency=concurrency
+    )
+    users = []
+    fetch_errors = []
+    for result in operation:
+        if not result.ok:
+            # 5xx, таймаут или ошибка авторизации - это не отсутствие
+            # пользователя, а невозможность проверки
+            fetch_errors.append((result.item, result.error))
+        elif "id" in result.result:
+            users.append(result.result)
+    failed_ids = {record_id for record_id, _ in fetch_errors}
+    return compare(
+        "users", api_rows(users, fields),
+        [row for row in rows if row[0] not in failed_ids], fields,
+        max_examples, sorted(fetch_errors, key=lambda error: error[0])
+    )
+
+
+def _stream_db(table, fields, where, engine):
+    columns = ["id", *(column for _, column, _ in fields)]
+    return stream_rows(table, columns=columns, where=where, engine=engine)
@@ -0,0 +1,272 @@
+"""
+Сборщик осиротевших тестовых данных: пользователей и фильмов, оставшихся
+после упавших прогонов. Тестовые записи распознаются по шаблонам
+DataGenerator (email kek...@gmail.com, название фильма с меткой времени или
+hex-ID в конце) и по тегу прогона BulkLoader (seed..._).
+
+Запуск: python -m db_requester.data_gc [--tables users,movies]
+    [--via db|api] [--run-id seed...] [--older-than 60] [--dry-run]
+    [--batch-size 1000] [--concurrency 10] [--rate-limit N]
+"""
+import argparse
+import datetime
+import logging
+import re
+import time
+
+from sqlalchemy import delete, or_
+from sqlalchemy.exc import DBAPIError
+
+from constants import (DATA_GC_MIN_AGE_MINUTES, DB_BULK_BATCH_SIZE,
+                       DEFAULT_CONCURRENCY, USER_BASE_URL)
+from custom_requester.bulk import BulkOperation
+from db_requester.bulk_loader import _batches
+from db_requester.db_session import get_engine
+from db_requester.models import MovieDBModel, UserDBModel
+from db_requester.table_export import stream_rows
+
+# Модель и колонка, по значению которой распознаются тестовые записи
+GC_TAG_COLUMNS = {
+    "users": (UserDBModel, UserDBModel.email),
+    "movies": (MovieDBModel, MovieDBModel.name),
+}
+
+# Грубый отбор кандидатов в SQL, точная проверка - регулярным выражением
+GC_CANDIDATE_PATTERNS = {
+    "users": ("kek%@gmail.com", "seed%"),
+    "movies": ("seed%", "% %"),
+}
+GC_PATTERNS = {
+    "users": re.compile(r"^kek[0-9a-z]+@gmail\.com$|^seed[0-9a-f]+_"),
+    # Старые названия заканчиваются меткой времени в мс, новые - hex-ID
+    "movies": re.compile(r"^seed[0-9a-f]+_|^.+ (?:\d{13}|[0-9a-f]{12,16})$"),
+}
+
+# Статусы удаления через API, при которых запись считается удаленной
+API_DELETED_STATUSES = [200, 204, 404]
+
+
+class GCReport:
+    """
+    Итог сборки мусора по одной таблице.
+    """
+
+    def __init__(self, table, via, dry_run):
+        self.table = table
+        self.via = via
+        self.dry_run = dry_run
+        self.found = 0
+        self.deleted = 0
+        self.failed = 0
+        self.errors = []
+        self.elapsed = 0.0
+
+    @property
+    def throughput(self):
+        return self.deleted / self.elapsed if self.elapsed else 0.0
+
+    def __str__(self):
+        if self.dry_run:
+            return f"{self.table}: найдено {self.found} (dry-run)"
+        return (
+            f"{self.table} via {self.via}: найдено {self.found}, "
+            f"удалено {self.deleted}, ошибок {self.failed}, "
+            f"{self.elapsed:.2f}s, {self.throughput:.0f} записей/s"
+        )
+
+
+def utc_now():
+    """
+    Текущее время UTC без часового пояса, как created_at в БД.
+    """
+    return datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+
+
+def is_test_value(table, value):
+    """
+    Проверка, что значение колонки-тега создано тестами.
+    :param table: Имя таблицы (users, movies).
+    :param value: Email пользователя или название фильма.
+    """
+    return value is not None and GC_PATTERNS[table].search(value) is not None
+
+
+def find_orphans(table, run_id=None, older_than=DATA_GC_MIN_AGE_MINUTES,
+                 engine=None):
+    """
+    Поиск тестовых записей одним потоковым запросом.
+    :param table: Имя таблицы (users, movies).
+    :param run_id: Тег прогона BulkLoader: ищутся только его записи,
+        без учета возраста.
+    :param older_than: Минимальный возраст записи в минутах, чтобы
+        не задеть данные идущих прогонов (записи без created_at считаются
+        старыми). created_at хранится в UTC без часового пояса, поэтому
+        граница считается по UTC, а не по локальному времени раннера.
+    :return: Генератор ID найденных записей.
+    """
+    model, column = GC_TAG_COLUMNS[table]
+    if run_id:
+        where = column.startswith(f"{run_id}_", autoescape=True)
+    else:
+        cutoff = utc_now() - datetime.timedelta(minutes=older_than)
+        where = or_(
+            *(column.like(pattern) for pattern in GC_CANDIDATE_PATTERNS[table])
+        ) & or_(model.created_at.is_(None), model.created_at < cutoff)
+
+    rows = stream_rows(
+        model, columns=["id", column.key], where=where, engine=engine
+    )
+    for record_id, value in rows:
+        if run_id or is_test_value(table, value):
+            yield record_id
+
+
+def delete_via_db(table, ids, batch_size=DB_BULK_BATCH_SIZE, engine=None):
+    """
+    Пакетное удаление записей по ID: один DELETE ... WHERE id IN (...)
+    на пачку, каждая пачка в своей транзакции. Если пачку удалить
+    не удалось (например, на запись ссылается внешний ключ), ее записи
+    удаляются по одной, чтобы ошибка затронула только их.
+    :return: Генератор кортежей (удалено строк, [(ID, ошибка), ...]).
+    """
+    engine = engine or get_engine()
+    model, _ = GC_TAG_COLUMNS[table]
+
+    def delete_ids(batch):
+        with engine.begin() as connection:
+            return connection.execute(
+                delete(model).where(model.id.in_(batch))
+            ).rowcount
+
+    for batch in _batches(ids, batch_size):
+        try:
+            yield delete_ids(batch), []
+            continue
+        except DBAPIError:
+            pass
+        deleted, errors = 0, []
+        for record_id in batch:
+            try:
+                deleted += delete_ids([record_id])
+            except DBAPIError as error:
+                errors.append((record_id, error))
+        yield deleted, errors
+
+
+def delete_via_api(table, ids, api_manager, concurrency=DEFAULT_CONCURRENCY,
+                   rate_limit=None):
+    """
+    Удаление записей через API с ограничением параллелизма.
+    :param api_manager: ApiManager с правами на удаление (SUPER_ADMIN).
+    :return: BulkOperation.
+    """
+    if table == "movies":
+        return api_manager.movie_api.delete_movies_bulk(
+            ids, concurrency=concurrency, rate_limit=rate_limit,
+            expected_status=API_DELETED_STATUSES
+        )
+    return BulkOperation(
+        lambda user_id: api_manager.user_api.delete_user(
+            user_id, expected_status=API_DELETED_STATUSES
+        ),
+        ids, concurrency=concurrency, rate_limit=rate_limit
+    )
+
+
+def collect_garbage(
+    tables=tuple(GC_TAG_COLUMNS), via="db", run_id=None,
+    older_than=DATA_GC_MIN_AGE_MINUTES, dry_run=False,
+    batch_size=DB_BULK_BATCH_SIZE, concurrency=DEFAULT_CONCURRENCY,
+    rate_limit=None, engine=None, api_manager=None
+):
+    """
+    Поиск и удаление осиротевших тестовых данных.
+    :param tables: Имена таблиц (users, movies).
+    :param via: Способ удаления: db - пачками в БД, api - через API.
+    :param dry_run: Только подсчитать найденные записи.
+    :param api_manager: ApiManager для via="api".
+    :return: Список GCReport по таблицам.
+    """
+    if via == "api" and api_manager is None and not dry_run:
+        raise ValueError("Для удаления через API нужен api_manager")
+    logger = logging.getLogger(__name__)
+    reports = []
+    for table in tables:
+        report = GCReport(table, via, dry_run)
+        ids = list(find_orphans(table, run_id, older_than, engine))
+        report.found = len(ids)
+        started_at = time.perf_counter()
+        if dry_run:
+            ids = []
+        if via == "db":
+            for deleted, errors in delete_via_db(
+                table, ids, batch_size, engine
+            ):
+                report.deleted += deleted
+                report.failed += len(errors)
+                report.errors.extend(errors)
+        elif ids:
+            operation = delete_via_api(
+                table, ids, api_manager, concurrency, rate_limit
+            )
+            bulk_report = operation.run()
+            report.deleted = bulk_report.succeeded
+            report.failed = bulk_report.failed
+            report.errors = [
+                (ids[index], error) for index, error in bulk_report.errors
+            ]
+        report.elapsed = time.perf_counter() - started_at
+        logger.info(f"Data GC {report}")
+        for record_id, error in report.errors[:10]:
+            logger.warning(f"Data GC {table} id={record_id}: {error}")
+        reports.append(report)
+    return reports
+
+
+def _super_admin_api_manager():
+    from api.api_manager import ApiManager
+    from resources.user_creds import SuperAdminCreds
+
+    api_manager = ApiManager(None, USER_BASE_URL)
+    api_manager.auth_api.authenticate(
+        (SuperAdminCreds.USERNAME, SuperAdminCreds.PASSWORD)
+    )
+    return api_manager
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tables", default=",".join(GC_TAG_COLUMNS),
+                        help="Таблицы через запятую")
+    parser.add_argument("--via", default="db", choices=["db", "api"])
+    parser.add_argument("--run-id", default=None,
+                        help="Тег прогона BulkLoader (seed...)")
+    parser.add_argument("--older-than", type=int,
+                        default=DATA_GC_MIN_AGE_MINUTES,
+                        help="Минимальный возраст записей в минутах")
+    parser.add_argument("--dry-run", action="store_true")
+    parser.add_argument("--batch-size", type=int, default=DB_BULK_BATCH_SIZE)
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument("--rate-limit", type=float, default=None)
+    args = parser.parse_args(argv)
+
+    tables = args.tables.split(",")
+    unknown = set(tables) - set(GC_TAG_COLUMNS)
+    if unknown:
+        parser.error(f"Неизвестные таблицы: {', '.join(sorted(unknown))}")
+    api_manager = (
+        _super_admin_api_manager()
+        if args.via == "api" and not args.dry_run else None
+    )
+    reports = collect_garbage(
+        tables, via=args.via, run_id=args.run_id,
+        older_than=args.older_than, dry_run=args.dry_run,
+        batch_size=args.batch_size, concurrency=args.concurrency,
+        rate_limit=args.rate_limit, api_manager=api_manager
+    )
+    for report in reports:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
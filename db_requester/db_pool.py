@@ -0,0 +1,71 @@
+import threading
+import time
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    QueuePool с метриками: время получения соединения из пула,
+    ожидания при исчерпанном пуле, таймауты, число созданных соединений
+    и пиковое число одновременно занятых соединений.
+    Используется для подбора размера пула под max_connections Postgres.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._metrics_lock = threading.Lock()
+        self.checkouts = 0
+        self.checkout_time = 0.0
+        self.max_checkout_time = 0.0
+        self.exhausted_waits = 0
+        self.timeouts = 0
+        self.connections_created = 0
+        self.peak_checked_out = 0
+
+    def connect(self):
+        exhausted = self.checkedout() >= self.size() + max(self._max_overflow, 0)
+        started_at = time.perf_counter()
+        try:
+            connection = super().connect()
+        except PoolTimeoutError:
+            with self._metrics_lock:
+                self.timeouts += 1
+                self.exhausted_waits += exhausted
+            raise
+        elapsed = time.perf_counter() - started_at
+        with self._metrics_lock:
+            self.checkouts += 1
+            self.checkout_time += elapsed
+            self.max_checkout_time = max(self.max_checkout_time, elapsed)
+            self.exhausted_waits += exhausted
+            self.peak_checked_out = max(self.peak_checked_out, self.checkedout())
+        return connection
+
+    def _create_connection(self):
+        connection = super()._create_connection()
+        with self._metrics_lock:
+            self.connections_created += 1
+        return connection
+
+    def stats(self):
+        """
+        Метрики пула.
+        """
+        with self._metrics_lock:
+            checkouts = self.checkouts
+            return {
+                "pool_size": self.size(),
+                "max_overflow": self._max_overflow,
+                "checked_out": self.checkedout(),
+                "peak_checked_out": self.peak_checked_out,
+                "connections_created": self.connections_created,
+                "checkouts": checkouts,
+                "avg_checkout_ms": round(
+                    self.checkout_time / checkouts * 1000, 3
+                ) if checkouts else 0.0,
+                "max_checkout_ms": round(self.max_checkout_time * 1000, 3),
+                "exhausted_waits": self.exhausted_waits,
+                "timeouts": self.timeouts,
+            }
@@ -0,0 +1,168 @@
+import logging
+import os
+from contextlib import contextmanager
+from functools import lru_cache
+
+from resources.db_backend_settings import DBBackendSettings
+from resources.db_creds import DBCreds
+from resources.db_pool_settings import DBPoolSettings
+from resources.sql_profile_settings import SQLProfileSettings
+
+
+def get_database_url():
+    """
+    URL подключения к базе данных из DBCreds.
+    """
+    return (
+        f"postgresql+psycopg2://{DBCreds.DB_USER}:{DBCreds.DB_PASSWORD}"
+        f"@{DBCreds.DB_HOST}:{DBCreds.DB_PORT}/{DBCreds.DB_NAME}"
+    )
+
+
+def pool_options(max_connections=None, pool_size=None, workers=None):
+    """
+    Настройки пула соединений одного воркера pytest-xdist.
+    Бюджет соединений прогона делится поровну между воркерами,
+    половина доли воркера держится в пуле, остальное - overflow.
+    :param max_connections: Бюджет соединений на весь прогон.
+    :param pool_size: Явный размер пула воркера (overflow - остаток доли).
+    :param workers: Число воркеров (по умолчанию PYTEST_XDIST_WORKER_COUNT).
+    :return: Аргументы пула для create_engine.
+    """
+    if max_connections is None:
+        max_connections = DBPoolSettings.MAX_CONNECTIONS
+    if pool_size is None and DBPoolSettings.POOL_SIZE:
+        pool_size = int(DBPoolSettings.POOL_SIZE)
+    if workers is None:
+        workers = int(os.environ.get("PYTEST_XDIST_WORKER_COUNT", "1"))
+    per_worker = max(1, max_connections // workers)
+    if pool_size is None:
+        pool_size = max(1, per_worker // 2)
+    return {
+        "pool_size": pool_size,
+        "max_overflow": max(0, per_worker - pool_size),
+        "pool_pre_ping": DBPoolSettings.PRE_PING,
+        "pool_recycle": DBPoolSettings.RECYCLE,
+        "pool_timeout": DBPoolSettings.TIMEOUT,
+    }
+
+
+@lru_cache(maxsize=None)
+def get_engine():
+    """
+    Общий для всех БД-фикстур движок (engine) с пулом соединений.
+    Создается при первом обращении, поэтому SQLAlchemy и драйвер БД
+    не импортируются в прогонах без БД-тестов. Пул инструментирован
+    (engine.pool.stats()), при SQL_PROFILE=1 к нему подключается sql_profiler.
+    При DB_BACKEND=sqlite вместо Postgres используется локальная SQLite
+    со схемой моделей (db_requester.sqlite_backend), по умолчанию
+    во временном файле.
+    """
+    from db_requester.sql_profiler import sql_profiler
+
+    if DBBackendSettings.BACKEND == "sqlite":
+        from db_requester.sqlite_backend import (create_sqlite_engine,
+                                                 temporary_sqlite_path)
+
+        engine = create_sqlite_engine(
+            DBBackendSettings.SQLITE_PATH or temporary_sqlite_path()
+        )
+    else:
+        engine = create_engine_from_url(get_database_url())
+    if SQLProfileSettings.ENABLED:
+        sql_profiler.attach(engine)
+    return engine
+
+
+def is_in_memory_sqlite(url):
+    """
+    Проверка, что URL указывает на in-memory SQLite: такая БД живет
+    в одном соединении и не видна другим процессам.
+    """
+    from sqlalchemy.engine import make_url
+
+    url = make_url(url)
+    return (
+        url.get_backend_name() == "sqlite"
+        and url.database in (None, "", ":memory:")
+    )
+
+
+def create_engine_from_url(url):
+    """
+    Новый движок по URL другого движка, например в дочернем процессе.
+    Для SQLite применяются те же настройки соединений, что
+    в create_sqlite_engine, схема не пересоздается.
+    :param url: URL подключения (str или sqlalchemy.engine.URL).
+    """
+    from sqlalchemy import create_engine
+    from sqlalchemy.engine import make_url
+
+    url = make_url(url)
+    if url.get_backend_name() == "sqlite":
+        from db_requester.sqlite_backend import create_sqlite_engine
+
+        if is_in_memory_sqlite(url):
+            raise ValueError(
+                "In-memory SQLite нельзя открыть из другого соединения"
+            )
+        return create_sqlite_engine(url.database, create_schema=False)
+
+    from db_requester.db_pool import InstrumentedQueuePool
+
+    return create_engine(url, poolclass=InstrumentedQueuePool, **pool_options())
+
+
+@lru_cache(maxsize=None)
+def get_session_factory():
+    """
+    Фабрика сессий SQLAlchemy, привязанная к get_engine().
+    """
+    from sqlalchemy.orm import sessionmaker
+
+    return sessionmaker(autocommit=False, autoflush=False, bind=get_engine())
+
+
+@contextmanager
+def transactional_session(engine=None):
+    """
+    Сессия внутри внешней транзакции, которая откатывается при выходе.
+    commit() и rollback() в тесте работают с вложенными SAVEPOINT,
+    поэтому тест может фиксировать изменения как обычно, а все данные
+    удаляются одним ROLLBACK, даже если тест упал.
+    Изменения не видны другим соединениям (например, тестируемому сервису).
+    :param engine: Движок БД (по умолчанию get_engine()).
+    """
+    from sqlalchemy.orm import Session
+
+    connection = (engine or get_engine()).connect()
+    transaction = connection.begin()
+    session = Session(
+        bind=connection, autoflush=False,
+        join_transaction_mode="create_savepoint"
+    )
+    try:
+        yield session
+    finally:
+        session.close()
+        if transaction.is_active:
+            transaction.rollback()
+        connection.close()
+
+
+def is_engine_created():
+    return get_engine.cache_info().currsize > 0
+
+
+def dispose_engine():
+    """
+    Логирование метрик пула и закрытие соединений, если движок создавался.
+    """
+    if not is_engine_created():
+        return
+    engine = get_engine()
+    if hasattr(engine.pool, "stats"):
+        logging.getLogger(__name__).info(
+            f"DB pool stats: {engine.pool.stats()}"
+        )
+    engine.dispose()
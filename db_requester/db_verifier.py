@@ -0,0 +1,165 @@
+import logging
+import threading
+import time
+from collections import defaultdict
+
+from sqlalchemy import inspect, select
+
+from db_requester.db_session import get_session_factory
+
+_MISSING = object()
+
+
+class Expectation:
+    """
+    Ожидаемое состояние строки: строка модели с данным первичным ключом
+    существует (или отсутствует) и содержит указанные значения полей.
+    """
+
+    __slots__ = ("model", "id", "fields", "exists", "test_id", "error")
+
+    def __init__(self, model, id, fields, exists=True, test_id=None):
+        self.model = model
+        self.id = id
+        self.fields = fields
+        self.exists = exists
+        self.test_id = test_id
+        self.error = None
+
+    def check(self, row):
+        """
+        Проверка строки из БД.
+        :param row: Объект модели или None, если строки нет.
+        :return: True, если ожидание выполнено (иначе причина в error).
+        """
+        if not self.exists:
+            self.error = None if row is None else "строка не должна существовать"
+            return self.error is None
+        if row is None:
+            self.error = "строка не найдена"
+            return False
+        mismatches = [
+            f"{name}={getattr(row, name, _MISSING)!r} (ожидалось {value!r})"
+            for name, value in self.fields.items()
+            if getattr(row, name, _MISSING) != value
+        ]
+        self.error = ", ".join(mismatches) or None
+        return self.error is None
+
+    def __str__(self):
+        return (
+            f"{self.test_id}: {self.model.__tablename__} id={self.id}: "
+            f"{self.error}"
+        )
+
+
+class DBVerifier:
+    """
+    Отложенная пакетная проверка побочных эффектов API в БД.
+    Тесты регистрируют ожидания через expect(), а flush() проверяет все
+    накопленные ожидания одним запросом WHERE id IN (...) на таблицу.
+    Невыполненные ожидания перепроверяются с экспоненциальной задержкой
+    до timeout - для записей, которые появляются в БД не сразу.
+    """
+
+    def __init__(
+        self, session_factory=None, timeout=5, poll_interval=0.1,
+        max_poll_interval=1, chunk_size=1000, sleep=time.sleep
+    ):
+        """
+        :param session_factory: Фабрика сессий (по умолчанию get_session_factory()).
+        :param timeout: Сколько секунд ждать выполнения ожиданий.
+        :param poll_interval: Начальная задержка между проверками.
+        :param max_poll_interval: Максимальная задержка между проверками.
+        :param chunk_size: Максимум ID в одном IN (...).
+        :param sleep: Функция ожидания (подменяется в тестах).
+        """
+        self.session_factory = session_factory
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.chunk_size = chunk_size
+        self.sleep = sleep
+        self.current_test = None
+        self.failures = []
+        self.queries = 0
+        self._pending = []
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(__name__)
+
+    def expect(self, model, id, exists=True, test_id=None, **fields):
+        """
+        Регистрация ожидания.
+        :param model: Модель таблицы, например UserDBModel.
+        :param id: Значение первичного ключа.
+        :param exists: Строка должна существовать (False - отсутствовать).
+        :param test_id: Тест-источник (по умолчанию текущий тест).
+        :param fields: Ожидаемые значения полей, например email="...".
+        """
+        expectation = Expectation(
+            model, id, fields, exists, test_id or self.current_test
+        )
+        with self._lock:
+            self._pending.append(expectation)
+        return expectation
+
+    @property
+    def pending(self):
+        return len(self._pending)
+
+    def flush(self):
+        """
+        Проверка всех накопленных ожиданий.
+        :return: Список невыполненных ожиданий (error - причина).
+        """
+        with self._lock:
+            pending, self._pending = self._pending, []
+        if not pending:
+            return []
+
+        deadline = time.monotonic() + self.timeout
+        delay = self.poll_interval
+        while True:
+            pending = self._check(pending)
+            if not pending or time.monotonic() + delay > deadline:
+                break
+            self.sleep(delay)
+            delay = min(delay * 2, self.max_poll_interval)
+
+        self.failures.extend(pending)
+        for expectation in pending:
+            self.logger.error(f"DB verification failed: {expectation}")
+        return pending
+
+    def _check(self, expectations):
+        """
+        Одна проверка: запрос WHERE pk IN (...) на каждую таблицу.
+        :return: Невыполненные ожидания.
+        """
+        by_model = defaultdict(list)
+        for expectation in expectations:
+            by_model[expectation.model].append(expectation)
+
+        failed = []
+        session_factory = self.session_factory or get_session_factory()
+        with session_factory() as session:
+            for model, model_expectations in by_model.items():
+                rows = self._load_rows(session, model, model_expectations)
+                failed.extend(
+                    expectation for expectation in model_expectations
+                    if not expectation.check(rows.get(expectation.id))
+                )
+        return failed
+
+    def _load_rows(self, session, model, expectations):
+        primary_key = inspect(model).primary_key[0]
+        ids = list(dict.fromkeys(expectation.id for expectation in expectations))
+        rows = {}
+        for start in range(0, len(ids), self.chunk_size):
+            chunk = ids[start:start + self.chunk_size]
+            self.queries += 1
+            for row in session.scalars(
+                select(model).where(primary_key.in_(chunk))
+            ):
+                rows[getattr(row, primary_key.key)] = row
+        return rows
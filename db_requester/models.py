@@ -1,7 +1,35 @@
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String
+from sqlalchemy import (Boolean, Column, DateTime, ForeignKey, Integer, String,
+                        TypeDecorator)
 from sqlalchemy.orm import declarative_base
 
+
+class PgArrayLiteral(TypeDecorator):
+    """
+    Массив PostgreSQL в виде литерала "{USER,ADMIN}".
+    В Postgres это колонка-массив, в SQLite - текст. Список при записи
+    преобразуется в литерал, строка-литерал записывается как есть.
+    """
+    impl = String
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if isinstance(value, (list, tuple)):
+            return "{" + ",".join(
+                getattr(item, "value", item) for item in value
+            ) + "}"
+        return value
+
+    @staticmethod
+    def parse(value):
+        """
+        Литерал "{USER,ADMIN}" -> ["USER", "ADMIN"].
+        """
+        if not value or value == "{}":
+            return []
+        return value.strip("{}").split(",")
+
+
 # Модель базы данных для пользователя
 
 Base = declarative_base()
@@ -17,7 +45,17 @@ class UserDBModel(Base):
     updated_at = Column(DateTime)
     verified = Column(Boolean)
     banned = Column(Boolean)
-    roles = Column(String)
+    roles = Column(PgArrayLiteral)
+
+
+class GenreDBModel(Base):
+    """
+    Модель для таблицы genres.
+    """
+    __tablename__ = 'genres'
+
+    id = Column(String, primary_key=True)
+    name = Column(String, nullable=False)
 
 
 class MovieDBModel(Base):
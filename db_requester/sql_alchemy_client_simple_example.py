@@ -1,17 +1,11 @@
-from sqlalchemy import Boolean, Column, DateTime, String, create_engine, text
+from sqlalchemy import Boolean, Column, DateTime, String, text
 from sqlalchemy.orm import declarative_base, sessionmaker
 
-# Подключение к базе данных
-host = "92.255.111.76"
-port = 31200
-database_name = "db_movies"
-username = "postgres"
-password = "AmwFrtnR2"
-
-# формируем урл для подключения к базе
-connection_string = f"postgresql+psycopg2://{username}:{password}@{host}:{port}/{database_name}"
-# обьект для подключения к базе данных
-engine = create_engine(connection_string)
+from db_requester.db_session import get_engine
+
+# Данные для подключения берутся из DBCreds (.env), обьект для подключения
+# к базе данных - общий движок с пулом соединений
+engine = get_engine()
 
 # повторяем запрос ручной из DBeaver
 
@@ -0,0 +1,184 @@
+import logging
+import re
+import threading
+import time
+from collections import Counter
+
+from resources.sql_profile_settings import SQLProfileSettings
+
+_WHITESPACE = re.compile(r"\s+")
+# Раскрытые списки параметров IN (...) сворачиваются в один параметр
+_PARAMS_LIST = re.compile(
+    r"\(\s*(?:%\(\w+\)s|\?|:\w+|%s)(?:\s*,\s*(?:%\(\w+\)s|\?|:\w+|%s))*\s*\)"
+)
+_PARAM = re.compile(r"%\(\w+\)s|(?<!:):\w+|%s")
+_COUNT_WRAPPER = re.compile(
+    r"^SELECT count\(\*\) AS \w+ FROM \((?P<inner>.+)\) AS \w+$", re.IGNORECASE
+)
+# Явные BEGIN/COMMIT (например, из SQLite-бэкенда) не являются запросами теста
+_TRANSACTION_CONTROL = re.compile(
+    r"^\s*(?:BEGIN|COMMIT|ROLLBACK)\b", re.IGNORECASE
+)
+
+
+def normalize_statement(statement):
+    """
+    Нормализация текста SQL: пробелы схлопываются, параметры драйвера
+    заменяются на ?, списки IN (...) сворачиваются.
+    """
+    statement = _WHITESPACE.sub(" ", statement).strip()
+    statement = _PARAMS_LIST.sub("(?)", statement)
+    return _PARAM.sub("?", statement)
+
+
+class QueryRecord:
+    __slots__ = ("statement", "duration", "rowcount")
+
+    def __init__(self, statement, duration, rowcount):
+        self.statement = statement
+        self.duration = duration
+        self.rowcount = rowcount
+
+
+class TestSQLSummary:
+    """
+    Итог SQL-запросов одного теста: число и время запросов,
+    повторяющиеся запросы (N+1) и пары count() + выборка того же запроса.
+    """
+
+    __test__ = False  # не тестовый класс для pytest
+
+    def __init__(self, test_id, records, repeat_threshold=2):
+        self.test_id = test_id
+        self.records = records
+        self.queries = len(records)
+        self.total_time = sum(record.duration for record in records)
+        counts = Counter(record.statement for record in records)
+        self.repeated = {
+            statement: count for statement, count in counts.items()
+            if count >= repeat_threshold
+        }
+        self.count_then_fetch = self._find_count_then_fetch(counts)
+
+    @staticmethod
+    def _find_count_then_fetch(counts):
+        pairs = []
+        for statement in counts:
+            match = _COUNT_WRAPPER.match(statement)
+            if match is None:
+                continue
+            inner = match.group("inner")
+            if any(
+                other != statement and other.startswith(inner)
+                for other in counts
+            ):
+                pairs.append(inner)
+        return pairs
+
+    @property
+    def has_warnings(self):
+        return bool(self.repeated or self.count_then_fetch)
+
+    def as_dict(self):
+        return {
+            "queries": self.queries,
+            "total_ms": round(self.total_time * 1000, 3),
+            "rows": sum(max(record.rowcount, 0) for record in self.records),
+            "repeated": self.repeated,
+            "count_then_fetch": self.count_then_fetch,
+        }
+
+    def __str__(self):
+        lines = [
+            f"{self.test_id}: {self.queries} SQL, "
+            f"{self.total_time * 1000:.1f} ms"
+        ]
+        for statement, count in self.repeated.items():
+            lines.append(f"  повтор x{count}: {statement}")
+        for statement in self.count_then_fetch:
+            lines.append(f"  count() + выборка вместо одного запроса: {statement}")
+        return "\n".join(lines)
+
+
+class SQLProfiler:
+    """
+    Профилировщик SQL-запросов на событиях движка SQLAlchemy
+    (before/after_cursor_execute). Для каждого теста записывает
+    нормализованный текст запроса, длительность и число строк.
+    Слушатели подключаются только при включенном профилировании,
+    поэтому выключенный профилировщик не влияет на запросы.
+    """
+
+    def __init__(self, repeat_threshold=2):
+        """
+        :param repeat_threshold: С какого числа одинаковых запросов в тесте
+            запрос считается повторяющимся.
+        """
+        self.repeat_threshold = repeat_threshold
+        self.summaries = []
+        self._records = None
+        self._test_id = None
+        self._engines = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(__name__)
+
+    def attach(self, engine):
+        """
+        Подключение слушателей событий к движку.
+        """
+        from sqlalchemy import event
+
+        event.listen(engine, "before_cursor_execute", self._before_execute)
+        event.listen(engine, "after_cursor_execute", self._after_execute)
+        self._engines.append(engine)
+
+    def detach(self):
+        from sqlalchemy import event
+
+        for engine in self._engines:
+            event.remove(engine, "before_cursor_execute", self._before_execute)
+            event.remove(engine, "after_cursor_execute", self._after_execute)
+        self._engines.clear()
+
+    def start_test(self, test_id):
+        with self._lock:
+            self._test_id = test_id
+            self._records = []
+
+    def finish_test(self):
+        """
+        Завершение теста.
+        :return: TestSQLSummary или None, если тест не выполнял запросов.
+        """
+        with self._lock:
+            records, test_id = self._records, self._test_id
+            self._records = self._test_id = None
+        if not records:
+            return None
+        summary = TestSQLSummary(test_id, records, self.repeat_threshold)
+        self.summaries.append(summary)
+        if summary.has_warnings:
+            self.logger.warning(f"SQL profile {summary}")
+        return summary
+
+    def _before_execute(
+        self, conn, cursor, statement, parameters, context, executemany
+    ):
+        self._local.started_at = time.perf_counter()
+
+    def _after_execute(
+        self, conn, cursor, statement, parameters, context, executemany
+    ):
+        duration = time.perf_counter() - self._local.started_at
+        if _TRANSACTION_CONTROL.match(statement):
+            return
+        record = QueryRecord(
+            normalize_statement(statement), duration, cursor.rowcount
+        )
+        with self._lock:
+            if self._records is not None:
+                self._records.append(record)
+
+
+sql_profiler = SQLProfiler(SQLProfileSettings.REPEAT_THRESHOLD)
@@ -0,0 +1,87 @@
+import atexit
+import os
+import tempfile
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.pool import StaticPool
+
+from db_requester.models import Base, GenreDBModel
+
+DEFAULT_GENRES = ("Драма", "Комедия", "Боевик", "Ужасы", "Фантастика")
+
+
+def create_sqlite_engine(
+    path=":memory:", seed=True, create_schema=True, **engine_options
+):
+    """
+    SQLite-движок со схемой моделей db_requester (users, genres, movies,
+    accounts_transaction_template) для запуска БД-тестов без Postgres.
+    :param path: Путь к файлу БД или ":memory:". In-memory БД живет
+        в одном соединении (StaticPool) и общая для всех сессий процесса.
+    :param seed: Заполнить таблицу genres жанрами DEFAULT_GENRES.
+    :param create_schema: Создать таблицы (False - файл уже подготовлен).
+    :param engine_options: Дополнительные аргументы create_engine
+        (например, poolclass и размеры пула для файловой БД).
+    """
+    if path == ":memory:":
+        engine = create_engine(
+            "sqlite://", poolclass=StaticPool,
+            connect_args={"check_same_thread": False}, **engine_options
+        )
+    else:
+        engine = create_engine(
+            f"sqlite:///{path}", connect_args={"check_same_thread": False},
+            **engine_options
+        )
+
+    # pysqlite сам управляет транзакциями и ломает SAVEPOINT:
+    # отключаем это и открываем транзакции явным BEGIN
+    @event.listens_for(engine, "connect")
+    def on_connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+        dbapi_connection.execute("PRAGMA foreign_keys = ON")
+
+    @event.listens_for(engine, "begin")
+    def on_begin(connection):
+        connection.exec_driver_sql("BEGIN")
+
+    if not create_schema:
+        return engine
+    Base.metadata.create_all(engine)
+    if seed:
+        seed_genres(engine)
+    return engine
+
+
+def temporary_sqlite_path():
+    """
+    Путь к временному файлу БД, удаляемому при завершении процесса.
+    В отличие от :memory: файл открывается отдельными соединениями,
+    поэтому с ним работают конкурентные БД-тесты.
+    """
+    fd, path = tempfile.mkstemp(prefix="db_requester_", suffix=".sqlite3")
+    os.close(fd)
+    atexit.register(_remove_file, path)
+    return path
+
+
+def _remove_file(path):
+    for suffix in ("", "-journal", "-wal", "-shm"):
+        try:
+            os.remove(path + suffix)
+        except FileNotFoundError:
+            pass
+
+
+def seed_genres(engine, genres=DEFAULT_GENRES):
+    """
+    Заполнение таблицы genres (ID жанров - строки "1", "2", ...).
+    """
+    with engine.begin() as connection:
+        existing = connection.execute(GenreDBModel.__table__.select()).first()
+        if existing is not None:
+            return
+        connection.execute(GenreDBModel.__table__.insert(), [
+            {"id": str(index), "name": name}
+            for index, name in enumerate(genres, start=1)
+        ])
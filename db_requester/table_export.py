@@ -0,0 +1,182 @@
+"""
+Потоковое чтение и выгрузка больших таблиц БД в JSONL/CSV.
+
+Запуск: python -m db_requester.table_export users users.jsonl
+    [--columns id,email] [--format jsonl|csv] [--chunk-size 1000]
+"""
+import argparse
+import csv
+import datetime
+import json
+import sys
+from array import array
+from contextlib import contextmanager
+
+from sqlalchemy import select
+
+from db_requester.db_session import get_engine
+from db_requester.models import Base
+
+# Типы колонок, которые хранятся в пакетах компактными массивами array
+_ARRAY_TYPECODES = {int: "q", float: "d", bool: "b"}
+
+
+def get_table(name):
+    """
+    Таблица моделей db_requester по имени (users, movies, ...).
+    """
+    try:
+        return Base.metadata.tables[name]
+    except KeyError:
+        raise ValueError(
+            f"Неизвестная таблица {name}, доступны: "
+            f"{', '.join(sorted(Base.metadata.tables))}"
+        ) from None
+
+
+def _select(table, columns=None, where=None):
+    if isinstance(table, str):
+        table = get_table(table)
+    elif hasattr(table, "__table__"):
+        table = table.__table__
+    selected = [table.c[name] for name in columns] if columns else list(table.c)
+    statement = select(*selected)
+    if where is not None:
+        statement = statement.where(where)
+    return statement.order_by(*table.primary_key.columns)
+
+
+def stream_rows(table, columns=None, where=None, chunk_size=1000, engine=None):
+    """
+    Потоковое чтение строк таблицы кортежами через серверный курсор
+    (stream_results + yield_per): в памяти держится не больше chunk_size строк.
+    :param table: Модель, таблица или имя таблицы.
+    :param columns: Имена колонок (по умолчанию все).
+    :param where: Условие SQLAlchemy (опционально).
+    :param chunk_size: Размер пачки строк, получаемой с сервера.
+    :param engine: Движок БД (по умолчанию get_engine()).
+    :return: Генератор кортежей значений колонок.
+    """
+    for chunk in stream_chunks(table, columns, where, chunk_size, engine):
+        yield from chunk
+
+
+def stream_chunks(table, columns=None, where=None, chunk_size=1000, engine=None):
+    """
+    Потоковое чтение строк пачками по chunk_size.
+    :return: Генератор списков кортежей.
+    """
+    statement = _select(table, columns, where)
+    with (engine or get_engine()).connect() as connection:
+        result = connection.execution_options(
+            stream_results=True, yield_per=chunk_size
+        ).execute(statement)
+        for partition in result.partitions():
+            yield [tuple(row) for row in partition]
+
+
+def stream_column_batches(
+    table, columns=None, where=None, chunk_size=1000, engine=None
+):
+    """
+    Потоковое чтение в колоночном виде: на каждую пачку строк словарь
+    {колонка: значения}. Целые, дробные и логические колонки без NULL
+    хранятся в array.array, остальные - в списках.
+    :return: Генератор словарей колонок.
+    """
+    statement = _select(table, columns, where)
+    names = [column.name for column in statement.selected_columns]
+    for chunk in stream_chunks(table, columns, where, chunk_size, engine):
+        yield {
+            name: _to_array(values)
+            for name, values in zip(names, zip(*chunk))
+        }
+
+
+def _to_array(values):
+    kinds = {type(value) for value in values}
+    if len(kinds) == 1:
+        typecode = _ARRAY_TYPECODES.get(kinds.pop())
+        if typecode is not None:
+            return array(typecode, values)
+    return list(values)
+
+
+def _json_default(value):
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    return str(value)
+
+
+def export_jsonl(output, table, columns=None, where=None, chunk_size=1000,
+                 engine=None):
+    """
+    Выгрузка таблицы в JSON Lines с постоянным расходом памяти.
+    :param output: Путь к файлу или открытый текстовый файл.
+    :return: Число выгруженных строк.
+    """
+    names = [column.name for column in _select(table, columns).selected_columns]
+    with _open_output(output) as file:
+        count = 0
+        for row in stream_rows(table, columns, where, chunk_size, engine):
+            file.write(json.dumps(
+                dict(zip(names, row)), ensure_ascii=False, default=_json_default
+            ))
+            file.write("\n")
+            count += 1
+    return count
+
+
+def export_csv(output, table, columns=None, where=None, chunk_size=1000,
+               engine=None):
+    """
+    Выгрузка таблицы в CSV (первая строка - имена колонок).
+    :param output: Путь к файлу или открытый текстовый файл.
+    :return: Число выгруженных строк.
+    """
+    names = [column.name for column in _select(table, columns).selected_columns]
+    with _open_output(output) as file:
+        writer = csv.writer(file)
+        writer.writerow(names)
+        count = 0
+        for chunk in stream_chunks(table, columns, where, chunk_size, engine):
+            writer.writerows(chunk)
+            count += len(chunk)
+    return count
+
+
+@contextmanager
+def _open_output(output):
+    """
+    Открытие файла по пути; уже открытый файл не закрывается.
+    """
+    if not isinstance(output, str):
+        yield output
+        return
+    with open(output, "w", encoding="utf-8", newline="") as file:
+        yield file
+
+
+EXPORTERS = {"jsonl": export_jsonl, "csv": export_csv}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("table")
+    parser.add_argument("output", help="Путь к файлу или - для stdout")
+    parser.add_argument("--columns", default=None,
+                        help="Колонки через запятую (по умолчанию все)")
+    parser.add_argument("--format", default="jsonl", choices=list(EXPORTERS))
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    args = parser.parse_args(argv)
+
+    output = sys.stdout if args.output == "-" else args.output
+    columns = args.columns.split(",") if args.columns else None
+    count = EXPORTERS[args.format](
+        output, args.table, columns, chunk_size=args.chunk_size
+    )
+    print(f"Выгружено строк: {count}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,316 @@
+"""
+Нагрузочная проверка перевода денег между счетами
+accounts_transaction_template при конкурентных переводах.
+
+Запуск: python -m db_requester.transfer_stress [--strategy all]
+    [--accounts 20] [--transfers 2000] [--concurrency 16] [--executor thread]
+"""
+import argparse
+import random
+import statistics
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from sqlalchemy import func, select, update
+from sqlalchemy.exc import DBAPIError
+
+from db_requester.bulk_loader import BulkLoader
+from db_requester.db_session import (create_engine_from_url, get_engine,
+                                     is_engine_created, is_in_memory_sqlite)
+from db_requester.models import AccountTransactionTemplate
+
+accounts = AccountTransactionTemplate.__table__
+
+# SQLSTATE ошибок Postgres, после которых транзакцию можно повторить
+RETRYABLE_SQLSTATES = {
+    "40001": "serialization_failures",
+    "40P01": "deadlocks",
+}
+
+
+class TransferConflict(Exception):
+    """
+    Баланс изменился между чтением и записью (оптимистичная блокировка).
+    """
+
+
+def _read_balances(connection, users, for_update=False):
+    statement = (
+        select(accounts.c.user, accounts.c.balance)
+        .where(accounts.c.user.in_(users))
+        # Блокировки берутся в одном порядке, чтобы не было взаимных блокировок
+        .order_by(accounts.c.user)
+    )
+    if for_update:
+        statement = statement.with_for_update()
+    return dict(connection.execute(statement).all())
+
+
+def _set_balance(connection, user, balance, expected=None):
+    statement = update(accounts).where(accounts.c.user == user)
+    if expected is not None:
+        statement = statement.where(accounts.c.balance == expected)
+    return connection.execute(statement.values(balance=balance)).rowcount
+
+
+def transfer_naive(connection, from_user, to_user, amount):
+    """
+    Чтение, изменение и запись без блокировок (как в transfer_money).
+    """
+    balances = _read_balances(connection, (from_user, to_user))
+    if balances[from_user] < amount:
+        return False
+    _set_balance(connection, from_user, balances[from_user] - amount)
+    _set_balance(connection, to_user, balances[to_user] + amount)
+    return True
+
+
+def transfer_for_update(connection, from_user, to_user, amount):
+    """
+    Пессимистичная блокировка строк SELECT ... FOR UPDATE.
+    """
+    balances = _read_balances(connection, (from_user, to_user), for_update=True)
+    if balances[from_user] < amount:
+        return False
+    _set_balance(connection, from_user, balances[from_user] - amount)
+    _set_balance(connection, to_user, balances[to_user] + amount)
+    return True
+
+
+def transfer_optimistic(connection, from_user, to_user, amount):
+    """
+    Оптимистичная блокировка: UPDATE ... WHERE balance = <прочитанное>.
+    В таблице нет колонки версии, ее роль выполняет сам баланс.
+    """
+    balances = _read_balances(connection, (from_user, to_user))
+    if balances[from_user] < amount:
+        return False
+    for user, balance in (
+        (from_user, balances[from_user] - amount),
+        (to_user, balances[to_user] + amount),
+    ):
+        if _set_balance(connection, user, balance, expected=balances[user]) != 1:
+            raise TransferConflict(user)
+    return True
+
+
+STRATEGIES = {
+    "naive": transfer_naive,
+    "for_update": transfer_for_update,
+    "optimistic": transfer_optimistic,
+    # Логика naive, но в транзакции SERIALIZABLE с повтором при конфликте
+    "serializable": transfer_naive,
+}
+
+
+def classify_error(error):
+    """
+    Тип ошибки БД, после которой перевод можно повторить, или None.
+    """
+    sqlstate = getattr(getattr(error, "orig", None), "pgcode", None)
+    if sqlstate in RETRYABLE_SQLSTATES:
+        return RETRYABLE_SQLSTATES[sqlstate]
+    if "database is locked" in str(error):  # SQLite
+        return "deadlocks"
+    return None
+
+
+def run_transfer(engine, strategy, from_user, to_user, amount, max_retries=10):
+    """
+    Один перевод с повторами при конфликтах.
+    :return: Кортеж (статус, задержка в секундах, Counter ошибок).
+        Статус: "ok", "rejected" (недостаточно средств) или "failed".
+    """
+    transfer = STRATEGIES[strategy]
+    errors = Counter()
+    started_at = time.perf_counter()
+    for attempt in range(max_retries + 1):
+        try:
+            with engine.connect() as connection:
+                if strategy == "serializable":
+                    connection = connection.execution_options(
+                        isolation_level="SERIALIZABLE"
+                    )
+                with connection.begin():
+                    done = transfer(connection, from_user, to_user, amount)
+            status = "ok" if done else "rejected"
+            return status, time.perf_counter() - started_at, errors
+        except TransferConflict:
+            errors["conflicts"] += 1
+        except DBAPIError as error:
+            kind = classify_error(error)
+            if kind is None:
+                raise
+            errors[kind] += 1
+        errors["retries"] += attempt < max_retries
+        time.sleep(random.uniform(0, 0.001 * 2 ** min(attempt, 6)))
+    return "failed", time.perf_counter() - started_at, errors
+
+
+# Движок родителя (виден дочерним процессам после fork) и движок
+# дочернего процесса executor="process" (см. _init_process_worker)
+_parent_engine = None
+_worker_engine = None
+
+
+def _init_process_worker(url):
+    """
+    Инициализация дочернего процесса: соединения пулов, унаследованные
+    при fork, остаются родителю, процесс открывает свои по URL движка.
+    """
+    global _worker_engine
+    inherited = [_parent_engine]
+    if is_engine_created():
+        inherited.append(get_engine())
+    for engine in inherited:
+        if engine is not None:
+            engine.dispose(close=False)
+    _worker_engine = create_engine_from_url(url)
+
+
+def _run_transfer_in_process(args):
+    return run_transfer(_worker_engine, *args)
+
+
+class TransferStressReport:
+    """
+    Итог нагрузочного прогона одной стратегии.
+    """
+
+    def __init__(self, strategy, statuses, latencies, errors, elapsed,
+                 total_before, total_after, min_balance):
+        self.strategy = strategy
+        self.transfers = len(latencies)
+        self.succeeded = statuses["ok"]
+        self.rejected = statuses["rejected"]
+        self.failed = statuses["failed"]
+        self.errors = errors
+        self.elapsed = elapsed
+        self.throughput = self.transfers / elapsed if elapsed else 0.0
+        self.p99_latency = (
+            statistics.quantiles(latencies, n=100)[98]
+            if len(latencies) > 1 else sum(latencies)
+        )
+        self.total_before = total_before
+        self.total_after = total_after
+        self.min_balance = min_balance
+
+    @property
+    def money_conserved(self):
+        return self.total_before == self.total_after and self.min_balance >= 0
+
+    @property
+    def error_rate(self):
+        """
+        Доля попыток, завершившихся deadlock или ошибкой сериализации.
+        """
+        attempts = self.transfers + self.errors["retries"]
+        failures = self.errors["deadlocks"] + self.errors["serialization_failures"]
+        return failures / attempts if attempts else 0.0
+
+    def __str__(self):
+        return (
+            f"{self.strategy:<13} {self.throughput:8.1f} tx/s  "
+            f"p99 {self.p99_latency * 1000:8.1f} ms  "
+            f"ok {self.succeeded} rejected {self.rejected} failed {self.failed}  "
+            f"deadlocks {self.errors['deadlocks']} "
+            f"serialization {self.errors['serialization_failures']} "
+            f"conflicts {self.errors['conflicts']} "
+            f"error rate {self.error_rate:.1%}  "
+            f"sum {self.total_before} -> {self.total_after} "
+            f"{'OK' if self.money_conserved else 'VIOLATED'}"
+        )
+
+
+def _balances_summary(engine, loader):
+    with engine.connect() as connection:
+        return connection.execute(
+            select(func.sum(accounts.c.balance), func.min(accounts.c.balance))
+            .where(accounts.c.user.startswith(loader.tag, autoescape=True))
+        ).one()
+
+
+def run_transfer_stress(
+    strategy, engine=None, accounts_count=20, transfers=2000, concurrency=16,
+    initial_balance=1000, max_amount=100, executor="thread", max_retries=10,
+    seed=None
+):
+    """
+    Конкурентные переводы между счетами пула одной стратегией.
+    Счета создаются с тегом прогона и удаляются после замера.
+    :param strategy: naive, for_update, optimistic или serializable.
+    :param engine: Движок БД (по умолчанию get_engine()).
+    :param executor: thread или process (процессы открывают свой движок
+        по URL engine, поэтому in-memory SQLite не поддерживается).
+    :return: TransferStressReport.
+    """
+    global _parent_engine
+    engine = engine or get_engine()
+    if executor == "process" and is_in_memory_sqlite(engine.url):
+        raise ValueError("In-memory SQLite не поддерживается executor=process")
+    rng = random.Random(seed)
+    loader = BulkLoader(engine)
+    loader.load_accounts(accounts_count, balance=initial_balance)
+    users = [row["user"] for row in loader.account_rows(accounts_count)]
+    plan = []
+    for _ in range(transfers):
+        from_user, to_user = rng.sample(users, 2)
+        plan.append((strategy, from_user, to_user, rng.randint(1, max_amount)))
+
+    try:
+        total_before, _ = _balances_summary(engine, loader)
+        started_at = time.perf_counter()
+        if executor == "process":
+            _parent_engine = engine
+            with ProcessPoolExecutor(
+                max_workers=concurrency, initializer=_init_process_worker,
+                initargs=(engine.url.render_as_string(hide_password=False),)
+            ) as pool:
+                results = list(pool.map(
+                    _run_transfer_in_process,
+                    [(*args, max_retries) for args in plan],
+                    chunksize=max(1, transfers // (concurrency * 4))
+                ))
+        else:
+            with ThreadPoolExecutor(max_workers=concurrency) as pool:
+                results = list(pool.map(
+                    lambda args: run_transfer(engine, *args, max_retries), plan
+                ))
+        elapsed = time.perf_counter() - started_at
+        total_after, min_balance = _balances_summary(engine, loader)
+    finally:
+        _parent_engine = None
+        loader.cleanup()
+
+    statuses = Counter(status for status, _, _ in results)
+    errors = Counter()
+    for _, _, transfer_errors in results:
+        errors.update(transfer_errors)
+    return TransferStressReport(
+        strategy, statuses, [latency for _, latency, _ in results], errors,
+        elapsed, total_before, total_after, min_balance
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--strategy", default="all",
+                        choices=["all", *STRATEGIES])
+    parser.add_argument("--accounts", type=int, default=20)
+    parser.add_argument("--transfers", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--executor", default="thread",
+                        choices=["thread", "process"])
+    args = parser.parse_args(argv)
+
+    strategies = list(STRATEGIES) if args.strategy == "all" else [args.strategy]
+    for strategy in strategies:
+        print(run_transfer_stress(
+            strategy, accounts_count=args.accounts, transfers=args.transfers,
+            concurrency=args.concurrency, executor=args.executor
+        ))
+
+
+if __name__ == "__main__":
+    main()
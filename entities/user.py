@@ -3,12 +3,14 @@ from api.api_manager import ApiManager
 
 class User:
     def __init__(
-        self, email: str, password: str, roles: list, api: ApiManager
+        self, email: str, password: str, roles: list, api: ApiManager,
+        user_id: str = None
     ):
         self.email = email
         self.password = password
         self.roles = roles
         self.api = api  # Сюда будем передавать экземпляр API Manager для запросов
+        self.id = user_id  # ID пользователя, если он известен (например, создан через API)
 
     @property
     def creds(self):
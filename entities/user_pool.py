@@ -0,0 +1,178 @@
+import itertools
+import logging
+import math
+import os
+import threading
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+from constants import DEFAULT_CONCURRENCY
+
+
+def pool_size_per_worker(total_size, min_size=1):
+    """
+    Размер пула на один воркер pytest-xdist: общий размер делится
+    между воркерами, но не меньше min_size.
+    :param total_size: Желаемое число пользователей роли на весь прогон.
+    :param min_size: Минимальный размер пула воркера.
+    """
+    workers = int(os.environ.get("PYTEST_XDIST_WORKER_COUNT", "1"))
+    return max(min_size, math.ceil(total_size / workers))
+
+
+class UserPool:
+    """
+    Пул заранее созданных и авторизованных пользователей.
+    Тесты арендуют пользователей эксклюзивно или совместно,
+    после теста пользователь возвращается в пул.
+    """
+
+    def __init__(
+        self, create_user, delete_user, reset_user=None,
+        concurrency=DEFAULT_CONCURRENCY
+    ):
+        """
+        :param create_user: Функция role -> User, создающая авторизованного
+            пользователя.
+        :param delete_user: Функция User -> None, удаляющая пользователя.
+        :param reset_user: Функция User -> None для сброса состояния
+            пользователя при возврате в пул (опционально).
+        :param concurrency: Число потоков для массового создания и удаления.
+        """
+        self.create_user = create_user
+        self.delete_user = delete_user
+        self.reset_user = reset_user
+        self.concurrency = concurrency
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._free = defaultdict(list)
+        self._all = defaultdict(list)
+        # id() пользователей, арендованных эксклюзивно и совместно
+        self._exclusive = set()
+        self._shared = Counter()
+        self._round_robin = {}
+
+    def provision(self, size_per_role):
+        """
+        Параллельное создание пользователей.
+        :param size_per_role: Словарь {role: число пользователей}.
+        """
+        roles = [
+            role for role, size in size_per_role.items() for _ in range(size)
+        ]
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            users = list(executor.map(self.create_user, roles))
+        with self._lock:
+            for role, user in zip(roles, users):
+                self._all[role].append(user)
+                self._free[role].append(user)
+        self.logger.info(
+            f"User pool provisioned: "
+            f"{ {role: len(users) for role, users in self._all.items()} }"
+        )
+
+    @contextmanager
+    def lease(self, role, exclusive=True):
+        """
+        Аренда пользователя на время теста.
+        Эксклюзивная аренда отдает свободного пользователя, которого никто
+        не арендовал совместно (или создает нового), совместная - любого
+        пользователя роли, не арендованного эксклюзивно.
+        :param role: Роль пользователя.
+        :param exclusive: Эксклюзивная аренда.
+        """
+        user = self._acquire(role) if exclusive else self._acquire_shared(role)
+        try:
+            yield user
+        finally:
+            if exclusive:
+                self._release(role, user)
+            else:
+                self._release_shared(user)
+
+    def close(self):
+        """
+        Массовое удаление всех пользователей пула.
+        """
+        with self._lock:
+            users = [user for users in self._all.values() for user in users]
+            self._all.clear()
+            self._free.clear()
+            self._exclusive.clear()
+            self._shared.clear()
+        if not users:
+            return
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            results = list(executor.map(self._safe_delete, users))
+        self.logger.info(
+            f"User pool cleanup: deleted {sum(results)} of {len(users)}"
+        )
+
+    def stats(self):
+        with self._lock:
+            return {
+                role: {"total": len(users), "free": len(self._free[role])}
+                for role, users in self._all.items()
+            }
+
+    def _acquire(self, role):
+        with self._lock:
+            free = self._free[role]
+            for index in range(len(free) - 1, -1, -1):
+                if id(free[index]) not in self._shared:
+                    user = free.pop(index)
+                    self._exclusive.add(id(user))
+                    return user
+        user = self.create_user(role)
+        with self._lock:
+            self._all[role].append(user)
+            self._exclusive.add(id(user))
+        return user
+
+    def _acquire_shared(self, role):
+        with self._lock:
+            users = [
+                user for user in self._all[role]
+                if id(user) not in self._exclusive
+            ]
+            if users:
+                counter = self._round_robin.setdefault(role, itertools.count())
+                user = users[next(counter) % len(users)]
+                self._shared[id(user)] += 1
+                return user
+        # Совместная аренда не возвращает пользователя через _release,
+        # поэтому новый пользователь не берется из _free, а только
+        # регистрируется в пуле для совместного использования
+        user = self.create_user(role)
+        with self._lock:
+            self._all[role].append(user)
+            self._shared[id(user)] += 1
+        return user
+
+    def _release(self, role, user):
+        if self.reset_user is not None:
+            try:
+                self.reset_user(user)
+            except Exception as e:
+                # Пользователь остается помеченным как арендованный,
+                # чтобы его больше не выдавали ни эксклюзивно, ни совместно
+                self.logger.warning(f"User reset failed, dropping user: {e}")
+                return
+        with self._lock:
+            self._exclusive.discard(id(user))
+            self._free[role].append(user)
+
+    def _release_shared(self, user):
+        with self._lock:
+            self._shared[id(user)] -= 1
+            if self._shared[id(user)] <= 0:
+                del self._shared[id(user)]
+
+    def _safe_delete(self, user):
+        try:
+            self.delete_user(user)
+            return True
+        except Exception as e:
+            self.logger.warning(f"Failed to delete pooled user {user.email}: {e}")
+            return False
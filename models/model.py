@@ -1,8 +1,10 @@
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
+from pydantic_core import from_json
 
 
 class Roles(str, Enum):
@@ -127,3 +129,56 @@ class Movie(BaseModel):
     rating: float = Field(
         ..., ge=0, le=5, description="Рейтинг должен быть от 0 до 5"
     )
+
+
+class MoviesPage(BaseModel):
+    movies: list[Movie]
+    count: int = Field(..., ge=0)
+    page: int = Field(..., ge=1)
+    pageSize: int = Field(..., ge=1)
+    pageCount: int = Field(..., ge=0)
+
+
+class _SampledMoviesPage(MoviesPage):
+    # Поля страницы проверяются как в MoviesPage, фильмы - выборочно
+    movies: list[Any]
+
+
+@lru_cache(maxsize=None)
+def get_type_adapter(schema):
+    """
+    TypeAdapter для схемы, создается один раз и переиспользуется.
+    :param schema: Модель или тип, например Movie, list[Movie].
+    """
+    return TypeAdapter(schema)
+
+
+def validate_json(content, schema):
+    """
+    Валидация сырого JSON-ответа (bytes/str) сразу в модель за один проход,
+    без промежуточного response.json().
+    :param content: Тело ответа, например response.content.
+    :param schema: Модель или тип, например RegisterUserResponse, list[Movie].
+    """
+    return get_type_adapter(schema).validate_json(content)
+
+
+def validate_movies_page(content, sample_every=1):
+    """
+    Валидация страницы афиши фильмов из сырого JSON-ответа.
+    :param content: Тело ответа get_movie_posters_info.
+    :param sample_every: Проверять только каждый N-й фильм (для нагрузочных
+        прогонов). Страница содержит все фильмы ответа: проверенные -
+        объектами Movie, остальные - словарями из JSON.
+    """
+    if sample_every <= 1:
+        return validate_json(content, MoviesPage)
+    # Разбор JSON занимает около половины полной валидации, поэтому
+    # ответ разбирается один раз и модели строятся только для выборки
+    page = get_type_adapter(_SampledMoviesPage).validate_python(
+        from_json(content)
+    )
+    page.movies[::sample_every] = get_type_adapter(list[Movie]).validate_python(
+        page.movies[::sample_every]
+    )
+    return page
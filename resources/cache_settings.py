@@ -0,0 +1,12 @@
+import os
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+class CacheSettings:
+    # Кэш ответов GET-запросов MoviesAPI включается через RESPONSE_CACHE=1
+    ENABLED = os.getenv('RESPONSE_CACHE', '0') == '1'
+    MAXSIZE = int(os.getenv('RESPONSE_CACHE_MAXSIZE', '256'))
+    TTL = float(os.getenv('RESPONSE_CACHE_TTL', '60'))
@@ -0,0 +1,11 @@
+import os
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+class CassetteSettings:
+    # off - кассета не используется, record - запись, replay - воспроизведение
+    MODE = os.getenv('CASSETTE_MODE', 'off')
+    PATH = os.getenv('CASSETTE_PATH', 'cassettes/cinescope.jsonl')
@@ -0,0 +1,14 @@
+import os
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+class DBBackendSettings:
+    # postgres - удаленная БД из DBCreds, sqlite - локальная замена
+    # для запуска БД-тестов без Postgres
+    BACKEND = os.getenv('DB_BACKEND', 'postgres')
+    # Файл SQLite, :memory: (одно соединение на процесс, без конкурентных
+    # тестов) или пусто - временный файл на процесс
+    SQLITE_PATH = os.getenv('DB_SQLITE_PATH', '')
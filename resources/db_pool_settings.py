@@ -0,0 +1,16 @@
+import os
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+class DBPoolSettings:
+    # Сколько соединений к Postgres может занять весь прогон (все воркеры
+    # xdist вместе), должно быть меньше max_connections сервера
+    MAX_CONNECTIONS = int(os.getenv('DB_MAX_CONNECTIONS', '40'))
+    # Явный размер пула воркера, по умолчанию считается от MAX_CONNECTIONS
+    POOL_SIZE = os.getenv('DB_POOL_SIZE')
+    PRE_PING = os.getenv('DB_POOL_PRE_PING', '1') == '1'
+    RECYCLE = int(os.getenv('DB_POOL_RECYCLE', '1800'))
+    TIMEOUT = float(os.getenv('DB_POOL_TIMEOUT', '30'))
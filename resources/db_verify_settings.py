@@ -0,0 +1,14 @@
+import os
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+class DBVerifySettings:
+    # Когда проверять ожидания db_verifier: test, module или session
+    FLUSH = os.getenv('DB_VERIFY_FLUSH', 'test')
+    # Сколько секунд ждать записи, которые появляются в БД с задержкой
+    TIMEOUT = float(os.getenv('DB_VERIFY_TIMEOUT', '5'))
+    POLL_INTERVAL = float(os.getenv('DB_VERIFY_POLL_INTERVAL', '0.1'))
+    MAX_POLL_INTERVAL = float(os.getenv('DB_VERIFY_MAX_POLL_INTERVAL', '1'))
@@ -0,0 +1,12 @@
+import os
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+class LogSettings:
+    # Логировать каждый N-й успешный запрос на эндпоинт (ошибки логируются всегда)
+    SUCCESS_SAMPLE_RATE = int(os.getenv('REQUEST_LOG_SAMPLE_RATE', '1'))
+    # Вывод логов запросов через фоновый поток
+    BACKGROUND = os.getenv('REQUEST_LOG_BACKGROUND', '0') == '1'
@@ -0,0 +1,14 @@
+import os
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+class RetrySettings:
+    # Повторы запросов выключаются через REQUEST_RETRIES=0
+    MAX_RETRIES = int(os.getenv('REQUEST_RETRIES', '3'))
+    BACKOFF_FACTOR = float(os.getenv('REQUEST_RETRY_BACKOFF', '0.5'))
+    MAX_BACKOFF = float(os.getenv('REQUEST_RETRY_MAX_BACKOFF', '30'))
+    # Общее число повторов на весь прогон
+    TOTAL_BUDGET = int(os.getenv('REQUEST_RETRY_BUDGET', '100'))
@@ -0,0 +1,12 @@
+import os
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+class SQLProfileSettings:
+    # Профилирование SQL-запросов тестов включается через SQL_PROFILE=1
+    ENABLED = os.getenv('SQL_PROFILE', '0') == '1'
+    # С какого числа одинаковых запросов в тесте выводить предупреждение
+    REPEAT_THRESHOLD = int(os.getenv('SQL_PROFILE_REPEAT_THRESHOLD', '2'))
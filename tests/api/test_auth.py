@@ -136,18 +136,33 @@ class TestAuthAPI:
         register_user_response = RegisterUserResponse(**response.json())
 
         # Проверяем добавил ли сервис Auth нового пользователя в базу данных
+        # Один запрос вместо count() + first()
         users_from_db = db_session.query(UserDBModel).filter(
-            UserDBModel.id == register_user_response.id)
-        print(users_from_db)
+            UserDBModel.id == register_user_response.id).all()
 
         # получили обьект из бзы данных и проверили что он действительно существует в единственном экземпляре
-        assert users_from_db.count() == 1, "обьект не попал в базу данных"
+        assert len(users_from_db) == 1, "обьект не попал в базу данных"
         # Достаем первый и единственный обьект из списка полученных
-        user_from_db = users_from_db.first()
+        user_from_db = users_from_db[0]
         # можем осуществить проверку всех полей в базе данных например Email
         assert user_from_db.email == test_user.email, "Email не совпадает"
         # assert user_from_db['email'] == test_user.email, "Email не совпадает"
 
+    def test_register_user_deferred_db_check(
+        self, api_manager: ApiManager, test_user: TestUser, db_verifier
+    ):
+        """
+        Тест на регистрацию пользователя с отложенной проверкой в базе данных.
+        """
+        response = api_manager.auth_api.register_user(test_user)
+        register_user_response = RegisterUserResponse(**response.json())
+
+        # Проверка выполнится пакетно вместе с остальными ожиданиями
+        db_verifier.expect(
+            UserDBModel, register_user_response.id,
+            email=test_user.email, full_name=test_user.fullName
+        )
+
     def test_register_user_mock(self, api_manager: ApiManager, test_user: TestUser, mocker):
         # Ответ полученный из мок сервиса
         mock_response = RegisterUserResponse(  # Фиктивный ответ
@@ -1,9 +1,12 @@
 from datetime import datetime
+from itertools import islice
 
 import pytest
 
 from constants import VALID_MOVIE_ID
-from models.model import Movie, MovieCreation
+from models.model import (Movie, MovieCreation, MovieLocation,
+                          validate_movies_page)
+from utils.data_generator import DataGenerator
 
 
 class TestMoviesAPI:
@@ -46,24 +49,13 @@ class TestMoviesAPI:
         Тест на получение полной информации об афишах фильмов и
         проверку типов данных и структуры информации о фильмах.
         """
-        response = common_user.api.movie_api.get_movie_posters_info().json()
-        assert 'movies' in response, (
-            'Список фильмов отсутствует в ответе'
-        )
-        assert 'count' in response, (
-            'Количество афиш фильмов отсутствует в ответе'
-        )
-        assert response['count'] > 0, (
+        response = common_user.api.movie_api.get_movie_posters_info()
+        # Наличие и типы полей "movies", "count" и каждого фильма
+        # проверяются схемой MoviesPage за один проход по телу ответа
+        page = validate_movies_page(response.content)
+        assert page.count > 0, (
             'Количество афиш фильмов должно быть больше 0'
         )
-        assert isinstance(response['count'], int), (
-            '"count" должен быть целым числом'
-        )
-        assert isinstance(response['movies'], list), (
-            '"movies" должен быть списком'
-        )
-        for movie in response['movies']:
-            Movie(**movie)
 
     @pytest.mark.parametrize('param, value, expected_status', [
         ('genreId', 1, 200),
@@ -119,6 +111,25 @@ class TestMoviesAPI:
                     f'Неверный {param} для фильма '
                 )
 
+    @pytest.mark.slow
+    def test_iter_movies_with_filter(self, common_user):
+        """
+        Тест на постраничный обход афиши фильмов с фильтром.
+        """
+        movies = list(islice(
+            common_user.api.movie_api.iter_movies(
+                filters={'locations': 'MSK', 'pageSize': 10}
+            ),
+            50
+        ))
+        assert movies, 'Фильмы с фильтром не найдены'
+        assert all(movie.location == 'MSK' for movie in movies), (
+            'Неверный locations для фильма'
+        )
+        assert len({movie.id for movie in movies}) == len(movies), (
+            'Фильмы на разных страницах повторяются'
+        )
+
     @pytest.mark.parametrize(
         'pageSize, page, minPrice, maxPrice, '
         'locations, published, genreId, createdAt, expected_status', [
@@ -340,3 +351,31 @@ class TestMoviesAPI:
         assert response_data['message'] == 'Forbidden resource', (
             'Значение поля "message" не равняется "Forbidden resource"'
         )
+
+    def test_add_and_delete_movies_bulk(self, super_admin):
+        """
+        Тест на пакетное создание и удаление фильмов.
+        """
+        movies = [
+            MovieCreation(
+                name=DataGenerator.generate_random_film_name(),
+                price=DataGenerator.generate_random_price(),
+                location=MovieLocation.MSK
+            )
+            for _ in range(5)
+        ]
+        operation = super_admin.api.movie_api.add_movies_bulk(
+            movies, concurrency=5
+        )
+        movie_ids = [
+            Movie(**result.result.json()).id
+            for result in operation if result.ok
+        ]
+        assert operation.report.failed == 0, (
+            f'Ошибки при создании фильмов: {operation.report.errors}'
+        )
+
+        report = super_admin.api.movie_api.delete_movies_bulk(movie_ids).run()
+        assert report.succeeded == len(movies), (
+            f'Ошибки при удалении фильмов: {report.errors}'
+        )
@@ -6,7 +6,9 @@ import pytest
 from pytz import timezone
 
 from api.api_manager import ApiManager
+from db_requester.db_session import is_in_memory_sqlite
 from db_requester.models import AccountTransactionTemplate, MovieDBModel
+from db_requester.transfer_stress import run_transfer_stress
 from utils.data_generator import DataGenerator
 
 
@@ -116,12 +118,12 @@ class TestAccountTransactionTemplate:
     1. Создание двух счетов: Stan и Bob.
     2. Перевод 200 единиц от Stan к Bob.
     3. Проверка изменения балансов.
-    4. Очистка тестовых данных.
+    Тестовые данные откатываются вместе с транзакцией теста (db_transaction).
     """)
     @allure.severity(allure.severity_level.CRITICAL)
     @allure.label("qa_name", "Ivan Petrovich")
     @allure.title("Тест перевода денег между счетами 200 рублей")
-    def test_accounts_transaction_template(self, db_session):
+    def test_accounts_transaction_template(self, db_transaction):
         # ====================================================================== Подготовка к тесту
         # Создаем новые записи в базе данных (чтоб точно быть уверенными что в базе присутствуют данные для тестирования)
         with allure.step(
@@ -135,9 +137,9 @@ class TestAccountTransactionTemplate:
                 balance=500
             )
             # Добавляем записи в сессию
-            db_session.add_all([stan, bob])
+            db_transaction.add_all([stan, bob])
             # Фиксируем изменения в базе данных
-            db_session.commit()
+            db_transaction.commit()
 
         @allure.step("Функция перевода денег: transfer_money")
         @allure.description("""
@@ -181,7 +183,7 @@ class TestAccountTransactionTemplate:
 
         try:
             with allure.step('Выполняем перевод 200 единиц от stan к bob'):
-                transfer_money(db_session, from_account=stan.user,
+                transfer_money(db_transaction, from_account=stan.user,
                                to_account=bob.user, amount=200)
 
             with allure.step('Проверяем, что балансы изменились'):
@@ -190,15 +192,25 @@ class TestAccountTransactionTemplate:
 
         except Exception as e:
             with allure.step('Если произошла ошибка, откатываем транзакцию'):
-                db_session.rollback()  # откат всех введеных нами изменений
+                db_transaction.rollback()  # откат всех введеных нами изменений
             pytest.fail(f"Ошибка при переводе денег: {e}")
 
-        finally:
-            with allure.step("Удаляем данные для тестирования из базы"):
-                db_session.delete(stan)
-                db_session.delete(bob)
-                # Фиксируем изменения в базе данных
-                db_session.commit()
+    @allure.title("Нагрузочный тест конкурентных переводов между счетами")
+    @pytest.mark.slow
+    @pytest.mark.db
+    @pytest.mark.parametrize(
+        "strategy", ["for_update", "optimistic", "serializable"]
+    )
+    def test_accounts_concurrent_transfers(self, db_engine, strategy):
+        if is_in_memory_sqlite(db_engine.url):
+            pytest.skip("In-memory SQLite - одно соединение на все потоки")
+        report = run_transfer_stress(
+            strategy, engine=db_engine, accounts_count=20, transfers=1000,
+            concurrency=16
+        )
+        allure.attach(str(report), name=f"Итог {strategy}")
+        assert report.money_conserved, str(report)
+        assert report.succeeded > 0, str(report)
 
     @allure.title("Тест с перезапусками")
     @pytest.mark.flaky(reruns=3)
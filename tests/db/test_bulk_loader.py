@@ -0,0 +1,82 @@
+import csv
+import io
+
+from sqlalchemy import func, select
+
+from db_requester.bulk_loader import BulkLoader, _CopyReader
+from db_requester.models import (AccountTransactionTemplate, MovieDBModel,
+                                 UserDBModel)
+
+
+def count_rows(engine, table):
+    with engine.connect() as connection:
+        return connection.execute(select(func.count()).select_from(table)).scalar()
+
+
+class TestBulkLoader:
+
+    def test_load_and_cleanup_by_run_id(self, sqlite_engine):
+        """
+        Тест на пакетную загрузку и удаление строк по тегу прогона.
+        """
+        loader = BulkLoader(sqlite_engine, batch_size=300)
+        other_run = BulkLoader(sqlite_engine)
+        assert loader.load_users(1000, seed=1) == 1000
+        assert loader.load_accounts(50) == 50
+        other_run.load_accounts(10)
+
+        assert count_rows(sqlite_engine, UserDBModel.__table__) == 1000
+        with sqlite_engine.connect() as connection:
+            emails = connection.execute(select(UserDBModel.email)).scalars()
+            assert all(email.startswith(loader.tag) for email in emails)
+
+        assert loader.cleanup() == {
+            "users": 1000, "accounts_transaction_template": 50
+        }
+        assert count_rows(sqlite_engine, AccountTransactionTemplate.__table__) == 10
+
+    def test_load_movies_and_cleanup_by_run_id(self, sqlite_engine):
+        """
+        Тест на пакетную загрузку фильмов с уникальными ID
+        и их удаление по тегу прогона.
+        """
+        loader = BulkLoader(sqlite_engine, batch_size=300)
+        assert loader.load_movies(1000, seed=1) == 1000
+        other_run = BulkLoader(sqlite_engine)
+        other_run.load_movies(10)
+
+        with sqlite_engine.connect() as connection:
+            ids = connection.execute(select(MovieDBModel.id)).scalars().all()
+        assert len(set(ids)) == 1010
+
+        assert loader.cleanup() == {"movies": 1000}
+        assert count_rows(sqlite_engine, MovieDBModel.__table__) == 10
+        assert other_run.cleanup(other_run.run_id) == {
+            "users": 0, "movies": 10, "accounts_transaction_template": 0
+        }
+
+    def test_rows_are_generated_lazily(self, sqlite_engine):
+        """
+        Тест на ленивую генерацию строк пачками.
+        """
+        loader = BulkLoader(sqlite_engine, batch_size=100)
+        rows = loader.user_rows(10 ** 6)
+        first = next(rows)
+        assert first["email"].startswith(loader.tag)
+        assert first["roles"] == "{USER}"
+
+    def test_copy_reader_streams_csv(self):
+        """
+        Тест на потоковое формирование CSV для COPY FROM STDIN.
+        """
+        rows = ({"user": f"user_{i}", "balance": i} for i in range(1000))
+        reader = _CopyReader(rows, ["user", "balance"])
+        chunks = []
+        while chunk := reader.read(256):
+            assert len(chunk) <= 256
+            chunks.append(chunk)
+
+        parsed = list(csv.reader(io.StringIO("".join(chunks))))
+        assert reader.count == 1000
+        assert parsed[0] == ["user_0", "0"]
+        assert parsed[-1] == ["user_999", "999"]
@@ -0,0 +1,137 @@
+import pytest
+
+from db_requester.bulk_loader import BulkLoader
+from db_requester.consistency import (MOVIE_FIELDS, api_rows, check_movies,
+                                      check_users, compare)
+from db_requester.models import MovieDBModel, UserDBModel
+from models.model import Movie, MovieLocation
+
+
+class CatalogStub:
+    """
+    Заглушка MoviesAPI: отдает заранее заданный каталог.
+    """
+
+    def __init__(self, movies):
+        self.movies = movies
+        self.filters = None
+
+    def iter_movies(self, filters=None):
+        self.filters = filters
+        return iter(self.movies)
+
+
+class UserAPIStub:
+    """
+    Заглушка UserAPI: "gone" отвечает 404, "broken" - ошибкой статуса.
+    """
+
+    class _Response:
+
+        def __init__(self, data):
+            self.data = data
+
+        def json(self):
+            return self.data
+
+    def get_user(self, user_id, expected_status=200):
+        if user_id == "broken":
+            raise ValueError("Unexpected status code: 503")
+        if user_id == "gone":
+            return self._Response({"message": "not found"})
+        return self._Response({
+            "id": user_id, "email": f"{user_id}@gmail.com",
+            "fullName": "Name", "verified": True, "banned": False
+        })
+
+
+def make_movie(movie_id, **fields):
+    movie = {
+        "id": movie_id, "name": f"movie {movie_id}", "price": 100,
+        "description": "description", "imageUrl": None,
+        "location": MovieLocation.MSK,
+        "published": True, "genreId": 1, "genre": {"name": "Drama"},
+        "rating": 4.5
+    }
+    movie.update(fields)
+    return Movie(**movie)
+
+
+@pytest.fixture()
+def movies_engine(sqlite_engine):
+    BulkLoader(sqlite_engine).load(MovieDBModel.__table__, (
+        {
+            "id": str(movie_id), "name": f"movie {movie_id}", "price": 100,
+            "genre_id": "1", "location": "MSK", "published": True
+        }
+        for movie_id in range(1, 101)
+    ))
+    return sqlite_engine
+
+
+class TestConsistency:
+
+    def test_consistent_catalog(self, movies_engine):
+        """
+        Тест на совпадение афиши API и таблицы movies с приведением типов.
+        """
+        catalog = CatalogStub([make_movie(i) for i in range(1, 101)])
+        report = check_movies(
+            catalog, filters={"published": None}, engine=movies_engine
+        )
+        assert report.consistent, str(report)
+        assert report.api_count == report.db_count == 100
+        assert catalog.filters == {"published": None}
+
+    def test_reports_missing_ids_and_field_mismatches(self, movies_engine):
+        """
+        Тест на отчет о недостающих ID и расхождениях по полям.
+        """
+        movies = [make_movie(i) for i in range(2, 101)]
+        movies[0] = make_movie(2, price=150)
+        movies[1] = make_movie(3, location=MovieLocation.SPB, genreId=2)
+        movies.append(make_movie(500))
+        report = check_movies(
+            CatalogStub(movies), engine=movies_engine, max_examples=2
+        )
+
+        assert not report.consistent
+        assert report.missing_in_db == ["500"]
+        assert report.missing_in_api == ["1"]
+        assert report.field_mismatches == {
+            "price": 1, "location": 1, "genreId": 1
+        }
+        assert report.examples == [
+            ("2", "price", 150, 100), ("3", "location", "SPB", "MSK")
+        ]
+        assert "нет в БД 1" in str(report)
+
+    def test_compare_accepts_dict_records(self):
+        """
+        Тест на сравнение записей в виде dict (ответы /user/{id}).
+        """
+        fields = (("fullName", "full_name", str),)
+        api = api_rows([{"id": "a", "fullName": "A"}], fields)
+        report = compare("users", api, [("a", ("B",))], fields)
+        assert report.field_mismatches == {"fullName": 1}
+        assert MOVIE_FIELDS[0][0] == "name"
+
+    def test_user_fetch_errors_are_not_missing(self, sqlite_engine):
+        """
+        Тест на отдельный учет ошибок API: недоступный пользователь
+        не считается отсутствующим, 404 - считается.
+        """
+        BulkLoader(sqlite_engine).load(UserDBModel.__table__, (
+            {"id": user_id, "email": f"{user_id}@gmail.com",
+             "full_name": "Name", "verified": True, "banned": False}
+            for user_id in ("ok", "gone", "broken")
+        ))
+        report = check_users(UserAPIStub(), engine=sqlite_engine)
+
+        assert report.missing_in_api == ["gone"]
+        assert [record_id for record_id, _ in report.fetch_errors] == [
+            "broken"
+        ]
+        assert report.db_count == 2
+        assert not report.consistent
+        assert "ошибки API 1" in str(report)
@@ -0,0 +1,156 @@
+import datetime
+import time
+
+import pytest
+from sqlalchemy import text
+
+from custom_requester.bulk import BulkOperation
+from db_requester.bulk_loader import BulkLoader
+from db_requester.data_gc import (collect_garbage, find_orphans, is_test_value,
+                                  utc_now)
+from db_requester.models import MovieDBModel, UserDBModel
+
+OLD = utc_now() - datetime.timedelta(days=1)
+NOW = utc_now()
+
+USERS = {
+    "real": ("real@example.com", OLD),
+    "kek-old": ("kek1a2b3c4d@gmail.com", OLD),
+    "kek-new": ("kek18a3f0c2b4d5e6f@gmail.com", NOW),
+    "kek-legacy": ("kekab12cd34@gmail.com", None),
+}
+MOVIES = {
+    "1": ("Настоящий фильм", OLD),
+    "2": ("Return to Paris 1709999999999", OLD),
+    "3": ("Back to Chile 18a3f0c2b4d5e6f", OLD),
+    "4": ("Red house 18a3f0c2b4d5e6f", NOW),
+    "5": ("Фильм 2024", OLD),
+}
+
+
+@pytest.fixture()
+def gc_engine(sqlite_engine):
+    loader = BulkLoader(sqlite_engine)
+    loader.load(UserDBModel.__table__, (
+        {"id": user_id, "email": email, "created_at": created_at}
+        for user_id, (email, created_at) in USERS.items()
+    ))
+    loader.load(MovieDBModel.__table__, (
+        {"id": movie_id, "name": name, "price": 100, "genre_id": "1",
+         "created_at": created_at}
+        for movie_id, (name, created_at) in MOVIES.items()
+    ))
+    return sqlite_engine
+
+
+class FakeApiManager:
+    """
+    Заглушка ApiManager: запоминает ID, удаленные через API.
+    """
+
+    def __init__(self):
+        self.deleted = []
+        self.movie_api = self
+        self.user_api = self
+
+    def delete_movies_bulk(self, ids, concurrency, rate_limit,
+                           expected_status):
+        return BulkOperation(self.deleted.append, ids, concurrency=concurrency)
+
+    def delete_user(self, user_id, expected_status):
+        self.deleted.append(user_id)
+
+
+class TestDataGC:
+
+    def test_patterns(self):
+        """
+        Тест на распознавание тестовых email и названий фильмов.
+        """
+        assert is_test_value("users", "kek1a2b3c4d@gmail.com")
+        assert is_test_value("users", "seed1f_kek1@gmail.com")
+        assert not is_test_value("users", "kek@example.com")
+        assert is_test_value("movies", "Back to Chile 18a3f0c2b4d5e6f")
+        assert is_test_value("movies", "Return to Paris 1709999999999")
+        assert not is_test_value("movies", "Фильм 2024")
+
+    def test_dry_run_keeps_data(self, gc_engine):
+        """
+        Тест на dry-run: старые тестовые записи найдены, но не удалены.
+        """
+        reports = collect_garbage(dry_run=True, engine=gc_engine)
+        assert [(report.table, report.found, report.deleted)
+                for report in reports] == [("users", 2, 0), ("movies", 2, 0)]
+        assert len(list(find_orphans("users", engine=gc_engine))) == 2
+
+    def test_delete_via_db_skips_real_and_recent(self, gc_engine):
+        """
+        Тест на пакетное удаление через БД без затрагивания настоящих
+        и недавно созданных записей.
+        """
+        reports = collect_garbage(batch_size=1, engine=gc_engine)
+        assert [report.deleted for report in reports] == [2, 2]
+
+        with gc_engine.connect() as connection:
+            user_ids = connection.scalars(UserDBModel.__table__.select()).all()
+            movie_ids = connection.scalars(
+                MovieDBModel.__table__.select()
+            ).all()
+        assert sorted(user_ids) == ["kek-new", "real"]
+        assert sorted(movie_ids) == ["1", "4", "5"]
+
+    def test_run_id_and_api(self, gc_engine):
+        """
+        Тест на удаление записей одного прогона BulkLoader через API.
+        """
+        loader = BulkLoader(gc_engine)
+        loader.load_users(3, seed=1)
+        BulkLoader(gc_engine).load_users(2, seed=2)
+
+        api_manager = FakeApiManager()
+        (report,) = collect_garbage(
+            ["users"], via="api", run_id=loader.run_id, older_than=0,
+            api_manager=api_manager, engine=gc_engine
+        )
+        assert report.found == report.deleted == 3
+        assert report.failed == 0
+        assert len(set(api_manager.deleted)) == 3
+        assert "удалено 3" in str(report)
+
+        with pytest.raises(ValueError, match="api_manager"):
+            collect_garbage(["movies"], via="api", engine=gc_engine)
+
+    def test_age_cutoff_uses_utc(self, gc_engine, monkeypatch):
+        """
+        Тест на расчет возраста записей по UTC на раннере восточнее UTC:
+        запись, созданная 30 минут назад, не считается старой.
+        """
+        loader = BulkLoader(gc_engine)
+        loader.load(MovieDBModel.__table__, [
+            {"id": "recent", "name": "Red sky 18a3f0c2b4d5e6f",
+             "price": 100, "genre_id": "1",
+             "created_at": utc_now() - datetime.timedelta(minutes=30)},
+        ])
+        monkeypatch.setenv("TZ", "Etc/GMT-3")  # UTC+3
+        time.tzset()
+        try:
+            ids = set(find_orphans("movies", older_than=60, engine=gc_engine))
+        finally:
+            monkeypatch.undo()
+            time.tzset()
+        assert ids == {"2", "3"}
+
+    def test_fk_failures_are_counted(self, gc_engine):
+        """
+        Тест на учет записей, которые не удалось удалить из-за внешнего
+        ключа: остальные записи пачки удаляются.
+        """
+        with gc_engine.begin() as connection:
+            connection.execute(text(
+                "CREATE TABLE reviews (movie_id VARCHAR REFERENCES movies(id))"
+            ))
+            connection.execute(text("INSERT INTO reviews VALUES ('2')"))
+
+        (report,) = collect_garbage(["movies"], engine=gc_engine)
+        assert (report.found, report.deleted, report.failed) == (2, 1, 1)
+        assert report.errors[0][0] == "2"
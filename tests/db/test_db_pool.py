@@ -0,0 +1,60 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from db_requester.db_pool import InstrumentedQueuePool
+from db_requester.db_session import pool_options
+
+# Пул на одно соединение и одно overflow с коротким таймаутом,
+# без создания схемы: соединения пула открывают только сами тесты
+SMALL_POOL = pytest.mark.parametrize("sqlite_engine", [{
+    "create_schema": False, "poolclass": InstrumentedQueuePool,
+    "pool_size": 1, "max_overflow": 1, "pool_timeout": 0.05,
+}], indirect=True)
+
+
+class TestDBPool:
+
+    def test_pool_options_split_budget_between_workers(self):
+        """
+        Тест на деление бюджета соединений между воркерами xdist.
+        """
+        options = pool_options(max_connections=40, workers=4)
+        assert options["pool_size"] == 5
+        assert options["max_overflow"] == 5
+
+        options = pool_options(max_connections=40, workers=8, pool_size=4)
+        assert (options["pool_size"], options["max_overflow"]) == (4, 1)
+        assert pool_options(max_connections=2, workers=8)["pool_size"] == 1
+
+    @SMALL_POOL
+    def test_pool_metrics(self, sqlite_engine):
+        """
+        Тест на метрики получения соединений из пула.
+        """
+        for _ in range(3):
+            with sqlite_engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+
+        with sqlite_engine.connect(), sqlite_engine.connect():
+            stats = sqlite_engine.pool.stats()
+            assert stats["checked_out"] == 2
+
+        stats = sqlite_engine.pool.stats()
+        assert stats["checkouts"] == 5
+        assert stats["connections_created"] == 2
+        assert stats["peak_checked_out"] == 2
+        assert stats["timeouts"] == 0
+
+    @SMALL_POOL
+    def test_pool_timeout_is_counted(self, sqlite_engine):
+        """
+        Тест на учет ожиданий и таймаутов при исчерпанном пуле.
+        """
+        with sqlite_engine.connect(), sqlite_engine.connect():
+            with pytest.raises(PoolTimeoutError):
+                sqlite_engine.connect()
+
+        stats = sqlite_engine.pool.stats()
+        assert stats["exhausted_waits"] == 1
+        assert stats["timeouts"] == 1
@@ -0,0 +1,49 @@
+import pytest
+
+from db_requester.db_session import transactional_session
+from db_requester.models import AccountTransactionTemplate
+
+
+def count_accounts(engine):
+    with transactional_session(engine) as session:
+        return session.query(AccountTransactionTemplate).count()
+
+
+class TestTransactionalSession:
+
+    def test_commits_are_rolled_back_after_test(self, sqlite_engine):
+        """
+        Тест на откат зафиксированных в тесте изменений.
+        """
+        with transactional_session(sqlite_engine) as session:
+            session.add(AccountTransactionTemplate(user="Stan", balance=1000))
+            session.commit()
+            session.add(AccountTransactionTemplate(user="Bob", balance=500))
+            session.commit()
+            assert session.query(AccountTransactionTemplate).count() == 2
+
+        assert count_accounts(sqlite_engine) == 0
+
+    def test_rollback_returns_to_last_commit(self, sqlite_engine):
+        """
+        Тест на откат к последнему commit() внутри теста.
+        """
+        with transactional_session(sqlite_engine) as session:
+            stan = AccountTransactionTemplate(user="Stan", balance=1000)
+            session.add(stan)
+            session.commit()
+            stan.balance -= 200
+            session.rollback()
+            assert session.get(AccountTransactionTemplate, "Stan").balance == 1000
+
+    def test_failed_test_leaves_no_rows(self, sqlite_engine):
+        """
+        Тест на отсутствие "осиротевших" строк при падении теста.
+        """
+        with pytest.raises(RuntimeError):
+            with transactional_session(sqlite_engine) as session:
+                session.add(AccountTransactionTemplate(user="Stan", balance=1000))
+                session.commit()
+                raise RuntimeError("тест упал")
+
+        assert count_accounts(sqlite_engine) == 0
@@ -0,0 +1,77 @@
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from db_requester.db_verifier import DBVerifier
+from db_requester.models import AccountTransactionTemplate
+
+
+@pytest.fixture
+def session_factory(sqlite_engine):
+    factory = sessionmaker(bind=sqlite_engine)
+    with factory() as session:
+        session.add_all([
+            AccountTransactionTemplate(user=f"user_{i}", balance=i)
+            for i in range(2500)
+        ])
+        session.commit()
+    return factory
+
+
+class TestDBVerifier:
+
+    def test_expectations_are_checked_in_bulk(self, session_factory):
+        """
+        Тест на пакетную проверку ожиданий запросами WHERE id IN (...).
+        """
+        verifier = DBVerifier(session_factory, timeout=0)
+        verifier.current_test = "test_a"
+        for i in range(2500):
+            verifier.expect(AccountTransactionTemplate, f"user_{i}", balance=i)
+        verifier.expect(AccountTransactionTemplate, "deleted", exists=False)
+
+        assert verifier.flush() == []
+        assert verifier.queries == 3  # 2501 ID чанками по 1000
+        assert verifier.pending == 0
+
+    def test_failures_are_reported_per_test(self, session_factory):
+        """
+        Тест на отчет о невыполненных ожиданиях с тестом-источником.
+        """
+        verifier = DBVerifier(session_factory, timeout=0)
+        verifier.current_test = "test_a"
+        verifier.expect(AccountTransactionTemplate, "user_1", balance=100)
+        verifier.current_test = "test_b"
+        verifier.expect(AccountTransactionTemplate, "missing")
+        verifier.expect(AccountTransactionTemplate, "user_2", exists=False)
+
+        failures = verifier.flush()
+        assert [str(failure) for failure in failures] == [
+            "test_a: accounts_transaction_template id=user_1: "
+            "balance=1 (ожидалось 100)",
+            "test_b: accounts_transaction_template id=missing: строка не найдена",
+            "test_b: accounts_transaction_template id=user_2: "
+            "строка не должна существовать",
+        ]
+        assert verifier.failures == failures
+
+    def test_polls_with_backoff_until_row_appears(self, session_factory):
+        """
+        Тест на повторные проверки с экспоненциальной задержкой
+        для записей, появляющихся с задержкой.
+        """
+        delays = []
+
+        def sleep(delay):
+            delays.append(delay)
+            if len(delays) == 3:
+                with session_factory() as session:
+                    session.add(AccountTransactionTemplate(user="late", balance=1))
+                    session.commit()
+
+        verifier = DBVerifier(
+            session_factory, timeout=10, poll_interval=0.1,
+            max_poll_interval=0.3, sleep=sleep
+        )
+        verifier.expect(AccountTransactionTemplate, "late", balance=1)
+        assert verifier.flush() == []
+        assert delays == [0.1, 0.2, 0.3]
@@ -0,0 +1,61 @@
+import pytest
+from sqlalchemy.orm import Session
+
+from db_requester.models import AccountTransactionTemplate
+from db_requester.sql_profiler import SQLProfiler, normalize_statement
+
+
+@pytest.fixture
+def profiled_engine(sqlite_engine):
+    profiler = SQLProfiler(repeat_threshold=3)
+    profiler.attach(sqlite_engine)
+    yield sqlite_engine, profiler
+    profiler.detach()
+
+
+class TestSQLProfiler:
+
+    def test_normalize_statement(self):
+        """
+        Тест на нормализацию текста SQL-запроса.
+        """
+        statement = """SELECT users.id FROM users
+            WHERE users.id IN (%(id_1_1)s, %(id_1_2)s) AND users.email = %(email_1)s
+            AND users.created_at::date = :day"""
+        assert normalize_statement(statement) == (
+            "SELECT users.id FROM users WHERE users.id IN (?) "
+            "AND users.email = ? AND users.created_at::date = ?"
+        )
+
+    def test_count_then_fetch_and_repeats_are_flagged(self, profiled_engine):
+        """
+        Тест на обнаружение count() + first() и повторяющихся запросов.
+        """
+        engine, profiler = profiled_engine
+        profiler.start_test("test_example")
+        with Session(engine) as session:
+            query = session.query(AccountTransactionTemplate).filter(
+                AccountTransactionTemplate.user == "Stan"
+            )
+            query.count()
+            query.first()
+            for user in ("a", "b", "c"):
+                session.get(AccountTransactionTemplate, user)
+        summary = profiler.finish_test()
+
+        assert summary.queries == 5
+        assert len(summary.count_then_fetch) == 1
+        assert list(summary.repeated.values()) == [3]
+        assert summary.as_dict()["total_ms"] > 0
+        assert "повтор x3" in str(summary)
+
+    def test_queries_outside_tests_are_ignored(self, profiled_engine):
+        """
+        Тест на отсутствие записей вне теста и для тестов без запросов.
+        """
+        engine, profiler = profiled_engine
+        with engine.connect() as connection:
+            connection.exec_driver_sql("SELECT 1")
+        profiler.start_test("test_without_sql")
+        assert profiler.finish_test() is None
+        assert profiler.summaries == []
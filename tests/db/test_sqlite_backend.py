@@ -0,0 +1,77 @@
+import datetime
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from db_requester.db_session import transactional_session
+from db_requester.models import (GenreDBModel, MovieDBModel, PgArrayLiteral,
+                                 UserDBModel)
+from db_requester.sqlite_backend import DEFAULT_GENRES, create_sqlite_engine
+from enums.roles import Roles
+
+
+def make_movie(genre_id):
+    return MovieDBModel(
+        id="1", name="Фильм", price=100, genre_id=genre_id,
+        location="MSK", published=True, created_at=datetime.datetime.now()
+    )
+
+
+class TestSQLiteBackend:
+
+    def test_schema_and_genres(self, sqlite_engine):
+        """
+        Тест на создание схемы и заполнение жанров.
+        """
+        with transactional_session(sqlite_engine) as session:
+            genres = session.query(GenreDBModel).order_by(GenreDBModel.id).all()
+            assert [genre.name for genre in genres] == list(DEFAULT_GENRES)
+
+            session.add(make_movie(genre_id="1"))
+            session.commit()
+            assert session.get(MovieDBModel, "1").genre_id == "1"
+
+    def test_foreign_keys_are_enforced(self, sqlite_engine):
+        """
+        Тест на проверку внешнего ключа genre_id.
+        """
+        with transactional_session(sqlite_engine) as session:
+            session.add(make_movie(genre_id="404"))
+            with pytest.raises(IntegrityError):
+                session.commit()
+
+    def test_roles_array_literal(self, sqlite_engine):
+        """
+        Тест на адаптер массива ролей в литерал "{USER,ADMIN}".
+        """
+        with transactional_session(sqlite_engine) as session:
+            session.add_all([
+                UserDBModel(id="1", email="a@gmail.com",
+                            roles=[Roles.USER, Roles.ADMIN]),
+                UserDBModel(id="2", email="b@gmail.com", roles="{USER}"),
+            ])
+            session.commit()
+            session.expire_all()
+
+            assert session.get(UserDBModel, "1").roles == "{USER,ADMIN}"
+            assert session.get(UserDBModel, "2").roles == "{USER}"
+        assert PgArrayLiteral.parse("{USER,ADMIN}") == ["USER", "ADMIN"]
+        assert PgArrayLiteral.parse("{}") == []
+
+    def test_file_backed_database_is_persistent(self, tmp_path):
+        """
+        Тест на файловую БД: данные видны новому движку.
+        """
+        path = tmp_path / "cinescope.db"
+        engine = create_sqlite_engine(str(path))
+        with engine.begin() as connection:
+            connection.execute(UserDBModel.__table__.insert(), [
+                {"id": "1", "email": "a@gmail.com", "roles": "{USER}"}
+            ])
+        engine.dispose()
+
+        engine = create_sqlite_engine(str(path))
+        with transactional_session(engine) as session:
+            assert session.query(UserDBModel).count() == 1
+            assert session.query(GenreDBModel).count() == len(DEFAULT_GENRES)
+        engine.dispose()
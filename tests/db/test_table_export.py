@@ -0,0 +1,74 @@
+import csv
+import io
+import json
+
+import pytest
+
+from db_requester.bulk_loader import BulkLoader
+from db_requester.models import UserDBModel
+from db_requester.table_export import (export_csv, export_jsonl, get_table,
+                                       stream_chunks, stream_column_batches,
+                                       stream_rows)
+
+
+@pytest.fixture
+def users_engine(sqlite_engine):
+    BulkLoader(sqlite_engine).load_users(2500, seed=1)
+    return sqlite_engine
+
+
+class TestTableExport:
+
+    def test_stream_rows_in_chunks(self, users_engine):
+        """
+        Тест на потоковое чтение таблицы пачками по chunk_size.
+        """
+        chunks = stream_chunks(
+            "users", columns=["id", "email"], chunk_size=1000,
+            engine=users_engine
+        )
+        assert [len(chunk) for chunk in chunks] == [1000, 1000, 500]
+
+        first = next(stream_rows(UserDBModel, engine=users_engine))
+        assert isinstance(first, tuple)
+        assert len(first) == len(UserDBModel.__table__.columns)
+
+    def test_column_batches(self, users_engine):
+        """
+        Тест на колоночные пачки с компактными массивами.
+        """
+        batch = next(stream_column_batches(
+            "users", columns=["email", "verified"], chunk_size=100,
+            engine=users_engine
+        ))
+        assert batch["verified"].typecode == "b"
+        assert len(batch["email"]) == 100
+
+    def test_export_jsonl_and_csv(self, users_engine):
+        """
+        Тест на выгрузку таблицы в JSONL и CSV.
+        """
+        where = UserDBModel.verified.is_(True)
+        jsonl = io.StringIO()
+        count = export_jsonl(
+            jsonl, "users", columns=["id", "email", "created_at"],
+            where=where, engine=users_engine
+        )
+        lines = jsonl.getvalue().splitlines()
+        assert count == len(lines) == 2500
+        assert set(json.loads(lines[0])) == {"id", "email", "created_at"}
+
+        csv_file = io.StringIO()
+        assert export_csv(
+            csv_file, "users", columns=["id", "email"], engine=users_engine
+        ) == 2500
+        rows = list(csv.reader(io.StringIO(csv_file.getvalue())))
+        assert rows[0] == ["id", "email"]
+        assert len(rows) == 2501
+
+    def test_unknown_table(self):
+        """
+        Тест на ошибку для неизвестной таблицы.
+        """
+        with pytest.raises(ValueError, match="Неизвестная таблица"):
+            get_table("unknown")
@@ -0,0 +1,89 @@
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from db_requester import transfer_stress
+from db_requester.bulk_loader import BulkLoader
+from db_requester.transfer_stress import (TransferConflict, classify_error,
+                                          run_transfer_stress,
+                                          transfer_optimistic)
+
+
+class PgError(Exception):
+
+    def __init__(self, pgcode):
+        super().__init__(pgcode)
+        self.pgcode = pgcode
+
+
+class TestTransferStress:
+
+    @pytest.mark.parametrize(
+        "strategy", ["for_update", "optimistic", "serializable"]
+    )
+    def test_money_is_conserved(self, sqlite_engine, strategy):
+        """
+        Тест на сохранение суммы денег при конкурентных переводах.
+        """
+        report = run_transfer_stress(
+            strategy, engine=sqlite_engine, accounts_count=5, transfers=100,
+            concurrency=4, seed=1
+        )
+        assert report.money_conserved
+        assert report.total_before == 5000
+        assert report.succeeded + report.rejected + report.failed == 100
+        assert report.throughput > 0
+        assert strategy in str(report)
+
+    def test_process_executor_uses_passed_engine(self, sqlite_engine):
+        """
+        Тест на прогон в процессах: дочерние процессы открывают
+        переданную БД, а не get_engine().
+        """
+        report = run_transfer_stress(
+            "optimistic", engine=sqlite_engine, accounts_count=5,
+            transfers=40, concurrency=2, executor="process", seed=1
+        )
+        assert report.money_conserved
+        assert report.succeeded + report.rejected + report.failed == 40
+        assert report.succeeded > 0
+
+    @pytest.mark.parametrize(
+        "sqlite_engine", [{"memory": True}], indirect=True
+    )
+    def test_process_executor_rejects_memory_db(self, sqlite_engine):
+        """
+        Тест на ошибку прогона в процессах с in-memory SQLite.
+        """
+        with pytest.raises(ValueError, match="In-memory"):
+            run_transfer_stress(
+                "optimistic", engine=sqlite_engine, accounts_count=2,
+                transfers=2, concurrency=1, executor="process"
+            )
+
+    def test_optimistic_conflict(self, sqlite_engine, monkeypatch):
+        """
+        Тест на обнаружение изменения баланса между чтением и записью.
+        """
+        loader = BulkLoader(sqlite_engine)
+        loader.load_accounts(2, balance=100)
+        first, second = (row["user"] for row in loader.account_rows(2))
+        # Прочитанный баланс устарел: в БД уже 100, а не 90
+        monkeypatch.setattr(
+            transfer_stress, "_read_balances",
+            lambda connection, users, for_update=False: {first: 90, second: 100}
+        )
+        with pytest.raises(TransferConflict):
+            with sqlite_engine.begin() as connection:
+                transfer_optimistic(connection, first, second, 10)
+
+    def test_classify_error(self):
+        """
+        Тест на распознавание ошибок, после которых перевод повторяется.
+        """
+        def error(orig):
+            return OperationalError("UPDATE ...", {}, orig)
+
+        assert classify_error(error(PgError("40001"))) == "serialization_failures"
+        assert classify_error(error(PgError("40P01"))) == "deadlocks"
+        assert classify_error(error(Exception("database is locked"))) == "deadlocks"
+        assert classify_error(error(PgError("23505"))) is None
@@ -0,0 +1,77 @@
+import asyncio
+
+import httpx
+import pytest
+from pydantic import BaseModel
+
+from custom_requester.async_custom_requester import (AsyncCustomRequester,
+                                                     gather_with_concurrency)
+from test_services.service_what_is_today import app
+
+BASE_URL = "http://what-is-today"
+
+
+class DateTimeRequest(BaseModel):
+    currentDateTime: str
+
+
+def run_with_requester(scenario):
+    """
+    Запуск сценария с AsyncCustomRequester поверх FastAPI-приложения
+    из test_services без поднятия сервера.
+    """
+    async def _run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport) as client:
+            requester = AsyncCustomRequester(session=client, base_url=BASE_URL)
+            return await scenario(requester)
+
+    return asyncio.run(_run())
+
+
+class TestAsyncCustomRequester:
+
+    def test_send_request_with_pydantic_body(self):
+        """
+        Тест на отправку pydantic-модели в теле асинхронного запроса.
+        """
+        async def scenario(requester):
+            return await requester.send_request(
+                method="POST",
+                endpoint="/what_is_today",
+                data=DateTimeRequest(currentDateTime="2025-01-01T00:00Z"),
+                expected_status=200
+            )
+
+        response = run_with_requester(scenario)
+        assert response.json()["message"] == "Новый год"
+
+    def test_unexpected_status_raises(self):
+        """
+        Тест на проверку ожидаемого статус-кода.
+        """
+        async def scenario(requester):
+            return await requester.send_request(
+                method="POST",
+                endpoint="/what_is_today",
+                data={"currentDateTime": "01.01.2025"},
+                expected_status=200
+            )
+
+        with pytest.raises(ValueError, match="Unexpected status code: 400"):
+            run_with_requester(scenario)
+
+    def test_gather_with_concurrency(self):
+        """
+        Тест на конкурентное выполнение запросов с ограничением параллелизма.
+        """
+        async def scenario(requester):
+            requests = (
+                requester.send_request("GET", "/ping", expected_status=200)
+                for _ in range(50)
+            )
+            return await gather_with_concurrency(requests, concurrency=5)
+
+        responses = run_with_requester(scenario)
+        assert len(responses) == 50
+        assert all(response.json() == "PONG!" for response in responses)
@@ -0,0 +1,59 @@
+import json
+
+from custom_requester.body_encoder import encode_body
+from custom_requester.custom_requester import CustomRequester
+from models.model import MovieCreation, MovieLocation, Roles, TestUser
+
+BASE_URL = "https://stub.api"
+
+
+class TestBodyEncoder:
+
+    def test_model_is_sent_as_encoded_bytes(self, stub_transport):
+        """
+        Тест на отправку pydantic-модели готовыми байтами без повторной
+        сериализации.
+        """
+        transport = stub_transport(script=[201])
+        movie = MovieCreation(name="Фильм", location=MovieLocation.SPB)
+        CustomRequester(transport.session(), BASE_URL).send_request(
+            "POST", "/movies", data=movie, need_logging=False
+        )
+
+        request = transport.requests[0]
+        assert request.body == movie.model_dump_json(exclude_unset=True).encode()
+        assert request.headers["Content-Type"] == "application/json"
+        assert json.loads(request.body) == {"name": "Фильм", "location": "SPB"}
+
+    def test_enum_fields_and_dict_bodies(self, stub_transport):
+        """
+        Тест на сериализацию Enum-полей модели и отправку обычного dict.
+        """
+        transport = stub_transport(script=[201])
+        requester = CustomRequester(transport.session(), BASE_URL)
+        requester.send_request("POST", "/register", data=TestUser(
+            email="kek@gmail.com", fullName="Name",
+            password="Qwerty123", passwordRepeat="Qwerty123",
+            roles=[Roles.USER]
+        ), need_logging=False)
+        requester.send_request(
+            "POST", "/login", data={"email": "kek@gmail.com"},
+            need_logging=False
+        )
+
+        assert json.loads(transport.requests[0].body)["roles"] == ["USER"]
+        assert json.loads(transport.requests[1].body) == {"email": "kek@gmail.com"}
+
+    def test_encoded_bytes_are_sent_as_is(self, stub_transport):
+        """
+        Тест на отправку заранее закодированного тела без изменений.
+        """
+        transport = stub_transport(script=[201])
+        body = encode_body(MovieCreation(name="Фильм", location=MovieLocation.MSK))
+        CustomRequester(transport.session(), BASE_URL).send_request(
+            "POST", "/movies", data=body, need_logging=False
+        )
+
+        request = transport.requests[0]
+        assert request.body is body
+        assert request.headers["Content-Type"] == "application/json"
@@ -0,0 +1,75 @@
+import itertools
+import json
+import time
+
+from api.movies_api import MoviesAPI
+from constants import BASE_URL_MOVIES_API
+from custom_requester.bulk import RateLimiter
+from models.model import MovieCreation, MovieLocation
+
+
+def movies_handler():
+    """
+    Ответы API фильмов: создание фильма с очередным ID,
+    для фильмов с "broken" в названии - 500.
+    """
+    ids = itertools.count(1)
+
+    def reply(request):
+        if request.method != "POST":
+            return 200
+        status = 500 if "broken" in json.loads(request.body)["name"] else 201
+        return status, {"id": next(ids)}
+
+    return reply
+
+
+class TestMoviesBulk:
+
+    def test_add_movies_bulk_aggregates_errors(self, stub_transport):
+        """
+        Тест на пакетное создание фильмов с ошибками отдельных элементов.
+        """
+        transport = stub_transport(handler=movies_handler(), delay=0.01)
+        movies_api = MoviesAPI(transport.session(), BASE_URL_MOVIES_API)
+        movies = (
+            MovieCreation(
+                name=f"broken {i}" if i % 10 == 0 else f"movie {i}",
+                location=MovieLocation.SPB
+            )
+            for i in range(50)
+        )
+        operation = movies_api.add_movies_bulk(movies, concurrency=4)
+        created_ids = [
+            result.result.json()["id"] for result in operation if result.ok
+        ]
+
+        assert len(created_ids) == 45
+        assert operation.report.succeeded == 45
+        assert operation.report.failed == 5
+        assert all(
+            isinstance(error, ValueError)
+            for _, error in operation.report.errors
+        )
+        assert transport.max_in_flight <= 4
+        assert operation.report.throughput > 0
+
+    def test_delete_movies_bulk(self, stub_transport):
+        """
+        Тест на пакетное удаление фильмов.
+        """
+        transport = stub_transport(handler=movies_handler())
+        movies_api = MoviesAPI(transport.session(), BASE_URL_MOVIES_API)
+        report = movies_api.delete_movies_bulk(range(20)).run()
+        assert report.succeeded == 20
+        assert report.failed == 0
+
+    def test_rate_limiter(self):
+        """
+        Тест на ограничение частоты операций.
+        """
+        limiter = RateLimiter(rate=100)
+        started_at = time.monotonic()
+        for _ in range(11):
+            limiter.acquire()
+        assert time.monotonic() - started_at >= 0.09
@@ -0,0 +1,113 @@
+import pytest
+import requests
+from requests import Response
+
+from custom_requester.cassette import Cassette
+from custom_requester.custom_requester import CustomRequester
+
+BASE_URL = "https://cassette.invalid"
+
+
+def record_interaction(cassette, method, endpoint, status, content, json=None):
+    """
+    Запись взаимодействия в кассету без обращения к сети.
+    """
+    request = requests.Request(
+        method, f"{BASE_URL}{endpoint}", json=json
+    ).prepare()
+    response = Response()
+    response.status_code = status
+    response.headers["Content-Type"] = "application/json"
+    response._content = content.encode("utf-8")
+    cassette.record(request, response)
+
+
+class TestCassette:
+
+    def test_replay_without_network(self, tmp_path):
+        """
+        Тест на воспроизведение записанного ответа через CustomRequester.
+        """
+        path = tmp_path / "cassette.jsonl"
+        recorder = Cassette(path, mode="record")
+        record_interaction(
+            recorder, "POST", "/register", 201,
+            '{"email": "kekabc12345@gmail.com"}',
+            json={"email": "kekabc12345@gmail.com", "password": "Qwerty123"}
+        )
+        recorder.close()
+
+        session = Cassette(path, mode="replay").mount(requests.Session())
+        requester = CustomRequester(session=session, base_url=BASE_URL)
+        response = requester.send_request(
+            method="POST",
+            endpoint="/register",
+            data={"email": "kekzzz99999@gmail.com", "password": "Other123"},
+            expected_status=201
+        )
+        assert response.json()["email"] == "kekabc12345@gmail.com"
+
+    def test_replay_sequence_and_query_order(self, tmp_path):
+        """
+        Тест на порядок воспроизведения одинаковых запросов
+        и независимость ключа от порядка query-параметров.
+        """
+        path = tmp_path / "cassette.jsonl"
+        recorder = Cassette(path, mode="record")
+        record_interaction(recorder, "GET", "/movies/1?b=2&a=1", 200, '{"id": 1}')
+        record_interaction(recorder, "GET", "/movies/1?b=2&a=1", 404, '{}')
+        recorder.close()
+
+        session = Cassette(path, mode="replay").mount(requests.Session())
+        requester = CustomRequester(session=session, base_url=BASE_URL)
+        params = {"a": 1, "b": 2}
+        first = requester.send_request(
+            "GET", "/movies/1", params=params, expected_status=200
+        )
+        second = requester.send_request(
+            "GET", "/movies/1", params=params, expected_status=404
+        )
+        assert first.json() == {"id": 1}
+        assert second.status_code == 404
+
+    def test_replay_miss_raises(self, tmp_path):
+        """
+        Тест на отсутствие записанного ответа в кассете.
+        """
+        cassette = Cassette(tmp_path / "empty.jsonl", mode="replay")
+        request = requests.Request("GET", f"{BASE_URL}/movies").prepare()
+        with pytest.raises(KeyError, match="GET"):
+            cassette.replay(request)
+
+    def test_logins_are_matched_by_account(self, tmp_path):
+        """
+        Тест на сопоставление логинов по учетной записи, а не по порядку.
+        """
+        path = tmp_path / "cassette.jsonl"
+        recorder = Cassette(path, mode="record")
+        for email, token in (("admin@mail.com", "A"), ("user@mail.com", "U")):
+            record_interaction(
+                recorder, "POST", "/login", 200, f'{{"accessToken": "{token}"}}',
+                json={"email": email, "password": "Password1"}
+            )
+        recorder.close()
+
+        session = Cassette(path, mode="replay").mount(requests.Session())
+        requester = CustomRequester(session=session, base_url=BASE_URL)
+        for email, token in (("user@mail.com", "U"), ("admin@mail.com", "A")):
+            response = requester.send_request(
+                "POST", "/login",
+                data={"email": email, "password": "Password1"},
+                expected_status=200
+            )
+            assert response.json()["accessToken"] == token
+
+    def test_off_mode_does_not_record(self, tmp_path, stub_transport):
+        """
+        Тест на отсутствие записи в кассету вне режима record.
+        """
+        path = tmp_path / "cassette.jsonl"
+        session = stub_transport().session()
+        Cassette(path, mode="off").mount(session)
+        assert session.get(f"{BASE_URL}/movies").status_code == 200
+        assert not path.exists()
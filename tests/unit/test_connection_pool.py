@@ -0,0 +1,93 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from custom_requester.connection_pool import ConnectionPoolRegistry
+from custom_requester.custom_requester import CustomRequester
+
+
+class EchoAuthHandler(BaseHTTPRequestHandler):
+    """
+    Keep-alive обработчик, возвращающий заголовок Authorization запроса.
+    """
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = json.dumps(
+            {"authorization": self.headers.get("Authorization")}
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def local_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), EchoAuthHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestConnectionPool:
+
+    def test_sessions_reuse_pooled_connections(self, local_server):
+        """
+        Тест на переиспользование keep-alive соединения разными сессиями.
+        """
+        pool = ConnectionPoolRegistry(pool_maxsize=2)
+        for _ in range(3):
+            session = pool.new_session()
+            requester = CustomRequester(session=session, base_url=local_server)
+            for _ in range(2):
+                requester.send_request("GET", "/", expected_status=200)
+            session.close()
+
+        stats = pool.stats()["127.0.0.1"]
+        assert stats["requests"] == 6
+        assert stats["opened"] == 1
+        assert stats["reused"] == 5
+        pool.close()
+
+    def test_auth_headers_are_isolated_per_user(self, local_server):
+        """
+        Тест на изоляцию авторизации пользователей при общей сессии.
+        """
+        pool = ConnectionPoolRegistry()
+        session = pool.new_session()
+        admin = CustomRequester(session=session, base_url=local_server)
+        anonymous = CustomRequester(session=session, base_url=local_server)
+        admin._set_auth_token("admin-token")
+
+        admin_response = admin.send_request("GET", "/", expected_status=200)
+        anonymous_response = anonymous.send_request(
+            "GET", "/", expected_status=200
+        )
+        assert admin_response.json()["authorization"] == "Bearer admin-token"
+        assert anonymous_response.json()["authorization"] is None
+        assert "Authorization" not in session.headers
+        pool.close()
+
+    def test_close_releases_pooled_connections(self, local_server):
+        """
+        Тест на закрытие keep-alive соединений пулом, а не сессией.
+        """
+        pool = ConnectionPoolRegistry()
+        session = pool.new_session()
+        CustomRequester(session=session, base_url=local_server).send_request(
+            "GET", "/", expected_status=200
+        )
+        session.close()
+        assert pool.stats()["127.0.0.1"]["opened"] == 1
+
+        pool.close()
+        assert pool.stats() == {}
@@ -0,0 +1,61 @@
+import string
+
+from models.model import MovieCreation, MovieLocation, TestUser
+from utils.data_generator import DataGenerator
+
+
+class TestBulkDataGenerator:
+
+    def test_generate_users_is_reproducible_from_seed(self):
+        """
+        Тест на воспроизводимость пакета пользователей по seed.
+        """
+        first = DataGenerator.generate_users(100, seed=42)
+        second = DataGenerator.generate_users(100, seed=42)
+        for name in ("fullName", "password"):
+            assert first.columns[name] == second.columns[name]
+        other = DataGenerator.generate_users(100, seed=7)
+        assert first.columns["fullName"] != other.columns["fullName"]
+
+    def test_seeded_batches_do_not_collide(self):
+        """
+        Тест на уникальность email и названий между пакетами с одним seed.
+        """
+        first = DataGenerator.generate_users(100, seed="run")
+        second = DataGenerator.generate_users(100, seed="run")
+        assert not set(first.columns["email"]) & set(second.columns["email"])
+
+        movies = DataGenerator.generate_movies(100, seed=1)
+        again = DataGenerator.generate_movies(100, seed=1)
+        assert not set(movies.columns["name"]) & set(again.columns["name"])
+
+    def test_generated_users_are_valid(self):
+        """
+        Тест на корректность и уникальность сгенерированных пользователей.
+        """
+        users = DataGenerator.generate_users(1000, seed=1)
+        assert len(users) == 1000
+        assert len(set(users.columns["email"])) == 1000
+        for password in users.columns["password"]:
+            assert 8 <= len(password) <= 20
+            assert any(char in string.ascii_letters for char in password)
+            assert any(char in string.digits for char in password)
+
+        user = users[0]
+        assert isinstance(user, TestUser)
+        assert user.password == user.passwordRepeat
+        assert user.verified is True
+        assert len(users[10:20]) == 10
+
+    def test_generate_movies(self):
+        """
+        Тест на пакетную генерацию фильмов.
+        """
+        movies = DataGenerator.generate_movies(500, seed=3)
+        assert len(set(movies.columns["name"])) == 500
+        assert all(100 <= price <= 1000 for price in movies.columns["price"])
+
+        movie = next(iter(movies))
+        assert isinstance(movie, MovieCreation)
+        assert movie.location in list(MovieLocation)
+        assert next(movies.rows())["name"] == movie.name
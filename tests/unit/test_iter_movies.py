@@ -0,0 +1,133 @@
+import itertools
+import time
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from api.movies_api import MoviesAPI
+from constants import BASE_URL_MOVIES_API
+
+
+def query(request):
+    return {
+        key: values[0]
+        for key, values in parse_qs(urlsplit(request.url).query).items()
+    }
+
+
+def catalog_handler(total, page_size=10):
+    """
+    Ответы постраничного каталога из total фильмов.
+    """
+
+    def reply(request):
+        params = query(request)
+        start = (int(params["page"]) - 1) * page_size
+        movies = [
+            {
+                "id": movie_id, "name": f"movie {movie_id}", "price": 100,
+                "description": "description", "imageUrl": None,
+                "location": params.get("locations", "MSK"), "published": True,
+                "genreId": 1, "genre": {"name": "Drama"}, "rating": 4.5
+            }
+            for movie_id in range(start, min(start + page_size, total))
+        ]
+        return 200, {
+            "movies": movies, "count": total, "page": int(params["page"]),
+            "pageSize": page_size, "pageCount": -(-total // page_size)
+        }
+
+    return reply
+
+
+def requested_pages(transport):
+    return [int(query(request)["page"]) for request in transport.requests]
+
+
+def wait_for(condition, timeout=1.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.005)
+    return condition()
+
+
+class TestIterMovies:
+
+    def test_iterates_whole_catalog_with_prefetch(self, stub_transport):
+        """
+        Тест на обход всего каталога с конкурентной загрузкой страниц.
+        """
+        transport = stub_transport(
+            handler=catalog_handler(95), delay=0.02
+        )
+        movies_api = MoviesAPI(transport.session(), BASE_URL_MOVIES_API)
+        movies = list(movies_api.iter_movies(
+            filters={"locations": "SPB", "minPrice": None}, prefetch=3
+        ))
+
+        assert [movie.id for movie in movies] == list(range(95))
+        assert sorted(requested_pages(transport)) == list(range(1, 11))
+        assert 1 < transport.max_in_flight <= 3
+        assert all(query(request)["locations"] == "SPB"
+                   for request in transport.requests)
+        assert all("minPrice" not in query(request)
+                   for request in transport.requests)
+
+    def test_early_stop_keeps_requests_bounded(self, stub_transport):
+        """
+        Тест на ограничение загрузки окном prefetch при прерывании обхода.
+        """
+        transport = stub_transport(
+            handler=catalog_handler(1000), delay=0.02
+        )
+        movies_api = MoviesAPI(transport.session(), BASE_URL_MOVIES_API)
+        first_movies = list(itertools.islice(
+            movies_api.iter_movies(prefetch=2), 15
+        ))
+        assert len(first_movies) == 15
+        assert len(requested_pages(transport)) <= 1 + 2 + 1
+
+    def test_next_pages_are_requested_while_page_is_consumed(self, stub_transport):
+        """
+        Тест на загрузку следующих prefetch страниц, пока вызывающий код
+        обрабатывает текущую (включая первую).
+        """
+        transport = stub_transport(
+            handler=catalog_handler(100), delay=0.05
+        )
+        movies_api = MoviesAPI(transport.session(), BASE_URL_MOVIES_API)
+        movies = movies_api.iter_movies(prefetch=3)
+
+        next(movies)  # обход стоит на первой странице
+        assert wait_for(lambda: len(requested_pages(transport)) == 4)
+        assert sorted(requested_pages(transport)) == [1, 2, 3, 4]
+
+        for _ in range(10):  # первый фильм второй страницы
+            next(movies)
+        assert wait_for(lambda: len(requested_pages(transport)) == 5)
+        assert max(requested_pages(transport)) == 2 + 3
+        movies.close()
+
+    def test_zero_prefetch_pages_sequentially(self, stub_transport):
+        """
+        Тест на последовательный обход без потоков при prefetch=0.
+        """
+        transport = stub_transport(handler=catalog_handler(25))
+        movies_api = MoviesAPI(transport.session(), BASE_URL_MOVIES_API)
+        movies = movies_api.iter_movies(prefetch=0)
+
+        first_page = list(itertools.islice(movies, 10))
+        assert requested_pages(transport) == [1]
+        rest = list(movies)
+        assert [movie.id for movie in first_page + rest] == list(range(25))
+        assert requested_pages(transport) == [1, 2, 3]
+        assert transport.max_in_flight == 1
+
+    def test_negative_prefetch_is_rejected(self, stub_transport):
+        """
+        Тест на ошибку при отрицательном prefetch.
+        """
+        transport = stub_transport(handler=catalog_handler(10))
+        movies_api = MoviesAPI(transport.session(), BASE_URL_MOVIES_API)
+        with pytest.raises(ValueError, match="prefetch"):
+            next(movies_api.iter_movies(prefetch=-1))
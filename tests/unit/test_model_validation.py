@@ -0,0 +1,61 @@
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from benchmarks.bench_movie_validation import make_page
+from models.model import (Movie, RegisterUserResponse, get_type_adapter,
+                          validate_json, validate_movies_page)
+
+
+class TestModelValidation:
+
+    def test_validate_movies_page_from_bytes(self):
+        """
+        Тест на валидацию страницы афиши из сырых байтов ответа.
+        """
+        page = validate_movies_page(make_page(20))
+        assert page.count == 20
+        assert all(isinstance(movie, Movie) for movie in page.movies)
+
+    def test_invalid_movie_is_reported(self):
+        """
+        Тест на ошибку валидации фильма с некорректной ценой.
+        """
+        page = json.loads(make_page(3))
+        page["movies"][2]["price"] = 0
+        with pytest.raises(ValidationError, match="price"):
+            validate_movies_page(json.dumps(page).encode())
+
+    def test_sampling_validates_every_nth_movie(self):
+        """
+        Тест на выборочную валидацию каждого N-го фильма.
+        """
+        page = validate_movies_page(make_page(100), sample_every=10)
+        assert len(page.movies) == page.count == 100
+        checked = [
+            index for index, movie in enumerate(page.movies)
+            if isinstance(movie, Movie)
+        ]
+        assert checked == list(range(0, 100, 10))
+        assert page.movies[1]["id"] == 1
+
+    def test_sampling_reports_invalid_page_fields(self):
+        """
+        Тест на проверку полей страницы при выборочной валидации.
+        """
+        page = json.loads(make_page(3))
+        page["page"] = 0
+        with pytest.raises(ValidationError, match="page"):
+            validate_movies_page(json.dumps(page).encode(), sample_every=2)
+
+    def test_adapters_are_cached(self):
+        """
+        Тест на переиспользование TypeAdapter и валидацию других ответов.
+        """
+        assert get_type_adapter(list[Movie]) is get_type_adapter(list[Movie])
+        user = validate_json(json.dumps({
+            "id": "id", "email": "kek@gmail.com", "fullName": "Name",
+            "roles": ["USER"], "createdAt": "2024-03-02T05:37:47.298Z"
+        }), RegisterUserResponse)
+        assert user.email == "kek@gmail.com"
@@ -0,0 +1,126 @@
+import logging
+
+import requests
+from requests import Response
+
+from custom_requester.request_logger import (RequestLogPipeline,
+                                             RequestLogRecord,
+                                             RequestLogSampler)
+
+LOGGER_NAME = "tests.request_logger"
+
+
+class CollectingHandler(logging.Handler):
+    """
+    Обработчик, сохраняющий записи без форматирования.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+def make_response(status_code, endpoint="/movies"):
+    response = Response()
+    response.status_code = status_code
+    response._content = b'{"message": "error"}'
+    response.request = requests.Request(
+        "GET", f"https://cinescope.invalid{endpoint}"
+    ).prepare()
+    return response
+
+
+class TestRequestLogPipeline:
+
+    def test_sampling_keeps_every_failure(self, caplog):
+        """
+        Тест на семплирование: успешные запросы логируются 1 из N,
+        неуспешные - всегда.
+        """
+        pipeline = RequestLogPipeline(
+            logging.getLogger(LOGGER_NAME), RequestLogSampler(default_rate=5)
+        )
+        with caplog.at_level(logging.INFO, logger=LOGGER_NAME):
+            for _ in range(10):
+                pipeline.submit(make_response(200), "GET", "/movies")
+            for _ in range(3):
+                pipeline.submit(make_response(500), "GET", "/movies", True)
+        assert len(caplog.records) == 2 + 3
+
+    def test_sampling_ignores_ids_in_endpoint(self):
+        """
+        Тест на общий ключ семплирования для эндпоинтов с разными ID.
+        """
+        sampler = RequestLogSampler(default_rate=3)
+        results = [
+            sampler.should_log("GET", f"/movies/{movie_id}", False)
+            for movie_id in range(6)
+        ]
+        assert results.count(True) == 2
+
+    def test_record_is_rendered_only_when_emitted(self, monkeypatch):
+        """
+        Тест на ленивое формирование записи: submit передает логгеру
+        объект записи, curl-строка строится только при выводе.
+        """
+        logger = logging.getLogger(LOGGER_NAME)
+        collector = CollectingHandler()
+        logger.addHandler(collector)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+        rendered = []
+        original_render = RequestLogRecord.render
+
+        def tracking_render(self):
+            rendered.append(self)
+            return original_render(self)
+
+        monkeypatch.setattr(RequestLogRecord, "render", tracking_render)
+        pipeline = RequestLogPipeline(logger, RequestLogSampler())
+        try:
+            pipeline.submit(make_response(500), "GET", "/movies", True)
+            assert rendered == []
+            (record,) = collector.records
+            assert isinstance(record.msg, RequestLogRecord)
+
+            message = record.getMessage()
+            assert rendered == [record.msg]
+            assert '"message": "error"' in message
+            assert '{\n    "message"' in message
+        finally:
+            logger.removeHandler(collector)
+            logger.setLevel(logging.NOTSET)
+            logger.propagate = True
+
+    def test_endpoint_rates_apply_to_all_ids(self):
+        """
+        Тест на частоту семплирования, заданную для эндпоинта с ID.
+        """
+        sampler = RequestLogSampler(rates={"/movies/{id}": 3})
+        results = [
+            sampler.should_log("GET", f"/movies/{movie_id}", False)
+            for movie_id in range(6)
+        ]
+        assert results.count(True) == 2
+        assert sampler.should_log("GET", "/genres", False)
+
+    def test_background_writer(self, caplog):
+        """
+        Тест на вывод записей через фоновый поток.
+        """
+        pipeline = RequestLogPipeline(
+            logging.getLogger(LOGGER_NAME), RequestLogSampler()
+        )
+        with caplog.at_level(logging.INFO, logger=LOGGER_NAME):
+            pipeline.start_background()
+            pipeline.submit(
+                make_response(404, "/movies/1"), "GET", "/movies/1", True
+            )
+            pipeline.stop_background()
+        assert len(caplog.records) == 1
+        message = caplog.records[0].getMessage()
+        assert "curl -X GET 'https://cinescope.invalid/movies/1'" in message
+        assert "STATUS_CODE" in message
@@ -0,0 +1,83 @@
+from api.movies_api import MoviesAPI
+from constants import BASE_URL_MOVIES_API
+from custom_requester.response_cache import ResponseCache
+
+
+def movies_reply(request):
+    status = 201 if request.method == "POST" else 200
+    return status, {"id": 1, "movies": []}
+
+
+class TestResponseCache:
+
+    def test_repeated_get_is_served_from_cache(self, stub_transport):
+        """
+        Тест на повторный GET с теми же параметрами без запроса в сеть.
+        """
+        cache = ResponseCache()
+        transport = stub_transport(handler=movies_reply)
+        movies_api = MoviesAPI(
+            transport.session(), BASE_URL_MOVIES_API, cache=cache
+        )
+        for _ in range(3):
+            movies_api.get_movie_posters_info(params={"page": 1})
+        movies_api.get_movie_posters_info(params={"page": 2})
+
+        assert len(transport.requests) == 2
+        assert cache.stats()["hits"] == 2
+        assert cache.stats()["misses"] == 2
+
+    def test_write_invalidates_movies_pages(self, stub_transport):
+        """
+        Тест на инвалидацию кэша после создания и изменения фильма.
+        """
+        cache = ResponseCache()
+        transport = stub_transport(handler=movies_reply)
+        movies_api = MoviesAPI(
+            transport.session(), BASE_URL_MOVIES_API, cache=cache
+        )
+        movies_api.get_movie_posters_info()
+        movies_api.get_movies_info(1, expected_status=200)
+
+        movies_api.add_movie({"name": "movie"})
+        movies_api.get_movie_posters_info()
+        movies_api.get_movies_info(1, expected_status=200)
+        movies_api.partial_update_movies_info(1, {"price": 100})
+        movies_api.get_movies_info(1, expected_status=200)
+
+        methods = [request.method for request in transport.requests]
+        assert methods.count("GET") == 4
+        assert cache.stats()["invalidations"] == 3
+
+    def test_auth_identity_is_part_of_key(self, stub_transport):
+        """
+        Тест на раздельные записи кэша для разных пользователей.
+        """
+        cache = ResponseCache()
+        transport = stub_transport(handler=movies_reply)
+        movies_api = MoviesAPI(
+            transport.session(), BASE_URL_MOVIES_API, cache=cache
+        )
+        movies_api.get_movie_posters_info()
+        movies_api._set_auth_token("token")
+        movies_api.get_movie_posters_info()
+        assert len(transport.requests) == 2
+
+    def test_lru_and_ttl_eviction(self, monkeypatch):
+        """
+        Тест на вытеснение по размеру и по времени жизни.
+        """
+        now = [0.0]
+        monkeypatch.setattr(
+            "custom_requester.response_cache.time.monotonic", lambda: now[0]
+        )
+        cache = ResponseCache(maxsize=2, ttl=10)
+        keys = [cache.make_key("GET", f"https://host/{i}") for i in range(3)]
+        for key in keys:
+            cache.set(key, object())
+        assert cache.get(keys[0]) is None
+        assert cache.get(keys[2]) is not None
+
+        now[0] = 11
+        assert cache.get(keys[2]) is None
+        assert cache.stats()["evictions"] == 2
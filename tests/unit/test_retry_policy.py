@@ -0,0 +1,78 @@
+import pytest
+import requests
+
+from custom_requester.custom_requester import CustomRequester
+from custom_requester.retry_policy import RetryPolicy
+
+BASE_URL = "https://retry.invalid"
+
+
+def make_requester(transport, **policy_kwargs):
+    delays = []
+    policy = RetryPolicy(sleep=delays.append, **policy_kwargs)
+    requester = CustomRequester(
+        session=transport.session(), base_url=BASE_URL, retry_policy=policy
+    )
+    return requester, policy, delays
+
+
+class TestRetryPolicy:
+
+    def test_get_is_retried_until_success(self, stub_transport):
+        """
+        Тест на повтор GET после 503 и разрыва соединения.
+        """
+        transport = stub_transport(
+            script=[503, requests.ConnectionError("reset"), 200]
+        )
+        requester, policy, delays = make_requester(transport)
+        response = requester.send_request("GET", "/movies", expected_status=200)
+        assert response.status_code == 200
+        assert len(transport.requests) == 3
+        assert len(delays) == 2
+        assert policy.stats()["retries"] == 2
+
+    def test_post_without_idempotency_key_is_not_retried(self, stub_transport):
+        """
+        Тест на отсутствие повтора неидемпотентного POST.
+        """
+        transport = stub_transport(script=[503, 201])
+        requester, _, _ = make_requester(transport)
+        with pytest.raises(ValueError, match="503"):
+            requester.send_request("POST", "/movies", data={}, expected_status=201)
+        assert len(transport.requests) == 1
+
+    def test_post_with_idempotency_key_is_retried(self, stub_transport):
+        """
+        Тест на повтор POST с заголовком Idempotency-Key.
+        """
+        transport = stub_transport(script=[503, 201])
+        requester, _, _ = make_requester(transport)
+        requester.send_request(
+            "POST", "/movies", data={}, expected_status=201,
+            headers={"Idempotency-Key": "movie-1"}
+        )
+        assert len(transport.requests) == 2
+
+    def test_retry_after_and_budget(self, stub_transport):
+        """
+        Тест на учет Retry-After и общего бюджета повторов.
+        """
+        transport = stub_transport(script=[(429, None, {"Retry-After": "2"})])
+        requester, policy, delays = make_requester(
+            transport, total_budget=2, max_retries=5
+        )
+        with pytest.raises(ValueError, match="429"):
+            requester.send_request("GET", "/movies", expected_status=200)
+        assert delays == [2.0, 2.0]
+        assert len(transport.requests) == 3
+        assert policy.stats()["budget_exhausted"] == 1
+
+    def test_expected_error_status_is_not_retried(self, stub_transport):
+        """
+        Тест на отсутствие повтора, если статус-код ожидаем тестом.
+        """
+        transport = stub_transport(script=[503])
+        requester, _, _ = make_requester(transport)
+        requester.send_request("GET", "/movies", expected_status=503)
+        assert len(transport.requests) == 1
@@ -0,0 +1,158 @@
+import base64
+import json
+import os
+import threading
+import time
+
+from custom_requester.token_cache import TokenCache, jwt_expires_at
+
+CREDS = ("test-admin@mail.com", "KcLMmxkJMjBD1")
+
+
+def make_jwt(expires_in):
+    payload = base64.urlsafe_b64encode(
+        json.dumps({"exp": int(time.time() + expires_in)}).encode()
+    ).decode().rstrip("=")
+    return f"header.{payload}.signature"
+
+
+class LoginCounter:
+    def __init__(self, expires_in=3600):
+        self.expires_in = expires_in
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return {"accessToken": make_jwt(self.expires_in)}
+
+
+class TestTokenCache:
+
+    def test_jwt_expiration_is_parsed(self):
+        """
+        Тест на разбор поля exp из JWT.
+        """
+        assert jwt_expires_at(make_jwt(100)) > time.time()
+        assert jwt_expires_at("not-a-jwt") is None
+
+    def test_memory_hit(self):
+        """
+        Тест на повторное получение токена из памяти.
+        """
+        cache = TokenCache()
+        login = LoginCounter()
+        first = cache.get_or_login(CREDS, login)
+        second = cache.get_or_login(CREDS, login)
+        assert first == second
+        assert login.calls == 1
+        assert cache.stats()["hit_rate"] == 0.5
+
+    def test_disk_store_is_shared_between_workers(self, tmp_path):
+        """
+        Тест на общий файл токенов для разных процессов (воркеров xdist).
+        """
+        path = str(tmp_path / "tokens.json")
+        login = LoginCounter()
+        worker_1 = TokenCache(path=path)
+        worker_2 = TokenCache(path=path)
+        worker_1.get_or_login(CREDS, login)
+        worker_2.get_or_login(CREDS, login)
+        assert login.calls == 1
+        assert worker_2.stats()["disk_hits"] == 1
+
+    def test_token_is_refreshed_before_expiry(self):
+        """
+        Тест на проактивное обновление токена перед истечением exp.
+        """
+        cache = TokenCache(refresh_margin=60)
+        login = LoginCounter(expires_in=30)
+        cache.get_or_login(CREDS, login)
+        cache.get_or_login(CREDS, login)
+        assert login.calls == 2
+
+    def test_logins_for_different_users_run_in_parallel(self, tmp_path):
+        """
+        Тест на параллельный логин разных пользователей: блокировка
+        берется по ключу кэша, а не на весь кэш или файл.
+        """
+        cache = TokenCache(path=str(tmp_path / "tokens.json"))
+        in_login = threading.Barrier(2, timeout=5)
+
+        def login():
+            # Оба логина должны оказаться внутри login() одновременно
+            in_login.wait()
+            return {"accessToken": make_jwt(3600)}
+
+        threads = [
+            threading.Thread(
+                target=cache.get_or_login, args=((f"user{i}", "pwd"), login)
+            )
+            for i in range(2)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert not in_login.broken
+        assert cache.stats()["misses"] == 2
+
+    def test_same_user_logs_in_once(self):
+        """
+        Тест на один логин при одновременных запросах одного пользователя.
+        """
+        cache = TokenCache()
+        login = LoginCounter()
+
+        def slow_login():
+            time.sleep(0.05)
+            return login()
+
+        threads = [
+            threading.Thread(target=cache.get_or_login, args=(CREDS, slow_login))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert login.calls == 1
+
+    def test_workers_starting_together_log_in_once(self, tmp_path):
+        """
+        Тест на один логин роли при одновременном старте воркеров:
+        у каждого воркера свой экземпляр кэша с общим файлом.
+        """
+        path = str(tmp_path / "tokens.json")
+        workers = [TokenCache(path=path) for _ in range(4)]
+        login = LoginCounter()
+        start = threading.Barrier(len(workers), timeout=5)
+
+        def slow_login():
+            time.sleep(0.05)
+            return login()
+
+        def run(cache):
+            start.wait()
+            cache.get_or_login(CREDS, slow_login)
+
+        threads = [
+            threading.Thread(target=run, args=(cache,)) for cache in workers
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert login.calls == 1
+        assert sum(cache.stats()["disk_hits"] for cache in workers) == 3
+
+    def test_ephemeral_token_is_not_persisted(self, tmp_path):
+        """
+        Тест на хранение токена временного пользователя только в памяти.
+        """
+        path = str(tmp_path / "tokens.json")
+        cache = TokenCache(path=path)
+        login = LoginCounter()
+        cache.get_or_login(CREDS, login, persist=False)
+        cache.get_or_login(CREDS, login, persist=False)
+        assert login.calls == 1
+        assert not os.path.exists(path)
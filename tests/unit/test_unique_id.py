@@ -0,0 +1,65 @@
+import threading
+
+import pytest
+
+from utils.data_generator import DataGenerator
+from utils.unique_id import SnowflakeGenerator
+
+
+class TestUniqueId:
+
+    def test_ids_are_unique_across_threads(self):
+        """
+        Тест на отсутствие коллизий ID при генерации из нескольких потоков.
+        """
+        generator = SnowflakeGenerator(worker_id=1)
+        results = [[] for _ in range(8)]
+
+        def generate(result):
+            for _ in range(20000):
+                result.append(generator.next_id())
+
+        threads = [
+            threading.Thread(target=generate, args=(result,))
+            for result in results
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        ids = [unique_id for result in results for unique_id in result]
+        assert len(set(ids)) == len(ids)
+        assert all(result == sorted(result) for result in results)
+
+    def test_workers_do_not_collide_in_same_millisecond(self):
+        """
+        Тест на различие ID разных воркеров при одинаковом времени.
+        """
+        first = SnowflakeGenerator(worker_id=0, clock=lambda: 1800000000)
+        second = SnowflakeGenerator(worker_id=1, clock=lambda: 1800000000)
+        assert not set(first.next_ids(10000)) & set(second.next_ids(10000))
+
+    def test_parse(self):
+        """
+        Тест на разбор ID на время, воркер и счетчик.
+        """
+        generator = SnowflakeGenerator(worker_id=5, clock=lambda: 1800000000)
+        generator.next_ids(4097)
+        assert generator.parse(generator.next_id()) == (1800000000001, 5, 1)
+
+    def test_invalid_worker_id(self):
+        """
+        Тест на проверку диапазона номера воркера.
+        """
+        with pytest.raises(ValueError):
+            SnowflakeGenerator(worker_id=1024)
+
+    def test_data_generator_uses_unique_ids(self):
+        """
+        Тест на уникальность email и названий фильмов из DataGenerator.
+        """
+        emails = {DataGenerator.generate_random_email() for _ in range(1000)}
+        films = {DataGenerator.generate_random_film_name() for _ in range(1000)}
+        assert len(emails) == 1000
+        assert len(films) == 1000
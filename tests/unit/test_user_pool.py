@@ -0,0 +1,134 @@
+import itertools
+
+from entities.user import User
+from entities.user_pool import UserPool, pool_size_per_worker
+from enums.roles import Roles
+
+ROLE = Roles.USER.value
+
+
+class FakeUserBackend:
+    """
+    Заглушка создания и удаления пользователей без обращения к API.
+    """
+
+    def __init__(self):
+        self.ids = itertools.count()
+        self.created = []
+        self.deleted = []
+
+    def create_user(self, role):
+        user_id = next(self.ids)
+        user = User(f"kek{user_id}@gmail.com", "Password1", [role], None,
+                    user_id=str(user_id))
+        self.created.append(user)
+        return user
+
+    def delete_user(self, user):
+        self.deleted.append(user)
+
+
+class TestUserPool:
+
+    def test_exclusive_lease_returns_user_to_pool(self):
+        """
+        Тест на эксклюзивную аренду и возврат пользователя в пул.
+        """
+        backend = FakeUserBackend()
+        pool = UserPool(backend.create_user, backend.delete_user)
+        pool.provision({ROLE: 2})
+
+        with pool.lease(ROLE) as first, pool.lease(ROLE) as second:
+            assert first is not second
+            assert pool.stats()[ROLE]["free"] == 0
+        assert pool.stats()[ROLE]["free"] == 2
+
+        with pool.lease(ROLE) as user:
+            assert user in backend.created
+        assert len(backend.created) == 2
+
+    def test_pool_grows_when_exhausted(self):
+        """
+        Тест на создание пользователя, когда свободных в пуле нет.
+        """
+        backend = FakeUserBackend()
+        pool = UserPool(backend.create_user, backend.delete_user)
+        pool.provision({ROLE: 1})
+        with pool.lease(ROLE), pool.lease(ROLE):
+            pass
+        assert pool.stats()[ROLE] == {"total": 2, "free": 2}
+
+    def test_shared_lease_and_reset(self):
+        """
+        Тест на совместную аренду и сброс состояния при возврате.
+        """
+        backend = FakeUserBackend()
+        reset = []
+        pool = UserPool(
+            backend.create_user, backend.delete_user, reset_user=reset.append
+        )
+        pool.provision({ROLE: 1})
+        with pool.lease(ROLE, exclusive=False) as first, \
+                pool.lease(ROLE, exclusive=False) as second:
+            assert first is second
+        with pool.lease(ROLE) as user:
+            pass
+        assert reset == [user]
+
+    def test_shared_lease_of_empty_role_keeps_exclusive_capacity(self):
+        """
+        Тест на совместную аренду роли без пользователей: созданный
+        пользователь используется совместно и не уменьшает число
+        свободных пользователей для эксклюзивной аренды.
+        """
+        backend = FakeUserBackend()
+        pool = UserPool(backend.create_user, backend.delete_user)
+        admin = Roles.ADMIN.value
+        with pool.lease(admin, exclusive=False) as first:
+            pass
+        with pool.lease(admin, exclusive=False) as second:
+            assert second is first
+        assert pool.stats()[admin] == {"total": 1, "free": 0}
+
+        with pool.lease(admin) as exclusive:
+            assert exclusive is not first
+        assert pool.stats()[admin] == {"total": 2, "free": 1}
+
+    def test_exclusive_and_shared_leases_never_overlap(self):
+        """
+        Тест на то, что пересекающиеся эксклюзивная и совместная аренды
+        не отдают одного и того же пользователя.
+        """
+        backend = FakeUserBackend()
+        pool = UserPool(backend.create_user, backend.delete_user)
+        pool.provision({ROLE: 3})
+
+        with pool.lease(ROLE) as exclusive:
+            for _ in range(6):
+                with pool.lease(ROLE, exclusive=False) as shared:
+                    assert shared is not exclusive
+
+        with pool.lease(ROLE, exclusive=False) as shared:
+            with pool.lease(ROLE) as first, pool.lease(ROLE) as second:
+                assert shared not in (first, second)
+            with pool.lease(ROLE, exclusive=False) as other:
+                assert other is not None
+        assert len(backend.created) == 3
+
+    def test_close_deletes_all_users(self):
+        """
+        Тест на массовое удаление пользователей пула в конце прогона.
+        """
+        backend = FakeUserBackend()
+        pool = UserPool(backend.create_user, backend.delete_user)
+        pool.provision({ROLE: 3, Roles.ADMIN.value: 1})
+        pool.close()
+        assert sorted(user.id for user in backend.deleted) == ["0", "1", "2", "3"]
+
+    def test_pool_size_per_worker(self, monkeypatch):
+        """
+        Тест на деление размера пула между воркерами xdist.
+        """
+        monkeypatch.setenv("PYTEST_XDIST_WORKER_COUNT", "4")
+        assert pool_size_per_worker(10) == 3
+        assert pool_size_per_worker(2) == 1
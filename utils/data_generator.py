@@ -1,10 +1,90 @@
 import random
 import string
-import time
+from functools import lru_cache
 
-from faker import Faker
+from models.model import MovieCreation, MovieLocation, Roles, TestUser
+from utils.unique_id import unique_id_generator, unique_id_str
 
-faker = Faker()
+VOCABULARY_SIZE = 512
+VOCABULARY_SEED = 0
+PASSWORD_CHARS = string.ascii_letters + string.digits + "?@#$%^&*|:"
+
+
+@lru_cache(maxsize=None)
+def get_faker():
+    """
+    Экземпляр Faker, создается при первом обращении: импорт faker
+    и загрузка провайдеров заметно замедляют старт pytest.
+    """
+    from faker import Faker
+
+    return Faker()
+
+
+@lru_cache(maxsize=None)
+def get_vocabularies():
+    """
+    Словари имен, городов, стран, профессий, цветов и существительных
+    для пакетной генерации. Строятся один раз отдельным экземпляром Faker
+    с фиксированным seed, поэтому одинаковы между запусками.
+    """
+    from faker import Faker
+
+    vocabulary_faker = Faker()
+    vocabulary_faker.seed_instance(VOCABULARY_SEED)
+    generators = {
+        "first_names": vocabulary_faker.first_name,
+        "last_names": vocabulary_faker.last_name,
+        "cities": vocabulary_faker.city,
+        "countries": vocabulary_faker.country,
+        "jobs": lambda: vocabulary_faker.job().split()[0],
+        "colors": vocabulary_faker.color_name,
+        "nouns": lambda: vocabulary_faker.word(part_of_speech='noun'),
+    }
+    return {
+        name: tuple(generate() for _ in range(VOCABULARY_SIZE))
+        for name, generate in generators.items()
+    }
+
+
+class GeneratedBatch:
+    """
+    Пакет сгенерированных данных в колоночном виде.
+    Колонки доступны через columns, объекты модели создаются лениво
+    при обращении по индексу или итерации.
+    """
+
+    def __init__(self, model, columns, constants=None):
+        """
+        :param model: Класс pydantic-модели элемента (TestUser, MovieCreation).
+        :param columns: Словарь {поле: список значений}.
+        :param constants: Поля с одинаковым значением для всех элементов.
+        """
+        self.model = model
+        self.columns = columns
+        self.constants = constants or {}
+        self._size = len(next(iter(columns.values()))) if columns else 0
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._size))]
+        fields = {name: values[index] for name, values in self.columns.items()}
+        return self.model(**fields, **self.constants)
+
+    def __iter__(self):
+        for index in range(self._size):
+            yield self[index]
+
+    def rows(self):
+        """
+        Элементы пакета в виде словарей, без создания моделей.
+        """
+        names = list(self.columns)
+        for values in zip(*self.columns.values()):
+            yield {**dict(zip(names, values)), **self.constants}
 
 
 class DataGenerator:
@@ -29,21 +109,27 @@ class DataGenerator:
         )
         return int(random_string)
 
+    @staticmethod
+    def generate_unique_id():
+        """
+        Генерация уникального ID (hex-строка) без коллизий между
+        потоками и воркерами xdist.
+        """
+        return unique_id_str()
+
     @staticmethod
     def generate_random_email():
         """
-        Генерация случайного email.
+        Генерация уникального email.
         """
-        random_string = ''.join(
-            random.choices(string.ascii_lowercase + string.digits, k=8)
-        )
-        return f'kek{random_string}@gmail.com'
+        return f'kek{unique_id_str()}@gmail.com'
 
     @staticmethod
     def generate_random_name():
         """
         Генерация случайного имени и фамилии.
         """
+        faker = get_faker()
         return f'{faker.first_name()} {faker.last_name()}'
 
     @staticmethod
@@ -51,6 +137,7 @@ class DataGenerator:
         """
         Генерация случайного названия фильма.
         """
+        faker = get_faker()
         themes = [
             f"Return to {faker.city()}",
             f"The last {faker.job().split()[0]}",
@@ -58,15 +145,14 @@ class DataGenerator:
             f"Back to {faker.country()}",
             f"{faker.color_name()} {faker.word(part_of_speech='noun')}"
         ]
-        timestamp = int(time.time() * 1000)
-        return f'{random.choice(themes)} {timestamp}'
+        return f'{random.choice(themes)} {unique_id_str()}'
 
     @staticmethod
     def generate_random_price():
         """
         Генерация случайной цены фильма.
         """
-        return faker.random_int(min=100, max=1000)
+        return get_faker().random_int(min=100, max=1000)
 
     @staticmethod
     def generate_random_password():
@@ -92,3 +178,79 @@ class DataGenerator:
         random.shuffle(password)
 
         return ''.join(password)
+
+    @staticmethod
+    def generate_users(n, seed=None, roles=(Roles.USER,)):
+        """
+        Пакетная генерация пользователей.
+        Значения каждой колонки выбираются одной выборкой из заранее
+        построенных словарей, без вызовов Faker на каждого пользователя.
+        :param n: Число пользователей.
+        :param seed: Seed для воспроизводимой генерации неуникальных полей
+            (None - случайно). Уникальные поля всегда берутся из
+            unique_id_generator, чтобы не пересекаться с другими прогонами.
+        :param roles: Роли всех пользователей пакета.
+        :return: GeneratedBatch с объектами TestUser.
+        """
+        rng = random.Random(seed)
+        vocabularies = get_vocabularies()
+        first_names = rng.choices(vocabularies["first_names"], k=n)
+        last_names = rng.choices(vocabularies["last_names"], k=n)
+        emails = unique_id_generator.next_ids(n)
+
+        # Пароль: буква + случайные символы + цифра, длина от 8 до 20
+        letters = rng.choices(string.ascii_letters, k=n)
+        digits = rng.choices(string.digits, k=n)
+        lengths = rng.choices(range(6, 19), k=n)
+        chars = ''.join(rng.choices(PASSWORD_CHARS, k=sum(lengths)))
+        passwords = []
+        offset = 0
+        for letter, digit, length in zip(letters, digits, lengths):
+            passwords.append(f"{letter}{chars[offset:offset + length]}{digit}")
+            offset += length
+
+        return GeneratedBatch(TestUser, {
+            "email": [f"kek{email:x}@gmail.com" for email in emails],
+            "fullName": [
+                f"{first} {last}" for first, last in zip(first_names, last_names)
+            ],
+            "password": passwords,
+            "passwordRepeat": passwords,
+        }, constants={"roles": list(roles), "verified": True, "banned": False})
+
+    @staticmethod
+    def generate_movies(n, seed=None):
+        """
+        Пакетная генерация фильмов.
+        :param n: Число фильмов.
+        :param seed: Seed для воспроизводимой генерации неуникальных полей
+            (None - случайно). Уникальные поля всегда берутся из
+            unique_id_generator, чтобы не пересекаться с другими прогонами.
+        :return: GeneratedBatch с объектами MovieCreation.
+        """
+        rng = random.Random(seed)
+        vocabularies = get_vocabularies()
+        themes = [
+            lambda: f"Return to {rng.choice(vocabularies['cities'])}",
+            lambda: f"The last {rng.choice(vocabularies['jobs'])}",
+            lambda: (
+                f"{rng.choice(vocabularies['first_names'])} and "
+                f"{rng.choice(vocabularies['first_names'])}"
+            ),
+            lambda: f"Back to {rng.choice(vocabularies['countries'])}",
+            lambda: (
+                f"{rng.choice(vocabularies['colors'])} "
+                f"{rng.choice(vocabularies['nouns'])}"
+            ),
+        ]
+        names = [
+            f"{theme()} {suffix:x}"
+            for theme, suffix in zip(
+                rng.choices(themes, k=n), unique_id_generator.next_ids(n)
+            )
+        ]
+        return GeneratedBatch(MovieCreation, {
+            "name": names,
+            "price": rng.choices(range(100, 1001), k=n),
+            "location": rng.choices(list(MovieLocation), k=n),
+        })